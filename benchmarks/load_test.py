@@ -0,0 +1,257 @@
+"""
+Load test the MCP server against the local mock LLM server.
+
+Starts benchmarks/mock_llm_server.py in a subprocess, points the real SDK
+clients at it (GEMINI_BASE_URL / OPENAI_BASE_URL / CLAUDE_BASE_URL) and calls
+the answer_with_peer_review tool at rising concurrency. For each level it
+reports throughput, latency percentiles, errors and rejections, event-loop lag,
+LLM limiter and admission queue depth, per-provider adaptive limits, memory growth and the mock's request,
+429 and connection counts, then marks the saturation knee: the first level
+whose throughput is less than KNEE_GAIN above the previous one.
+
+The tool is called in-process rather than over HTTP so loop lag and queue
+depth can be sampled from the same event loop that serves it.
+
+Scenarios:
+    baseline         steady latency, no errors
+    rate_limited     10% random 429s plus a per-provider concurrency cap
+    slow_stream      response bodies trickle out over 1.5s
+    mixed_providers  validation on Gemini, synthesis on OpenAI, polish on Claude
+
+Usage:
+    python benchmarks/load_test.py [--scenario NAME] [--levels 1,2,4,8,16,32]
+        [--requests N] [--llm-concurrency N] [--port 8765] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+KNEE_GAIN = 0.10
+SAMPLE_INTERVAL_S = 0.02
+
+SCENARIOS = {
+    "baseline": {"mock": [], "env": {}},
+    "rate_limited": {"mock": ["--rate-429", "0.1", "--max-concurrency", "12", "--retry-after-s", "0.2"], "env": {}},
+    "slow_stream": {"mock": ["--slow-body-ms", "1500"], "env": {}},
+    "mixed_providers": {
+        "mock": [],
+        "env": {
+            "MODEL_LADDER_VALIDATION": "gemini:models/gemini-flash-latest",
+            "MODEL_LADDER_SYNTHESIS": "openai:gpt-4o-mini",
+            "MODEL_LADDER_POLISH": "claude:claude-3-5-sonnet-20241022",
+        },
+    },
+}
+
+
+def _mock_url(port: int, path: str) -> str:
+    return f"http://127.0.0.1:{port}{path}"
+
+
+def _mock_call(port: int, path: str, method: str = "GET") -> dict:
+    request = urllib.request.Request(_mock_url(port, path), method=method, data=b"" if method == "POST" else None)
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def _start_mock(port: int, extra: list[str]) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "mock_llm_server.py"), "--port", str(port), *extra],
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            _mock_call(port, "/__stats")
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("mock LLM server did not start")
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/status", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # peak, on platforms without /proc
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _sample(stop: asyncio.Event, lags: list[float], depth: dict) -> None:
+    """Record event-loop lag and queue depths until ``stop`` is set."""
+    from peer_review_mcp import server
+    from peer_review_mcp.LLM.limiter import limiter_stats
+
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        t0 = loop.time()
+        await asyncio.sleep(SAMPLE_INTERVAL_S)
+        lags.append(max(0.0, loop.time() - t0 - SAMPLE_INTERVAL_S))
+        stats = limiter_stats()
+        for key, value in (
+            ("llm_waiting", stats["waiting"]),
+            ("llm_active", stats["active"]),
+            ("admission_waiting", server._admission.waiting),
+        ):
+            depth.setdefault(key, []).append(value)
+
+
+async def _run_level(level: int, total: int, port: int, run_id: str) -> dict:
+    from peer_review_mcp import server
+
+    _mock_call(port, "/__reset", "POST")
+    latencies: list[float] = []
+    outcomes: dict[str, int] = {}
+    gate = asyncio.Semaphore(level)
+
+    async def _one(i: int) -> None:
+        async with gate:
+            t0 = time.perf_counter()
+            try:
+                # Unique questions so caches and request coalescing do not hide load.
+                result = await server.answer_with_peer_review(
+                    question=f"[{run_id}/{level}/{i}] How should I size a connection pool for a web service?"
+                )
+                error = result["meta"].get("error")
+                outcome = error or ("ok" if result.get("answer") else "empty")
+            except Exception as exc:  # noqa: BLE001 - counted, not fatal, in a load test
+                outcome = type(exc).__name__
+            latencies.append(time.perf_counter() - t0)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    depth: dict[str, list[int]] = {}
+    sampler = asyncio.create_task(_sample(stop, lags, depth))
+    rss_before = _rss_mb()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(total)))
+    wall = time.perf_counter() - t0
+    stop.set()
+    await sampler
+    mock = _mock_call(port, "/__stats")
+    from peer_review_mcp.LLM.limiter import limiter_stats
+
+    adaptive = {name: state["limit"] for name, state in limiter_stats()["providers"].items()}
+
+    ok = outcomes.get("ok", 0)
+    return {
+        "concurrency": level,
+        "requests": total,
+        "ok": ok,
+        "outcomes": outcomes,
+        "throughput_rps": ok / wall if wall else 0.0,
+        "latency_p50_s": _percentile(latencies, 0.50),
+        "latency_p95_s": _percentile(latencies, 0.95),
+        "loop_lag_p99_ms": _percentile(lags, 0.99) * 1000,
+        "loop_lag_max_ms": max(lags, default=0.0) * 1000,
+        "llm_queue_max": max(depth.get("llm_waiting", [0])),
+        "llm_queue_mean": statistics.mean(depth.get("llm_waiting", [0])),
+        "llm_active_max": max(depth.get("llm_active", [0])),
+        "admission_queue_max": max(depth.get("admission_waiting", [0])),
+        "adaptive_limits": adaptive,
+        "rss_growth_mb": _rss_mb() - rss_before,
+        "traced_growth_mb": (tracemalloc.get_traced_memory()[0] - traced_before) / 2**20,
+        "mock_requests": sum(mock["requests"].values()),
+        "mock_429s": sum(mock["rate_limited"].values()),
+        "mock_peak_inflight": mock["peak_inflight"],
+        "connections": mock["connections"],
+    }
+
+
+def find_knee(results: list[dict], gain: float = KNEE_GAIN) -> int | None:
+    """Concurrency of the first level whose throughput gain over the previous level is below ``gain``."""
+    for previous, current in zip(results, results[1:]):
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 + gain):
+            return current["concurrency"]
+    return None
+
+
+def _print_table(results: list[dict], knee: int | None) -> None:
+    keys = [k for k in results[0] if k != "concurrency"]
+    width = max(len(k) for k in keys)
+    print(f"{'concurrency':<{width}}  " + "  ".join(f"{r['concurrency']:>10}" for r in results))
+    for key in keys:
+        cells = []
+        for r in results:
+            value = r[key]
+            if isinstance(value, dict):
+                value = ",".join(f"{k}={v}" for k, v in value.items())
+            cells.append(f"{value:>10.4g}" if isinstance(value, float) else f"{str(value):>10}")
+        print(f"{key:<{width}}  " + "  ".join(cells))
+    print(f"\nsaturation knee: {knee if knee is not None else 'not reached'}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="baseline")
+    parser.add_argument("--levels", default="1,2,4,8,16,32", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=0, help="requests per level (default: 4 x concurrency)")
+    parser.add_argument("--llm-concurrency", type=int, default=16, help="LLM_MAX_CONCURRENCY for the run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    scenario = SCENARIOS[args.scenario]
+
+    # Configuration is read at import time, so the environment must be set first.
+    base = _mock_url(args.port, "")
+    os.environ.update({
+        "GEMINI_API_KEY": "mock",
+        "OPENAI_API_KEY": "mock",
+        "CLAUDE_API_KEY": "mock",
+        "GEMINI_BASE_URL": base,
+        "OPENAI_BASE_URL": base + "/v1",
+        "CLAUDE_BASE_URL": base,
+        "LLM_MAX_CONCURRENCY": str(args.llm_concurrency),
+        **scenario["env"],
+    })
+    os.environ.setdefault("LOG_LEVEL", "WARNING")  # prompt logging at INFO would dominate loop lag
+    sys.path.insert(0, os.path.join(HERE, os.pardir, "src"))
+
+    mock = _start_mock(args.port, scenario["mock"])
+    try:
+        tracemalloc.start()
+
+        async def _run_all() -> list[dict]:
+            run_id = f"{os.getpid()}-{int(time.time())}"
+            return [
+                await _run_level(level, args.requests or 4 * level, args.port, run_id) for level in levels
+            ]
+
+        results = asyncio.run(_run_all())
+    finally:
+        mock.terminate()
+        mock.wait(timeout=10)
+
+    knee = find_knee(results)
+    if args.json:
+        print(json.dumps({"scenario": args.scenario, "knee": knee, "levels": results}, indent=2))
+    else:
+        print(f"scenario: {args.scenario}")
+        _print_table(results, knee)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Measure per-request memory of the orchestrator pipeline with tracemalloc.
+
+Runs CentralOrchestrator.process over simulated LLM clients (schema-shaped
+replies, no network) with a long context summary and reports, per request, the
+peak traced allocation and the bytes still retained afterwards, the peak per
+request when requests run concurrently, the biggest allocation sites inside the
+package, and the footprint of one ReviewPoint.
+
+Usage:
+    python benchmarks/memory_per_request.py [--requests N] [--context-kb K]
+        [--concurrency C] [--json]
+"""
+import argparse
+import asyncio
+import dataclasses
+import gc
+import json
+import os
+import statistics
+import sys
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.join("peer_review_mcp", "")
+
+
+class SimulatedClient:
+    """Stand-in for the provider clients: schema-shaped JSON through call_llm, no network."""
+
+    LATENCY_S = 0.01
+
+    def __init__(self, model: str = "simulated", timeout: int = 30):
+        self.model = model
+        self.timeout = timeout
+
+    async def _reply(self, prompt: str, schema=None) -> str:
+        from mock_llm_server import MockSettings, instance_for_schema
+        from peer_review_mcp.LLM.call import call_llm
+        from peer_review_mcp.models.structured_output import json_schema
+
+        settings = MockSettings(output_chars=400)
+
+        async def _send() -> str:
+            await asyncio.sleep(self.LATENCY_S)
+            if schema is None:
+                return "simulated answer " * 20
+            return json.dumps(instance_for_schema(json_schema(schema), settings))
+
+        return await call_llm(provider="simulated", model=self.model, prompt=prompt, send=_send, schema=schema)
+
+    async def generate_async(self, prompt: str) -> str:
+        return await self._reply(prompt)
+
+    async def generate_json_async(self, prompt: str, schema) -> str:
+        return await self._reply(prompt, schema)
+
+
+def _context(kb: int) -> str:
+    sentence = "The service keeps a connection pool per worker and retries idempotent calls. "
+    return (sentence * (kb * 1024 // len(sentence) + 1))[: kb * 1024]
+
+
+def _point_footprint() -> dict:
+    from peer_review_mcp.models.review_point import ReviewPoint
+
+    fields = [(f.name, f.type, dataclasses.field(default=None)) for f in dataclasses.fields(ReviewPoint)]
+    DictPoint = dataclasses.make_dataclass("DictPoint", fields)
+    values = {"text": "x", "risk_type": "security", "severity": "high", "confidence": 0.8, "source": "risk"}
+    compact, plain = ReviewPoint(**values), DictPoint(**values)
+    return {
+        "review_point_bytes": sys.getsizeof(compact),
+        "dict_dataclass_bytes": sys.getsizeof(plain) + sys.getsizeof(plain.__dict__),
+    }
+
+
+async def _measure(requests: int, context_kb: int, concurrency: int) -> dict:
+    from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+    co = CentralOrchestrator(semantic_cache=False, answer_cache=False, coalescing=False)
+    ctx = _context(context_kb)
+    for i in range(2):  # warm up imports, caches of compiled regexes, metrics keys
+        await co.process(question=f"warmup {i}: how do I size a pool?", context_summary=ctx)
+
+    peaks: list[int] = []
+    retained: list[int] = []
+    gc.collect()
+    start_snapshot = tracemalloc.take_snapshot()
+    for i in range(requests):
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await co.process(question=f"request {i}: how should I size a connection pool?", context_summary=ctx)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        gc.collect()
+        retained.append(tracemalloc.get_traced_memory()[0] - before)
+    end_snapshot = tracemalloc.take_snapshot()
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    await asyncio.gather(*(
+        co.process(question=f"concurrent {i}: how should I size a connection pool?", context_summary=ctx)
+        for i in range(concurrency)
+    ))
+    concurrent_peak = tracemalloc.get_traced_memory()[1] - before
+
+    only_package = [tracemalloc.Filter(True, f"*{PACKAGE_DIR}*")]
+    top = end_snapshot.filter_traces(only_package).compare_to(start_snapshot.filter_traces(only_package), "lineno")
+    return {
+        "requests": requests,
+        "context_kb": context_kb,
+        "peak_per_request_kb_mean": statistics.mean(peaks) / 1024,
+        "peak_per_request_kb_max": max(peaks) / 1024,
+        "retained_per_request_kb_mean": statistics.mean(retained) / 1024,
+        "concurrency": concurrency,
+        "concurrent_peak_per_request_kb": concurrent_peak / concurrency / 1024,
+        **_point_footprint(),
+        "top_growth_sites": [
+            {"site": str(stat.traceback[0]), "size_kb": round(stat.size_diff / 1024, 2), "count": stat.count_diff}
+            for stat in top[:8]
+            if stat.size_diff
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--context-kb", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    # Client singletons are created at import time and need a key, even when unused.
+    for key in ("GEMINI_API_KEY", "OPENAI_API_KEY", "CLAUDE_API_KEY"):
+        os.environ.setdefault(key, "simulated")
+    sys.path.insert(0, os.path.join(HERE, os.pardir, "src"))
+
+    from peer_review_mcp.LLM import routing
+
+    for provider in routing.PROVIDERS:
+        routing.PROVIDERS[provider] = SimulatedClient
+
+    tracemalloc.start(5)
+    result = asyncio.run(_measure(args.requests, args.context_kb, args.concurrency))
+    tracemalloc.stop()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    for key, value in result.items():
+        if key == "top_growth_sites":
+            print("top retained growth in peer_review_mcp:")
+            for site in value:
+                print(f"  {site['size_kb']:>9.2f} KB  {site['count']:>6}  {site['site']}")
+        elif isinstance(value, float):
+            print(f"{key:<32} {value:>10.2f}")
+        else:
+            print(f"{key:<32} {value:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
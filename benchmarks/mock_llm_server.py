@@ -0,0 +1,312 @@
+"""
+Local mock of the Gemini, OpenAI and Anthropic HTTP APIs for load testing.
+
+Speaks enough of each provider's wire format for the official SDK clients to
+work unchanged when pointed at it (GEMINI_BASE_URL, OPENAI_BASE_URL and
+CLAUDE_BASE_URL):
+
+    POST /v1beta/models/{model}:generateContent   Gemini
+    POST /v1/chat/completions                     OpenAI
+    POST /v1/messages                             Anthropic
+
+Structured-output requests (responseSchema / json_schema / tool_use) get a
+document generated from the request's JSON schema; plain prompts get text.
+Latency, jitter, 429 rate, a per-provider concurrency cap (429 above it) and a
+slow, chunked response body are configurable. GET /__stats reports request and
+429 counts, in-flight peak and distinct client connections; POST /__reset clears
+them.
+
+Usage:
+    python benchmarks/mock_llm_server.py [--port 8765] [--latency-ms 300] [--jitter-ms 100]
+        [--rate-429 0.0] [--max-concurrency 0] [--slow-body-ms 0] [--output-chars 400]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+PROVIDERS = ("gemini", "openai", "claude")
+
+
+@dataclass
+class MockSettings:
+    latency_ms: float = 300.0
+    jitter_ms: float = 100.0
+    rate_429: float = 0.0
+    max_concurrency: int = 0  # per provider; 0 = unlimited
+    slow_body_ms: float = 0.0  # time spent trickling the response body out
+    output_chars: int = 400  # length of generated text fields
+    retry_after_s: float = 1.0
+    seed: int | None = None
+
+
+@dataclass
+class MockStats:
+    requests: dict = field(default_factory=lambda: dict.fromkeys(PROVIDERS, 0))
+    rate_limited: dict = field(default_factory=lambda: dict.fromkeys(PROVIDERS, 0))
+    inflight: dict = field(default_factory=lambda: dict.fromkeys(PROVIDERS, 0))
+    peak_inflight: int = 0
+    connections: set = field(default_factory=set)
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "rate_limited": dict(self.rate_limited),
+            "inflight": sum(self.inflight.values()),
+            "peak_inflight": self.peak_inflight,
+            "connections": len(self.connections),
+        }
+
+
+def _filler(name: str, chars: int) -> str:
+    words = f"mock {name} text".split()
+    out = []
+    size = 0
+    while size < chars:
+        word = words[len(out) % len(words)]
+        out.append(word)
+        size += len(word) + 1
+    return " ".join(out)
+
+
+def instance_for_schema(schema: dict, settings: MockSettings, root: dict | None = None, name: str = "value"):
+    """Build a document that validates against ``schema`` (OpenAPI or JSON Schema flavour)."""
+    root = root if root is not None else schema
+    ref = schema.get("$ref")
+    if ref:
+        target = root
+        for part in ref.lstrip("#/").split("/"):
+            target = target[part]
+        return instance_for_schema(target, settings, root, name)
+    for key in ("anyOf", "oneOf", "allOf"):
+        options = [s for s in schema.get(key, ()) if str(s.get("type", "")).lower() != "null"]
+        if options:
+            return instance_for_schema(options[0], settings, root, name)
+    if schema.get("enum"):
+        return schema["enum"][0]
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if str(k).lower() != "null"), "string")
+    kind = str(kind or ("object" if "properties" in schema else "string")).lower()
+    if kind == "object":
+        return {
+            prop: instance_for_schema(sub, settings, root, prop)
+            for prop, sub in (schema.get("properties") or {}).items()
+        }
+    if kind == "array":
+        count = min(2, int(schema.get("maxItems", 2)))
+        count = max(count, int(schema.get("minItems", 0)))
+        return [instance_for_schema(schema.get("items") or {}, settings, root, name) for _ in range(count)]
+    if kind in ("number", "integer"):
+        low = float(schema.get("minimum", 0.0))
+        high = float(schema.get("maximum", max(low, 1.0)))
+        value = low + 0.8 * (high - low)
+        return int(value) if kind == "integer" else round(value, 3)
+    if kind == "boolean":
+        return False
+    return _filler(name, settings.output_chars // 4 if name != "answer" else settings.output_chars)
+
+
+def _text(prompt: str, settings: MockSettings) -> str:
+    return _filler("answer", settings.output_chars)
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# -- wire formats ------------------------------------------------------------
+
+def _gemini(body: dict, model: str, settings: MockSettings) -> dict:
+    prompt = " ".join(
+        part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", [])
+    )
+    config = body.get("generationConfig") or {}
+    schema = config.get("responseJsonSchema") or config.get("responseSchema")
+    text = json.dumps(instance_for_schema(schema, settings)) if schema else _text(prompt, settings)
+    return {
+        "candidates": [
+            {"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP", "index": 0}
+        ],
+        "usageMetadata": {
+            "promptTokenCount": _tokens(prompt),
+            "candidatesTokenCount": _tokens(text),
+            "totalTokenCount": _tokens(prompt) + _tokens(text),
+        },
+        "modelVersion": model,
+    }
+
+
+def _openai(body: dict, settings: MockSettings) -> dict:
+    prompt = " ".join(str(m.get("content", "")) for m in body.get("messages", []))
+    response_format = body.get("response_format") or {}
+    schema = (response_format.get("json_schema") or {}).get("schema")
+    text = json.dumps(instance_for_schema(schema, settings)) if schema else _text(prompt, settings)
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}
+        ],
+        "usage": {
+            "prompt_tokens": _tokens(prompt),
+            "completion_tokens": _tokens(text),
+            "total_tokens": _tokens(prompt) + _tokens(text),
+        },
+    }
+
+
+def _anthropic(body: dict, settings: MockSettings) -> dict:
+    prompt = " ".join(str(m.get("content", "")) for m in body.get("messages", []))
+    tools = body.get("tools") or []
+    if tools:
+        tool = tools[0]
+        content = [{
+            "type": "tool_use",
+            "id": "toolu_mock",
+            "name": tool["name"],
+            "input": instance_for_schema(tool.get("input_schema") or {}, settings),
+        }]
+        stop_reason = "tool_use"
+        output = json.dumps(content[0]["input"])
+    else:
+        output = _text(prompt, settings)
+        content = [{"type": "text", "text": output}]
+        stop_reason = "end_turn"
+    return {
+        "id": "msg_mock",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model", "mock"),
+        "content": content,
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {"input_tokens": _tokens(prompt), "output_tokens": _tokens(output)},
+    }
+
+
+def _rate_limited(provider: str, settings: MockSettings) -> Response:
+    headers = {"retry-after": f"{settings.retry_after_s:g}"}
+    if provider == "gemini":
+        body = {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}}
+    elif provider == "openai":
+        body = {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}}
+    else:
+        body = {"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limit reached"}}
+    return JSONResponse(body, status_code=429, headers=headers)
+
+
+def _respond(payload: dict, settings: MockSettings) -> Response:
+    if settings.slow_body_ms <= 0:
+        return JSONResponse(payload)
+    data = json.dumps(payload).encode()
+    chunks = 8
+    size = -(-len(data) // chunks)
+    delay = settings.slow_body_ms / 1000 / chunks
+
+    async def _trickle():
+        for start in range(0, len(data), size):
+            yield data[start:start + size]
+            await asyncio.sleep(delay)
+
+    return StreamingResponse(_trickle(), media_type="application/json")
+
+
+def create_app(settings: MockSettings | None = None) -> Starlette:
+    settings = settings or MockSettings()
+    stats = MockStats()
+    rng = random.Random(settings.seed)
+
+    async def _handle(request: Request, provider: str, build) -> Response:
+        client = request.scope.get("client")
+        if client:
+            stats.connections.add(tuple(client))
+        stats.requests[provider] += 1
+        if (
+            settings.max_concurrency and stats.inflight[provider] >= settings.max_concurrency
+        ) or rng.random() < settings.rate_429:
+            stats.rate_limited[provider] += 1
+            return _rate_limited(provider, settings)
+
+        stats.inflight[provider] += 1
+        stats.peak_inflight = max(stats.peak_inflight, sum(stats.inflight.values()))
+        try:
+            body = await request.json()
+            delay = settings.latency_ms + rng.uniform(-settings.jitter_ms, settings.jitter_ms)
+            await asyncio.sleep(max(0.0, delay) / 1000)
+            return _respond(build(body), settings)
+        finally:
+            stats.inflight[provider] -= 1
+
+    async def gemini(request: Request) -> Response:
+        model = request.path_params["model"]
+        return await _handle(request, "gemini", lambda body: _gemini(body, model, settings))
+
+    async def openai(request: Request) -> Response:
+        return await _handle(request, "openai", lambda body: _openai(body, settings))
+
+    async def anthropic(request: Request) -> Response:
+        return await _handle(request, "claude", lambda body: _anthropic(body, settings))
+
+    async def get_stats(request: Request) -> Response:
+        return JSONResponse(stats.snapshot())
+
+    async def reset(request: Request) -> Response:
+        nonlocal stats
+        stats = MockStats()
+        return JSONResponse({"ok": True})
+
+    return Starlette(routes=[
+        Route("/v1beta/models/{model}:generateContent", gemini, methods=["POST"]),
+        Route("/v1/chat/completions", openai, methods=["POST"]),
+        Route("/v1/messages", anthropic, methods=["POST"]),
+        Route("/__stats", get_stats, methods=["GET"]),
+        Route("/__reset", reset, methods=["POST"]),
+    ])
+
+
+def main(argv: list[str] | None = None) -> int:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=MockSettings.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=MockSettings.jitter_ms)
+    parser.add_argument("--rate-429", type=float, default=MockSettings.rate_429, help="probability of a 429")
+    parser.add_argument("--max-concurrency", type=int, default=MockSettings.max_concurrency,
+                        help="per-provider in-flight cap; requests above it get 429")
+    parser.add_argument("--slow-body-ms", type=float, default=MockSettings.slow_body_ms,
+                        help="spread the response body over this many milliseconds")
+    parser.add_argument("--output-chars", type=int, default=MockSettings.output_chars)
+    parser.add_argument("--retry-after-s", type=float, default=MockSettings.retry_after_s)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    settings = MockSettings(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        max_concurrency=args.max_concurrency,
+        slow_body_ms=args.slow_body_ms,
+        output_chars=args.output_chars,
+        retry_after_s=args.retry_after_s,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
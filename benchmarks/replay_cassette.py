@@ -0,0 +1,163 @@
+"""
+Replay recorded traffic through the current pipeline, offline and deterministically.
+
+Reads a cassette written with LLM_CASSETTE_MODE=record, then calls the
+answer_with_peer_review tool for every recorded request with provider calls
+served from the cassette (LLM_CASSETTE_MODE=replay) at their recorded latency
+times --latency-scale. Reports end-to-end latency, LLM calls per request, token
+counts and the Phase B (polish) rate next to the recorded values, plus how many
+calls matched a recording only loosely (same response schema, different prompt)
+or not at all. With --compare, prints the change against an earlier --json run,
+e.g. before and after a change to CentralOrchestrator.
+
+Usage:
+    python benchmarks/replay_cassette.py CASSETTE [--concurrency 8] [--latency-scale 1.0]
+        [--limit N] [--json] [--compare previous.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _summary(prefix: str, latencies: list[float], polished: int, answered: int, total: int) -> dict:
+    return {
+        f"{prefix}_latency_p50_s": _percentile(latencies, 0.50),
+        f"{prefix}_latency_p95_s": _percentile(latencies, 0.95),
+        f"{prefix}_latency_mean_s": statistics.mean(latencies) if latencies else 0.0,
+        f"{prefix}_phase_b_rate": polished / total if total else 0.0,
+        f"{prefix}_answer_rate": answered / total if total else 0.0,
+    }
+
+
+async def _replay(requests: list, concurrency: int) -> dict:
+    from peer_review_mcp import metrics, server
+
+    metrics.reset()
+    gate = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    polished = answered = errors = 0
+
+    async def _one(request) -> None:
+        nonlocal polished, answered, errors
+        async with gate:
+            t0 = time.perf_counter()
+            try:
+                result = await server.answer_with_peer_review(
+                    question=request.question,
+                    context_summary=request.context_summary,
+                    time_budget_s=request.time_budget_s,
+                    tenant=request.tenant,
+                    priority=request.priority,
+                )
+            except Exception:  # noqa: BLE001 - counted, not fatal, in a replay
+                errors += 1
+                return
+            finally:
+                latencies.append(time.perf_counter() - t0)
+            answered += result.get("answer") is not None
+            polished += bool(result.get("meta", {}).get("polishing_applied"))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_one(r) for r in requests))
+    wall = time.perf_counter() - t0
+
+    counters = metrics.snapshot()
+    calls = counters.get("cassette.replayed", 0) + counters.get("cassette.misses", 0)
+    return {
+        "requests": len(requests),
+        "errors": errors,
+        "wall_s": wall,
+        **_summary("replayed", latencies, polished, answered, len(requests)),
+        "llm_calls": int(calls),
+        "llm_calls_per_request": calls / len(requests) if requests else 0.0,
+        "loose_matches": int(counters.get("cassette.loose_matches", 0)),
+        "misses": int(counters.get("cassette.misses", 0)),
+        "input_tokens": int(sum(v for k, v in counters.items() if k.endswith(".input_tokens"))),
+        "output_tokens": int(sum(v for k, v in counters.items() if k.endswith(".output_tokens"))),
+    }
+
+
+def _compare(current: dict, previous: dict) -> list[str]:
+    lines = []
+    for key, value in current.items():
+        before = previous.get(key)
+        if not isinstance(value, (int, float)) or not isinstance(before, (int, float)):
+            continue
+        change = f"{(value - before) / before:+.1%}" if before else "n/a"
+        lines.append(f"{key:<28} {before:>12.4g} {value:>12.4g} {change:>9}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="0 replays without delays")
+    parser.add_argument("--limit", type=int, default=0, help="replay only the first N requests")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    parser.add_argument("--compare", help="JSON output of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    # Configuration is read at import time, so the environment must be set first.
+    os.environ.update({
+        "LLM_CASSETTE_MODE": "replay",
+        "LLM_CASSETTE_PATH": args.cassette,
+        "LLM_CASSETTE_LATENCY_SCALE": str(args.latency_scale),
+    })
+    for key in ("GEMINI_API_KEY", "OPENAI_API_KEY", "CLAUDE_API_KEY"):
+        os.environ.setdefault(key, "replay")  # clients are built at import time but never call out
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    sys.path.insert(0, os.path.join(HERE, os.pardir, "src"))
+
+    from peer_review_mcp.LLM.cassette import load_cassette
+
+    calls, requests = load_cassette(args.cassette)
+    if args.limit:
+        requests = requests[: args.limit]
+    if not requests:
+        print("cassette holds no tool requests to replay", file=sys.stderr)
+        return 1
+
+    result = {
+        "cassette": args.cassette,
+        "recorded_llm_calls": len(calls),
+        **_summary(
+            "recorded",
+            [r.latency_s for r in requests],
+            sum(r.polished for r in requests),
+            sum(r.answered for r in requests),
+            len(requests),
+        ),
+        **asyncio.run(_replay(requests, args.concurrency)),
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key:<28} {value:>12.4g}" if isinstance(value, float) else f"{key:<28} {value!s:>12}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            previous = json.load(fh)
+        out = sys.stderr if args.json else sys.stdout  # keep --json output parseable
+        print(f"\n{'metric':<28} {'before':>12} {'after':>12} {'change':>9}", file=out)
+        for line in _compare(result, previous):
+            print(line, file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Compare split (risk + clarity) and fused validation modes.
+
+Runs ValidationEngine in both modes over a set of questions and reports call
+counts, latency, token/cost estimates and simple quality proxies (points per
+source, high-severity share, mean confidence, parse fallback rate).
+
+By default a simulated client is used whose latency grows with prompt and output
+size, so the call-count and context-duplication effects are visible offline.
+Pass --live to call Gemini (requires GEMINI_API_KEY).
+
+Usage:
+    python benchmarks/validation_modes.py [--live] [--questions FILE] [--repeat N] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+SAMPLE_QUESTIONS = [
+    "What makes Python unique?",
+    "How should I implement retries with exponential backoff for an HTTP client that talks to a rate-limited API?",
+    "Design a reliable Q&A system and analyze failure modes.",
+    "Is it safe to share one asyncio.Semaphore between threads?",
+    "Which is faster for lookups, a dict or a list, and when does it matter?",
+]
+
+# Rough token estimate and default pricing (USD per 1K tokens) for the cost proxy.
+CHARS_PER_TOKEN = 4
+INPUT_PRICE_PER_1K = 0.0001
+OUTPUT_PRICE_PER_1K = 0.0004
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class CallMeter:
+    """Wraps a client and records per-call latency and token estimates."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latencies: list[float] = []
+
+    async def _measure(self, prompt: str, coro) -> str:
+        t0 = time.perf_counter()
+        text = await coro
+        self.latencies.append(time.perf_counter() - t0)
+        self.calls += 1
+        self.input_tokens += _tokens(prompt)
+        self.output_tokens += _tokens(text or "")
+        return text
+
+    async def generate_async(self, prompt: str) -> str:
+        return await self._measure(prompt, self.client.generate_async(prompt))
+
+    async def generate_json_async(self, prompt: str, schema) -> str:
+        if hasattr(self.client, "generate_json_async"):
+            return await self._measure(prompt, self.client.generate_json_async(prompt, schema))
+        return await self.generate_async(prompt)
+
+
+class SimulatedClient:
+    """Offline stand-in for GeminiClient with size-dependent latency."""
+
+    BASE_LATENCY_S = 0.25
+    PER_INPUT_TOKEN_S = 0.00005
+    PER_OUTPUT_TOKEN_S = 0.004
+
+    def _response(self, prompt: str) -> str:
+        risk = {"text": "The question assumes a single runtime environment", "risk_type": "assumptions",
+                "severity": "medium", "confidence": 0.7}
+        clarity = {"text": "The expected level of detail is not specified", "risk_type": "edge_cases",
+                   "severity": "low", "confidence": 0.6}
+        if "Review 2 - clarity" in prompt:
+            items = [{**risk, "source": "risk"}, {**clarity, "source": "clarity"}]
+        elif "clarity-focused reviewer" in prompt:
+            items = [clarity]
+        else:
+            items = [risk]
+        return json.dumps({"items": items})
+
+    async def generate_async(self, prompt: str) -> str:
+        text = self._response(prompt)
+        await asyncio.sleep(
+            self.BASE_LATENCY_S
+            + _tokens(prompt) * self.PER_INPUT_TOKEN_S
+            + _tokens(text) * self.PER_OUTPUT_TOKEN_S
+        )
+        return text
+
+    async def generate_json_async(self, prompt: str, schema) -> str:
+        return await self.generate_async(prompt)
+
+
+async def _run_mode(mode: str, questions: list[str], repeat: int, live: bool) -> dict:
+    from peer_review_mcp import metrics
+    from peer_review_mcp.LLM.gemini_client import GeminiClient
+    from peer_review_mcp.llm_parsing import parse_fallback_rate
+    from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+    metrics.reset()
+    engine = ValidationEngine(mode=mode)
+    meter = CallMeter(GeminiClient() if live else SimulatedClient())
+    for reviewer in engine.reviewers:
+        reviewer.client = meter
+
+    wall: list[float] = []
+    points = []
+    for _ in range(repeat):
+        for question in questions:
+            t0 = time.perf_counter()
+            result = await engine.validate(question, None)
+            wall.append(time.perf_counter() - t0)
+            points.extend(result["items"])
+
+    runs = len(wall)
+    by_source: dict[str, int] = {}
+    for point in points:
+        by_source[point.source or "unknown"] = by_source.get(point.source or "unknown", 0) + 1
+    confidences = [p.confidence for p in points if isinstance(p.confidence, (int, float))]
+    sources = ("risk_reviewer", "clarity_reviewer", "fused_reviewer")
+    return {
+        "mode": mode,
+        "requests": runs,
+        "llm_calls_per_request": meter.calls / runs,
+        "latency_mean_ms": statistics.mean(wall) * 1000,
+        "latency_p95_ms": sorted(wall)[int(0.95 * (runs - 1))] * 1000,
+        "input_tokens_per_request": meter.input_tokens / runs,
+        "output_tokens_per_request": meter.output_tokens / runs,
+        "cost_per_request_usd": (
+            meter.input_tokens * INPUT_PRICE_PER_1K + meter.output_tokens * OUTPUT_PRICE_PER_1K
+        ) / 1000 / runs,
+        "points_per_request": len(points) / runs,
+        "points_by_source": by_source,
+        "high_severity_share": (
+            sum(1 for p in points if p.severity == "high") / len(points) if points else 0.0
+        ),
+        "mean_confidence": statistics.mean(confidences) if confidences else 0.0,
+        "parse_fallback_rate": max(parse_fallback_rate(s) for s in sources),
+    }
+
+
+def _print_table(results: list[dict]) -> None:
+    keys = [k for k in results[0] if k != "mode"]
+    width = max(len(k) for k in keys)
+    print(f"{'metric':<{width}}  " + "  ".join(f"{r['mode']:>14}" for r in results))
+    for key in keys:
+        cells = []
+        for r in results:
+            value = r[key]
+            if isinstance(value, dict):
+                value = ",".join(f"{k}={v}" for k, v in value.items())
+            cells.append(f"{value:>14.4g}" if isinstance(value, float) else f"{str(value):>14}")
+        print(f"{key:<{width}}  " + "  ".join(cells))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--live", action="store_true", help="call Gemini instead of the simulated client")
+    parser.add_argument("--questions", help="file with one question per line")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    if not args.live:
+        # Client singletons are created at import time and need a key, even when unused.
+        os.environ.setdefault("GEMINI_API_KEY", "simulated")
+        os.environ.setdefault("OPENAI_API_KEY", "simulated")
+
+    questions = SAMPLE_QUESTIONS
+    if args.questions:
+        with open(args.questions, encoding="utf-8") as fh:
+            questions = [line.strip() for line in fh if line.strip()]
+
+    async def _run_all() -> list[dict]:
+        return [await _run_mode(mode, questions, args.repeat, args.live) for mode in ("split", "fused")]
+
+    results = asyncio.run(_run_all())
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
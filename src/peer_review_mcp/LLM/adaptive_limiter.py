@@ -0,0 +1,129 @@
+import logging
+import time
+from typing import Callable, Literal, Optional
+
+from peer_review_mcp import metrics
+from peer_review_mcp.config import (
+    ADAPTIVE_CONCURRENCY,
+    ADAPTIVE_CONCURRENCY_INITIAL,
+    ADAPTIVE_CONCURRENCY_MIN,
+    ADAPTIVE_CONCURRENCY_MAX,
+    TENANT_MAX_CONCURRENCY,
+    TENANT_WEIGHTS,
+)
+from .scheduling import FairLimiter, parse_weights
+
+logger = logging.getLogger(__name__)
+
+Outcome = Literal["ok", "overload", "error"]
+
+
+def is_overload(exc: BaseException) -> bool:
+    """Whether a provider error means "too much load": a 429 or a timeout, from any of the SDKs."""
+    if isinstance(exc, TimeoutError):
+        return True
+    # openai / anthropic expose status_code, google-genai exposes code
+    if 429 in (getattr(exc, "status_code", None), getattr(exc, "code", None)):
+        return True
+    name = type(exc).__name__
+    return "Timeout" in name or "RateLimit" in name
+
+
+class AdaptiveLimiter(FairLimiter):  # Per-provider in-flight limit tuned by AIMD and a latency gradient
+    """
+    Adaptive concurrency limit for one provider.
+
+    Additive increase: while calls succeed with stable latency and the limit is
+    actually in use, it grows by ``1 / limit`` per call (about one slot per round
+    trip). Multiplicative decrease: a 429 or timeout multiplies it by ``backoff``,
+    and a short-term latency average above ``latency_tolerance`` times the long-term
+    baseline multiplies it by ``latency_backoff``. Cuts are spaced by at least one
+    recent round trip, so a burst of errors from the same window cuts once.
+
+    Queued calls are scheduled between tenants and priorities as in FairLimiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = ADAPTIVE_CONCURRENCY_INITIAL,
+        min_limit: int = ADAPTIVE_CONCURRENCY_MIN,
+        max_limit: int = ADAPTIVE_CONCURRENCY_MAX,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.9,
+        latency_tolerance: float = 2.0,
+        tenant_cap: int = TENANT_MAX_CONCURRENCY,
+        weights: Optional[dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        super().__init__(
+            name,
+            min(max(initial, self.min_limit), self.max_limit),
+            tenant_cap=tenant_cap,
+            weights=parse_weights(TENANT_WEIGHTS) if weights is None else weights,
+            clock=clock,
+        )
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.latency_tolerance = latency_tolerance
+        self._short_s: Optional[float] = None  # recent latency (EWMA, alpha 0.3)
+        self._long_s: Optional[float] = None  # baseline latency (EWMA, alpha 0.05)
+        self._last_cut = float("-inf")
+        self._publish()
+
+    def record(self, outcome: Outcome, latency_s: float = 0.0) -> None:
+        """Feed one finished call (call before ``release``); errors other than overload are ignored."""
+        if outcome == "overload":
+            metrics.increment(f"limiter.{self.name}.overloads")
+            self._decrease(self.backoff, "overload")
+        elif outcome == "ok":
+            self._short_s = latency_s if self._short_s is None else 0.7 * self._short_s + 0.3 * latency_s
+            self._long_s = latency_s if self._long_s is None else 0.95 * self._long_s + 0.05 * latency_s
+            if self._short_s > self._long_s * self.latency_tolerance:
+                self._decrease(self.latency_backoff, "latency")
+            elif self.inflight >= int(self.limit):  # only probe upwards when the limit is the bottleneck
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._publish()
+
+    def snapshot(self) -> dict:
+        return {
+            **super().snapshot(),
+            "latency_short_s": round(self._short_s or 0.0, 4),
+            "latency_long_s": round(self._long_s or 0.0, 4),
+        }
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        now = self._clock()
+        if now - self._last_cut < (self._short_s or 0.0):
+            return
+        self._last_cut = now
+        previous = self.limit
+        self.limit = max(float(self.min_limit), self.limit * factor)
+        logger.info("Concurrency limit for %s cut %.1f -> %.1f (%s)", self.name, previous, self.limit, reason)
+
+    def _publish(self) -> None:
+        super()._publish()
+        metrics.set_gauge(f"limiter.{self.name}.limit", self.limit)
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_adaptive_limiter(provider: Optional[str]) -> Optional[AdaptiveLimiter]:
+    """Return the process-wide limiter for ``provider`` (None when ADAPTIVE_CONCURRENCY is off)."""
+    if not ADAPTIVE_CONCURRENCY or provider is None:
+        return None
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limiter = _limiters[provider] = AdaptiveLimiter(provider)
+    return limiter
+
+
+def adaptive_limiters() -> dict[str, AdaptiveLimiter]:
+    return dict(_limiters)
+
+
+def reset_adaptive_limiters() -> None:
+    _limiters.clear()
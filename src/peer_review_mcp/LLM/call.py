@@ -0,0 +1,86 @@
+import time
+from typing import Awaitable, Callable, Optional
+
+from pydantic import BaseModel
+
+from peer_review_mcp import metrics
+from peer_review_mcp.profiling import current_profile
+from .cassette import get_cassette
+from .circuit_breaker import CircuitOpenError, get_breaker
+from .limiter import llm_concurrency
+from .response_cache import get_response_cache
+
+
+async def call_llm(
+    *,
+    provider: str,
+    model: str,
+    prompt: str,
+    send: Callable[[], Awaitable[str]],
+    schema: Optional[type[BaseModel]] = None,
+) -> str:
+    """
+    Run one provider request through the steps shared by every client.
+
+    The response cache is consulted first. On a miss the provider's circuit breaker
+    must allow the call (else CircuitOpenError is raised without calling out), then
+    ``send`` performs the SDK call under the provider's adaptive concurrency limit and
+    the global one. Its outcome and latency (excluding time queued for the limiters)
+    feed the breaker and the adaptive limiter, and a non-empty result is cached.
+    With a cassette configured, ``send`` is recorded, or replaced by its recording.
+
+    Args:
+        provider: Provider name ("gemini", "openai", "claude").
+        model: Model identifier.
+        prompt: The prompt, used for the cache key.
+        send: Zero-argument coroutine function performing the call and returning text.
+        schema: Response schema for structured calls (part of the cache key).
+
+    Returns:
+        The response text.
+    """
+    cache = get_response_cache()
+    key = None
+    if cache is not None:
+        key = cache.key(provider, model, prompt, schema)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+    breaker = get_breaker(provider)
+    permit = breaker.allow() if breaker is not None else None
+    if breaker is not None and permit is None:
+        metrics.increment(f"breaker.{provider}.rejected")
+        raise CircuitOpenError(provider)
+
+    cassette = get_cassette()
+    if cassette is not None:
+        send = cassette.wrap(provider, model, prompt, schema, send)
+
+    profile = current_profile()
+    queued = time.monotonic()
+    started = None
+    try:
+        async with llm_concurrency(provider):
+            started = time.monotonic()
+            text = await send()
+    except Exception:
+        if breaker is not None:
+            if started is None:
+                breaker.release(permit)
+            else:
+                breaker.record(False, time.monotonic() - started, permit)
+        raise
+    except BaseException:  # cancelled: no verdict on the provider
+        if breaker is not None:
+            breaker.release(permit)
+        raise
+    finally:
+        if profile is not None:
+            profile.record_llm(queued, started, time.monotonic())
+    if breaker is not None:
+        breaker.record(True, time.monotonic() - started, permit)
+
+    if cache is not None and text:
+        await cache.set(key, text)
+    return text
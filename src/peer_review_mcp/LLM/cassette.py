@@ -0,0 +1,234 @@
+import atexit
+import gzip
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, Awaitable, Callable, Literal, Optional
+
+import anyio
+from pydantic import BaseModel
+
+from peer_review_mcp import metrics
+from peer_review_mcp.config import LLM_CASSETTE_MODE, LLM_CASSETTE_PATH, LLM_CASSETTE_LATENCY_SCALE
+from .response_cache import ResponseCache
+from .usage import capture_usage, report_usage
+
+logger = logging.getLogger(__name__)
+
+Mode = Literal["record", "replay"]
+
+
+@dataclass(frozen=True, slots=True)
+class CassetteCall:
+    """One recorded provider call. The prompt itself is not stored, only its hash in ``key``."""
+
+    key: str
+    provider: str
+    model: str
+    latency_s: float
+    schema: Optional[str] = None
+    text: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    error: Optional[str] = None  # exception type name when the call failed
+    status_code: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CassetteRequest:
+    """One recorded tool request with its end-to-end latency and outcome."""
+
+    question: str
+    latency_s: float
+    answered: bool
+    polished: bool
+    context_summary: Optional[str] = None
+    time_budget_s: Optional[float] = None
+    tenant: Optional[str] = None
+    priority: Optional[str] = None
+
+
+class CassetteMissError(LookupError):
+    """Replay found no recorded response for a call."""
+
+
+class ReplayedError(Exception):
+    """A provider failure replayed from a cassette, with the recorded type name and status code."""
+
+    def __init__(self, name: str, status_code: Optional[int] = None):
+        super().__init__(f"replayed {name}" + (f" ({status_code})" if status_code else ""))
+        self.name = name
+        self.status_code = status_code
+
+
+class ReplayedTimeout(ReplayedError, TimeoutError):
+    pass
+
+
+def load_cassette(path: str) -> tuple[list[CassetteCall], list[CassetteRequest]]:
+    """Read a cassette file into its provider calls and tool requests, in recorded order."""
+    calls: list[CassetteCall] = []
+    requests: list[CassetteRequest] = []
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        try:
+            for number, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    kind = record.pop("kind")
+                    if kind == "call":
+                        calls.append(CassetteCall(**record))
+                    elif kind == "request":
+                        requests.append(CassetteRequest(**record))
+                except (ValueError, KeyError, TypeError):
+                    # A process killed mid-write leaves a torn last line; skip it.
+                    logger.warning("Skipping unreadable cassette line %d in %s", number, path)
+        except EOFError:
+            logger.warning("Cassette %s is truncated; using the %d records before the cut", path, len(calls))
+    return calls, requests
+
+
+class Cassette:  # Records provider traffic to a file, or replays it in place of the providers
+    """
+    Record/replay of LLM provider calls.
+
+    In record mode each call's response text (or error), latency and token counts
+    are appended as one JSON line keyed by the response cache's prompt hash. In
+    replay mode the provider is never called: the recorded response for the same
+    key is returned after its recorded latency times ``latency_scale``, repeated
+    prompts cycling through their recordings in order. When nothing matches (the
+    prompts changed), ``loose`` replay falls back to the next recording with the
+    same response schema, so a modified pipeline can still be driven end to end;
+    otherwise CassetteMissError is raised.
+    """
+
+    def __init__(self, path: str, mode: Mode, latency_scale: float = 1.0, loose: bool = True):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+        self.path = path.replace("{pid}", str(os.getpid()))
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.loose = loose
+        self._fh: Optional[IO[str]] = None
+        self._by_key: dict[str, list[CassetteCall]] = {}
+        self._by_schema: dict[Optional[str], list[CassetteCall]] = {}
+        self._cursors: dict[tuple[str, object], int] = {}
+        if mode == "replay":
+            calls, _ = load_cassette(self.path)
+            for call in calls:
+                self._by_key.setdefault(call.key, []).append(call)
+                self._by_schema.setdefault(call.schema, []).append(call)
+            logger.info("Loaded %d recorded LLM calls from %s", len(calls), self.path)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def wrap(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        schema: Optional[type[BaseModel]],
+        send: Callable[[], Awaitable[str]],
+    ) -> Callable[[], Awaitable[str]]:
+        """Return a ``send`` that records the real call, or replays it without calling out."""
+        key = ResponseCache.key(provider, model, prompt, schema)
+        schema_name = schema.__name__ if schema is not None else None
+
+        async def _record() -> str:
+            started = time.monotonic()
+            with capture_usage() as usage:
+                try:
+                    text = await send()
+                except Exception as exc:
+                    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+                    self._write("call", CassetteCall(
+                        key, provider, model, time.monotonic() - started, schema=schema_name,
+                        error=type(exc).__name__, status_code=status if isinstance(status, int) else None,
+                    ))
+                    raise
+            self._write("call", CassetteCall(
+                key, provider, model, time.monotonic() - started, schema=schema_name, text=text, **usage,
+            ))
+            return text
+
+        async def _replay() -> str:
+            call = self._lookup(key, schema_name)
+            if call.latency_s * self.latency_scale > 0:
+                await anyio.sleep(call.latency_s * self.latency_scale)
+            if call.error is not None:
+                error = ReplayedTimeout if "Timeout" in call.error else ReplayedError
+                raise error(call.error, call.status_code)
+            report_usage(provider, call.input_tokens, call.output_tokens)
+            return call.text or ""
+
+        return _record if self.recording else _replay
+
+    def record_request(self, request: CassetteRequest) -> None:
+        if self.recording:
+            self._write("request", request)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _lookup(self, key: str, schema_name: Optional[str]) -> CassetteCall:
+        if key in self._by_key:
+            metrics.increment("cassette.replayed")
+            return self._next(("key", key), self._by_key[key])
+        if self.loose and schema_name in self._by_schema:
+            metrics.increment("cassette.replayed")
+            metrics.increment("cassette.loose_matches")
+            return self._next(("schema", schema_name), self._by_schema[schema_name])
+        metrics.increment("cassette.misses")
+        raise CassetteMissError(f"No recorded response for {key[:12]} (schema {schema_name})")
+
+    def _next(self, cursor: tuple[str, object], calls: list[CassetteCall]) -> CassetteCall:
+        position = self._cursors.get(cursor, 0)
+        self._cursors[cursor] = position + 1
+        return calls[position % len(calls)]
+
+    def _write(self, kind: str, record) -> None:
+        if self._fh is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if self.path.endswith(".gz"):
+                self._fh = gzip.open(self.path, "at", encoding="utf-8")
+            else:
+                self._fh = open(self.path, "a", encoding="utf-8", buffering=1)
+            atexit.register(self.close)
+        fields = {k: v for k, v in asdict(record).items() if v is not None}
+        self._fh.write(json.dumps({"kind": kind, **fields}, separators=(",", ":")) + "\n")
+        metrics.increment(f"cassette.recorded.{kind}")
+
+
+_cassette: Optional[Cassette] = None
+_configured = False
+
+
+def configure_cassette(cassette: Optional[Cassette]) -> None:
+    """Install (or, with None, disable) the process-wide cassette."""
+    global _cassette, _configured
+    if _cassette is not None and _cassette is not cassette:
+        _cassette.close()
+    _cassette = cassette
+    _configured = True
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Return the cassette, created from LLM_CASSETTE_MODE on first use (None when off)."""
+    global _cassette, _configured
+    if not _configured:
+        if LLM_CASSETTE_MODE in ("record", "replay"):
+            _cassette = Cassette(LLM_CASSETTE_PATH, LLM_CASSETTE_MODE, LLM_CASSETTE_LATENCY_SCALE)
+        elif LLM_CASSETTE_MODE != "off":
+            logger.warning("Ignoring unknown LLM_CASSETTE_MODE %r", LLM_CASSETTE_MODE)
+        _configured = True
+    return _cassette
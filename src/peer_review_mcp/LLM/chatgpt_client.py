@@ -1,13 +1,17 @@
 import logging
 from openai import OpenAI, AsyncOpenAI
-from .limiter import llm_concurrency
-from ..config import CHATGPT_API_KEY, CHATGPT_MODEL
+from pydantic import BaseModel
+from .call import call_llm
+from .circuit_breaker import CircuitOpenError
+from .usage import report_usage
+from ..config import CHATGPT_API_KEY, CHATGPT_MODEL, OPENAI_BASE_URL
+from ..models.structured_output import json_schema
 
 logger = logging.getLogger(__name__)
 
 
 class ChatGPTClient:  # Thin wrapper client for OpenAI ChatGPT: send prompts and return text
-    """Singleton client for OpenAI ChatGPT API.
+    """Per-model singleton client for OpenAI ChatGPT API.
 
     Thin wrapper that sends prompts to OpenAI and returns raw text responses.
 
@@ -15,21 +19,23 @@ class ChatGPTClient:  # Thin wrapper client for OpenAI ChatGPT: send prompts and
         model (str): Model identifier used for requests.
         timeout (int): Timeout in seconds for API calls.
     """
-    _instance = None
+    _instances: dict = {}  # one shared instance per model
     _client = None
     _async_client = None
     DEFAULT_TIMEOUT = 30  # seconds
 
     def __new__(cls, model: str = CHATGPT_MODEL, timeout: int = DEFAULT_TIMEOUT):
-        if cls._instance is None:
-            cls._instance = super(ChatGPTClient, cls).__new__(cls)
-            cls._instance.model = model
-            cls._instance.timeout = timeout
-            cls._instance._client = OpenAI(api_key=CHATGPT_API_KEY, timeout=timeout)
-            cls._instance._async_client = AsyncOpenAI(api_key=CHATGPT_API_KEY, timeout=timeout)
-            logger.info("ChatGPTClient singleton initialized with model: %s, timeout: %ds",
+        instance = cls._instances.get(model)
+        if instance is None:
+            instance = super(ChatGPTClient, cls).__new__(cls)
+            instance.model = model
+            instance.timeout = timeout
+            instance._client = OpenAI(api_key=CHATGPT_API_KEY, timeout=timeout, base_url=OPENAI_BASE_URL)
+            instance._async_client = AsyncOpenAI(api_key=CHATGPT_API_KEY, timeout=timeout, base_url=OPENAI_BASE_URL)
+            logger.info("ChatGPTClient instance initialized for model: %s, timeout: %ds",
                        model, timeout)
-        return cls._instance
+            cls._instances[model] = instance
+        return instance
 
     def generate(self, prompt: str) -> str:
         """
@@ -82,7 +88,7 @@ class ChatGPTClient:  # Thin wrapper client for OpenAI ChatGPT: send prompts and
         """
         logger.info("Sending prompt to ChatGPT API (async): %s", prompt)
         try:
-            async with llm_concurrency():
+            async def _send() -> str:
                 response = await self._async_client.chat.completions.create(
                     model=self.model,
                     messages=[
@@ -90,15 +96,68 @@ class ChatGPTClient:  # Thin wrapper client for OpenAI ChatGPT: send prompts and
                     ],
                     max_tokens=1024,
                 )
-            try:
-                text = response.choices[0].message.content
-            except Exception:
-                text = getattr(response.choices[0], "text", "")
+                usage = getattr(response, "usage", None)
+                report_usage("openai", getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None))
+                try:
+                    return response.choices[0].message.content
+                except Exception:
+                    return getattr(response.choices[0], "text", "")
+
+            text = await call_llm(provider="openai", model=self.model, prompt=prompt, send=_send)
             logger.info("Received response from ChatGPT API (async): %s", text)
             return text
         except TimeoutError:
             logger.error("ChatGPT API call exceeded timeout")
             raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
         except Exception as e:
             logger.exception("Error during ChatGPT API call (async): %s", e)
             raise
+
+    async def generate_json_async(self, prompt: str, schema: type[BaseModel]) -> str:
+        """
+        Sends a prompt using OpenAI structured outputs and returns the JSON text.
+
+        Args:
+            prompt: The input prompt to send to the API.
+            schema: Pydantic model describing the expected response object.
+
+        Returns:
+            The generated JSON document as a string.
+        """
+        logger.info("Sending structured prompt to ChatGPT API (async): %s", prompt)
+        try:
+            async def _send() -> str:
+                response = await self._async_client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=1024,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": schema.__name__,
+                            "schema": json_schema(schema),
+                            "strict": True,
+                        },
+                    },
+                )
+                usage = getattr(response, "usage", None)
+                report_usage("openai", getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None))
+                return response.choices[0].message.content or ""
+
+            text = await call_llm(provider="openai", model=self.model, prompt=prompt, send=_send, schema=schema)
+            logger.info("Received structured response from ChatGPT API (async): %s", text)
+            return text
+        except TimeoutError:
+            logger.error("ChatGPT API call exceeded timeout")
+            raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
+        except Exception as e:
+            logger.exception("Error during structured ChatGPT API call (async): %s", e)
+            raise
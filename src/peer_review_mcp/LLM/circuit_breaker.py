@@ -0,0 +1,159 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Literal, Optional
+
+from peer_review_mcp import metrics
+from peer_review_mcp.config import (
+    CIRCUIT_BREAKER,
+    BREAKER_FAILURE_RATE,
+    BREAKER_WINDOW,
+    BREAKER_MIN_CALLS,
+    BREAKER_SLOW_CALL_S,
+    BREAKER_OPEN_S,
+)
+
+logger = logging.getLogger(__name__)
+
+State = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, provider: str):
+        super().__init__(f"Circuit open for provider {provider!r}")
+        self.provider = provider
+
+
+@dataclass(frozen=True, slots=True)
+class BreakerPermit:
+    """A call let through by ``allow()``; ``probe`` marks calls admitted while half-open."""
+    probe: bool = False
+    epoch: int = 0
+
+
+class CircuitBreaker:  # Per-provider breaker driven by error rate and slow calls
+    """
+    Error-rate and latency based circuit breaker.
+
+    Outcomes of the last ``window`` calls are kept; a call counts as bad when it
+    raises or takes longer than ``slow_call_s``. Once at least ``min_calls`` are
+    recorded and the bad share reaches ``failure_rate`` the circuit opens and calls
+    fail fast. After ``open_s`` it goes half-open and lets ``half_open_probes``
+    calls through: a good probe closes it, a bad one reopens it. Only calls admitted
+    as probes (their ``allow()`` permit passed back to ``record``) decide; results of
+    calls already in flight when the circuit opened are ignored while half-open.
+
+    The breaker is "strained" while half-open, or while closed with a bad share
+    of at least half the opening rate; the orchestrator sheds work at that point.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        slow_call_s: float = BREAKER_SLOW_CALL_S,
+        open_s: float = BREAKER_OPEN_S,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call_s = slow_call_s
+        self.open_s = open_s
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = bad call
+        self._state: State = "closed"
+        self._opened_at = 0.0
+        self._probes = 0
+        self._epoch = 0  # bumped on every half-open transition, to tell stale probes apart
+
+    @property
+    def state(self) -> State:
+        if self._state == "open" and self._clock() - self._opened_at >= self.open_s:
+            self._state = "half_open"
+            self._probes = 0
+            self._epoch += 1
+            logger.info("Circuit for %s half-open, probing", self.name)
+        return self._state
+
+    @property
+    def bad_ratio(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def strained(self) -> bool:
+        state = self.state
+        if state != "closed":
+            return True
+        return len(self._outcomes) >= self.min_calls and self.bad_ratio >= self.failure_rate / 2
+
+    def allow(self) -> Optional[BreakerPermit]:
+        """A permit if a call may go to the provider now (reserving a probe when half-open), else None."""
+        state = self.state
+        if state == "closed":
+            return BreakerPermit()
+        if state == "half_open" and self._probes < self.half_open_probes:
+            self._probes += 1
+            return BreakerPermit(probe=True, epoch=self._epoch)
+        return None
+
+    def record(self, ok: bool, latency_s: float = 0.0, permit: Optional[BreakerPermit] = None) -> None:
+        bad = not ok or latency_s > self.slow_call_s
+        if self.state == "half_open":
+            if not self._is_probe(permit):
+                return  # admitted before the circuit opened; says nothing about recovery
+            self._probes = max(0, self._probes - 1)
+            if bad:
+                self._open()
+            else:
+                self._close()
+            return
+        self._outcomes.append(bad)
+        if self._state == "closed" and len(self._outcomes) >= self.min_calls and self.bad_ratio >= self.failure_rate:
+            self._open()
+
+    def release(self, permit: Optional[BreakerPermit] = None) -> None:
+        """Give back a reservation whose call ended without an outcome (e.g. cancelled)."""
+        if self._state == "half_open" and self._is_probe(permit):
+            self._probes = max(0, self._probes - 1)
+
+    def _is_probe(self, permit: Optional[BreakerPermit]) -> bool:
+        return permit is not None and permit.probe and permit.epoch == self._epoch
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "bad_ratio": round(self.bad_ratio, 3), "calls": len(self._outcomes)}
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = self._clock()
+        metrics.increment(f"breaker.{self.name}.opened")
+        logger.warning("Circuit for %s opened (bad ratio %.2f)", self.name, self.bad_ratio)
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._outcomes.clear()
+        logger.info("Circuit for %s closed", self.name)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> Optional[CircuitBreaker]:
+    """Return the process-wide breaker for ``provider`` (None when CIRCUIT_BREAKER is off)."""
+    if not CIRCUIT_BREAKER:
+        return None
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(provider)
+    return breaker
+
+
+def reset_breakers() -> None:
+    _breakers.clear()
@@ -1,13 +1,18 @@
+import json
 import logging
 from anthropic import Anthropic, AsyncAnthropic
-from .limiter import llm_concurrency
-from ..config import CLAUDE_API_KEY, CLAUDE_MODEL
+from pydantic import BaseModel
+from .call import call_llm
+from .circuit_breaker import CircuitOpenError
+from .usage import report_usage
+from ..config import CLAUDE_API_KEY, CLAUDE_MODEL, CLAUDE_BASE_URL
+from ..models.structured_output import json_schema
 
 logger = logging.getLogger(__name__)
 
 
 class ClaudeClient:  # Thin wrapper client for Anthropic Claude: send prompts and return text
-    """Singleton client for Anthropic Claude API.
+    """Per-model singleton client for Anthropic Claude API.
 
     Thin wrapper that sends prompts to Claude and returns raw text responses.
 
@@ -15,21 +20,23 @@ class ClaudeClient:  # Thin wrapper client for Anthropic Claude: send prompts an
         model (str): Model identifier used for requests.
         timeout (int): Timeout in seconds for API calls.
     """
-    _instance = None
+    _instances: dict = {}  # one shared instance per model
     _client = None
     _async_client = None
     DEFAULT_TIMEOUT = 30  # seconds
 
     def __new__(cls, model: str = CLAUDE_MODEL, timeout: int = DEFAULT_TIMEOUT):
-        if cls._instance is None:
-            cls._instance = super(ClaudeClient, cls).__new__(cls)
-            cls._instance.model = model
-            cls._instance.timeout = timeout
-            cls._instance._client = Anthropic(api_key=CLAUDE_API_KEY)
-            cls._instance._async_client = AsyncAnthropic(api_key=CLAUDE_API_KEY)
-            logger.info("ClaudeClient singleton initialized with model: %s, timeout: %ds",
+        instance = cls._instances.get(model)
+        if instance is None:
+            instance = super(ClaudeClient, cls).__new__(cls)
+            instance.model = model
+            instance.timeout = timeout
+            instance._client = Anthropic(api_key=CLAUDE_API_KEY, base_url=CLAUDE_BASE_URL)
+            instance._async_client = AsyncAnthropic(api_key=CLAUDE_API_KEY, base_url=CLAUDE_BASE_URL)
+            logger.info("ClaudeClient instance initialized for model: %s, timeout: %ds",
                        model, timeout)
-        return cls._instance
+            cls._instances[model] = instance
+        return instance
 
     def generate(self, prompt: str) -> str:
         """
@@ -84,7 +91,7 @@ class ClaudeClient:  # Thin wrapper client for Anthropic Claude: send prompts an
             """
         logger.info("Sending prompt to Claude API (async): %s", prompt)
         try:
-            async with llm_concurrency():
+            async def _send() -> str:
                 message = await self._async_client.messages.create(
                     model=self.model,
                     max_tokens=1024,
@@ -93,11 +100,71 @@ class ClaudeClient:  # Thin wrapper client for Anthropic Claude: send prompts an
                     ],
                     timeout=self.timeout
                 )
-            logger.info("Received response from Claude API (async): %s", message.content[0].text)
-            return message.content[0].text
+                usage = getattr(message, "usage", None)
+                report_usage("claude", getattr(usage, "input_tokens", None), getattr(usage, "output_tokens", None))
+                return message.content[0].text
+
+            text = await call_llm(provider="claude", model=self.model, prompt=prompt, send=_send)
+            logger.info("Received response from Claude API (async): %s", text)
+            return text
         except TimeoutError:
             logger.error("Claude API call exceeded timeout of %ds", self.timeout)
             raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
         except Exception as e:
             logger.error("Claude API call failed (async): %s", str(e))
             raise
+
+    async def generate_json_async(self, prompt: str, schema: type[BaseModel]) -> str:
+        """
+            Sends a prompt to Claude with a forced tool call and returns the tool input as JSON text.
+
+            Args:
+                prompt: The input prompt to send to the API.
+                schema: Pydantic model used as the tool input schema.
+
+            Returns:
+                The tool input serialized as a JSON string. Falls back to the first
+                text block if the model did not call the tool.
+            """
+        logger.info("Sending structured prompt to Claude API (async): %s", prompt)
+        tool_name = schema.__name__
+        try:
+            async def _send() -> str:
+                message = await self._async_client.messages.create(
+                    model=self.model,
+                    max_tokens=1024,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    tools=[
+                        {
+                            "name": tool_name,
+                            "description": "Record the response in the required structure.",
+                            "input_schema": json_schema(schema),
+                        }
+                    ],
+                    tool_choice={"type": "tool", "name": tool_name},
+                    timeout=self.timeout
+                )
+                usage = getattr(message, "usage", None)
+                report_usage("claude", getattr(usage, "input_tokens", None), getattr(usage, "output_tokens", None))
+                for block in message.content:
+                    if getattr(block, "type", None) == "tool_use":
+                        return json.dumps(block.input)
+                return next((getattr(block, "text", "") for block in message.content), "")
+
+            text = await call_llm(provider="claude", model=self.model, prompt=prompt, send=_send, schema=schema)
+            logger.info("Received structured response from Claude API (async): %s", text)
+            return text
+        except TimeoutError:
+            logger.error("Claude API call exceeded timeout of %ds", self.timeout)
+            raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
+        except Exception as e:
+            logger.error("Structured Claude API call failed (async): %s", str(e))
+            raise
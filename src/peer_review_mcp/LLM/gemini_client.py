@@ -8,15 +8,18 @@ os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
 
 from google import genai
 from google.genai import types
-from ..config import GEMINI_API_KEY, DEFAULT_MODEL
-from .limiter import llm_concurrency
+from pydantic import BaseModel
+from ..config import GEMINI_API_KEY, GEMINI_BASE_URL, DEFAULT_MODEL
+from .call import call_llm
+from .circuit_breaker import CircuitOpenError
+from .usage import report_usage
 
 logger = logging.getLogger(__name__)
 
 
 class GeminiClient:  # Thin wrapper client for Google Gemini: send prompts and return text
     """
-    Singleton client for Google Gemini API.
+    Per-model singleton client for Google Gemini API.
 
     Thin wrapper that sends prompts to Gemini and returns raw text responses.
 
@@ -24,22 +27,24 @@ class GeminiClient:  # Thin wrapper client for Google Gemini: send prompts and r
         model: The model to use for generating responses.
         timeout: Timeout duration for API calls.
     """
-    _instance = None
+    _instances: dict = {}  # one shared instance per model
     _client = None
     DEFAULT_TIMEOUT = 30  # seconds
 
     def __new__(cls, model: str = DEFAULT_MODEL, timeout: int = DEFAULT_TIMEOUT):
-        if cls._instance is None:
-            cls._instance = super(GeminiClient, cls).__new__(cls)
-            cls._instance.model = model
-            cls._instance.timeout = timeout
-            cls._instance._client = genai.Client(
+        instance = cls._instances.get(model)
+        if instance is None:
+            instance = super(GeminiClient, cls).__new__(cls)
+            instance.model = model
+            instance.timeout = timeout
+            instance._client = genai.Client(
                 api_key=GEMINI_API_KEY,
-                http_options=types.HttpOptions(timeout=timeout * 1000),
+                http_options=types.HttpOptions(timeout=timeout * 1000, base_url=GEMINI_BASE_URL),
             )
-            logger.info("GeminiClient singleton initialized with model: %s, timeout: %ds",
+            logger.info("GeminiClient instance initialized for model: %s, timeout: %ds",
                        model, timeout)
-        return cls._instance
+            cls._instances[model] = instance
+        return instance
 
     def generate(self, prompt: str) -> str:
         """
@@ -86,16 +91,63 @@ class GeminiClient:  # Thin wrapper client for Google Gemini: send prompts and r
         """
         logger.info("Sending prompt to Gemini API (async): %s", prompt)
         try:
-            async with llm_concurrency():
+            async def _send() -> str:
                 response = await self._client.aio.models.generate_content(
                     model=self.model,
                     contents=prompt
                 )
-            logger.info("Received response from Gemini API (async): %s", response.text)
-            return response.text
+                usage = getattr(response, "usage_metadata", None)
+                report_usage("gemini", getattr(usage, "prompt_token_count", None), getattr(usage, "candidates_token_count", None))
+                return response.text
+
+            text = await call_llm(provider="gemini", model=self.model, prompt=prompt, send=_send)
+            logger.info("Received response from Gemini API (async): %s", text)
+            return text
         except TimeoutError:
             logger.error("Gemini API call exceeded timeout of %ds", self.timeout)
             raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
         except Exception as e:
             logger.exception("Error during Gemini API call (async): %s", e)
             raise
+
+    async def generate_json_async(self, prompt: str, schema: type[BaseModel]) -> str:
+        """
+        Sends a prompt to Gemini with a response schema and returns the JSON text.
+
+        Args:
+            prompt: The input prompt to send to the API.
+            schema: Pydantic model passed to Gemini as the response schema.
+
+        Returns:
+            The generated JSON document as a string.
+        """
+        logger.info("Sending structured prompt to Gemini API (async): %s", prompt)
+        try:
+            async def _send() -> str:
+                response = await self._client.aio.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=schema,
+                    ),
+                )
+                usage = getattr(response, "usage_metadata", None)
+                report_usage("gemini", getattr(usage, "prompt_token_count", None), getattr(usage, "candidates_token_count", None))
+                return response.text
+
+            text = await call_llm(provider="gemini", model=self.model, prompt=prompt, send=_send, schema=schema)
+            logger.info("Received structured response from Gemini API (async): %s", text)
+            return text
+        except TimeoutError:
+            logger.error("Gemini API call exceeded timeout of %ds", self.timeout)
+            raise
+        except CircuitOpenError as e:
+            logger.warning("%s, failing fast", e)
+            raise
+        except Exception as e:
+            logger.exception("Error during structured Gemini API call (async): %s", e)
+            raise
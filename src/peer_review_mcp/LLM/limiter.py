@@ -1,24 +1,93 @@
-import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import Optional, AsyncIterator
 
-_llm_semaphore: Optional[asyncio.Semaphore] = None
+from peer_review_mcp.config import TENANT_MAX_CONCURRENCY, TENANT_WEIGHTS
+from .adaptive_limiter import adaptive_limiters, get_adaptive_limiter, is_overload
+from .scheduling import FairLimiter, current_tag, parse_weights
 
+_global_limiter: Optional[FairLimiter] = None
+_limit = 0
+_active = 0
+_waiting = 0
 
-def configure_llm_concurrency(limit: int) -> None:
-    """Set a global concurrency limit for async LLM calls."""
-    global _llm_semaphore
-    if limit and limit > 0:
-        _llm_semaphore = asyncio.Semaphore(limit)
+
+def configure_llm_concurrency(limit: int, tenant_cap: int = TENANT_MAX_CONCURRENCY) -> None:
+    """
+    Set a global concurrency limit for async LLM calls (0 = unlimited) and a cap on
+    any one tenant's calls across all providers (0 = no cap).
+    """
+    global _global_limiter, _limit
+    _limit = limit if limit and limit > 0 else 0
+    if _limit or tenant_cap > 0:
+        _global_limiter = FairLimiter(
+            "global",
+            _limit or float("inf"),
+            tenant_cap=tenant_cap,
+            weights=parse_weights(TENANT_WEIGHTS),
+        )
     else:
-        _llm_semaphore = None
+        _global_limiter = None
+
+
+def limiter_stats() -> dict:
+    """
+    Current global limit (0 = unlimited), calls holding a slot and calls queued for
+    one, per-tenant state of the global queue, plus each provider's adaptive limiter
+    state.
+    """
+    return {
+        "limit": _limit,
+        "active": _active,
+        "waiting": _waiting,
+        "tenants": _global_limiter.snapshot()["tenants"] if _global_limiter is not None else {},
+        "providers": {name: limiter.snapshot() for name, limiter in adaptive_limiters().items()},
+    }
 
 
 @asynccontextmanager
-async def llm_concurrency() -> AsyncIterator[None]:
-    """Async context manager that enforces the configured concurrency limit."""
-    if _llm_semaphore is None:
-        yield
-        return
-    async with _llm_semaphore:
+async def llm_concurrency(provider: Optional[str] = None) -> AsyncIterator[None]:
+    """
+    Async context manager that enforces the concurrency limits for one call.
+
+    With a provider, the call first takes a slot from that provider's adaptive
+    limiter, then one from the global limit; both queues are scheduled by the
+    call's tenant and priority (see ``scheduling.call_tag``). The body's outcome
+    (success, 429 or timeout, other error) and latency are fed back to the adaptive
+    limiter; cancellation gives the slots back without a verdict.
+    """
+    global _active, _waiting
+    adaptive = get_adaptive_limiter(provider)
+    shared = _global_limiter
+    tag = current_tag()
+    _waiting += 1
+    try:
+        if adaptive is not None:
+            await adaptive.acquire(tag)
+        try:
+            if shared is not None:
+                await shared.acquire(tag)
+        except BaseException:
+            if adaptive is not None:
+                adaptive.release(tag)
+            raise
+    finally:
+        _waiting -= 1
+
+    _active += 1
+    started = time.monotonic()
+    try:
         yield
+    except Exception as exc:
+        if adaptive is not None:
+            adaptive.record("overload" if is_overload(exc) else "error")
+        raise
+    else:
+        if adaptive is not None:
+            adaptive.record("ok", time.monotonic() - started)
+    finally:
+        _active -= 1
+        if shared is not None:
+            shared.release(tag)
+        if adaptive is not None:
+            adaptive.release(tag)
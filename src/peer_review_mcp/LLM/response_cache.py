@@ -0,0 +1,74 @@
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from pydantic import BaseModel
+
+from peer_review_mcp import metrics
+from peer_review_mcp.cache.backend import CacheBackend, get_cache_backend
+from peer_review_mcp.config import LLM_RESPONSE_CACHE, LLM_RESPONSE_CACHE_TTL_S
+from peer_review_mcp.models.structured_output import json_schema
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:  # Exact-prompt cache of raw LLM responses, stored in the shared cache backend
+    """
+    Caches response text by provider, model, response schema and prompt.
+
+    With the SQLite backend the cache is shared by every server process on the
+    host, so identical prompts issued from different MCP clients hit the provider once.
+    """
+
+    NAMESPACE = "llm"
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_s: float = LLM_RESPONSE_CACHE_TTL_S):
+        self.backend = backend or get_cache_backend()
+        self.ttl_s = ttl_s
+
+    @staticmethod
+    def key(provider: str, model: str, prompt: str, schema: Optional[type[BaseModel]] = None) -> str:
+        schema_id = None
+        if schema is not None:
+            schema_id = [schema.__name__, json_schema(schema)]
+        material = json.dumps([provider, model, schema_id, prompt], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        metrics.increment("cache.llm.lookups")
+        try:
+            value = await self.backend.aget(self.NAMESPACE, key)
+        except Exception:
+            logger.exception("LLM response cache read failed")
+            return None
+        if isinstance(value, str):
+            metrics.increment("cache.llm.hits")
+            return value
+        return None
+
+    async def set(self, key: str, text: str) -> None:
+        try:
+            await self.backend.aset(self.NAMESPACE, key, text, ttl_s=self.ttl_s)
+        except Exception:
+            logger.exception("LLM response cache write failed")
+
+
+_response_cache: Optional[ResponseCache] = None
+_configured = False
+
+
+def configure_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Install (or, with None, disable) the process-wide LLM response cache."""
+    global _response_cache, _configured
+    _response_cache = cache
+    _configured = True
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the response cache, created from LLM_RESPONSE_CACHE on first use."""
+    global _response_cache, _configured
+    if not _configured:
+        _response_cache = ResponseCache() if LLM_RESPONSE_CACHE else None
+        _configured = True
+    return _response_cache
@@ -0,0 +1,91 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from .gemini_client import GeminiClient
+from .claude_client import ClaudeClient
+from .chatgpt_client import ChatGPTClient
+from ..config import (
+    MODEL_LADDER_VALIDATION,
+    MODEL_LADDER_SYNTHESIS,
+    MODEL_LADDER_POLISH,
+)
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = {
+    "gemini": GeminiClient,
+    "openai": ChatGPTClient,
+    "claude": ClaudeClient,
+}
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    provider: str
+    model: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+def parse_ladder(spec: str) -> list[ModelTier]:
+    """
+    Parse a ladder spec such as ``"gemini:models/gemini-flash-latest,openai:gpt-4o"``.
+
+    Entries with unknown providers are skipped with a warning.
+    """
+    tiers: list[ModelTier] = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        provider, sep, model = entry.partition(":")
+        provider = provider.strip().lower()
+        if not sep or provider not in PROVIDERS or not model.strip():
+            logger.warning("Ignoring invalid model tier %r", entry)
+            continue
+        tiers.append(ModelTier(provider=provider, model=model.strip()))
+    return tiers
+
+
+class ModelRouter:  # Maps (phase, tier) to an LLM client according to per-phase model ladders
+    """
+    Per-phase model ladders, cheapest/fastest tier first.
+
+    Phases: "validation", "synthesis", "polish". Tier indexes past the end of a
+    ladder are clamped to its strongest tier, so callers can escalate blindly.
+    """
+
+    def __init__(self, ladders: Optional[dict[str, list[ModelTier]]] = None):
+        self.ladders = ladders or {
+            "validation": parse_ladder(MODEL_LADDER_VALIDATION),
+            "synthesis": parse_ladder(MODEL_LADDER_SYNTHESIS),
+            "polish": parse_ladder(MODEL_LADDER_POLISH),
+        }
+        for phase, ladder in self.ladders.items():
+            if not ladder:
+                raise ValueError(f"Model ladder for phase {phase!r} is empty")
+
+    def max_tier(self, phase: str) -> int:
+        return len(self.ladders[phase]) - 1
+
+    def tier(self, phase: str, index: int = 0) -> ModelTier:
+        ladder = self.ladders[phase]
+        return ladder[max(0, min(index, len(ladder) - 1))]
+
+    def client(self, phase: str, index: int = 0):
+        tier = self.tier(phase, index)
+        return PROVIDERS[tier.provider](model=tier.model)
+
+
+_default_router: Optional[ModelRouter] = None
+
+
+def get_router() -> ModelRouter:
+    """Return the process-wide router built from configuration."""
+    global _default_router
+    if _default_router is None:
+        _default_router = ModelRouter()
+    return _default_router
@@ -0,0 +1,246 @@
+import contextvars
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Literal, Optional
+
+import anyio
+
+from peer_review_mcp import metrics
+
+logger = logging.getLogger(__name__)
+
+Priority = Literal["interactive", "batch"]
+PRIORITIES: tuple[Priority, ...] = ("interactive", "batch")  # strict order: earlier classes go first
+DEFAULT_TENANT = "default"
+
+
+@dataclass(frozen=True, slots=True)
+class CallTag:
+    """Who an LLM call is made for: the tenant it is charged to and its priority class."""
+
+    tenant: str = DEFAULT_TENANT
+    priority: Priority = "interactive"
+
+    def __post_init__(self):
+        if self.priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {self.priority!r}; expected one of {', '.join(PRIORITIES)}")
+
+
+_current_tag: contextvars.ContextVar[CallTag] = contextvars.ContextVar("llm_call_tag", default=CallTag())
+
+
+def current_tag() -> CallTag:
+    """Tag of the LLM calls made from the current context."""
+    return _current_tag.get()
+
+
+@contextmanager
+def call_tag(tenant: Optional[str] = None, priority: Optional[str] = None) -> Iterator[CallTag]:
+    """
+    Tag every LLM call made in this context, including from tasks started inside it.
+
+    Unset fields default to the default tenant and interactive priority; an unknown
+    priority raises ValueError.
+    """
+    tag = CallTag(
+        tenant=(tenant or "").strip() or DEFAULT_TENANT,
+        priority=(priority or "interactive").strip().lower(),
+    )
+    token = _current_tag.set(tag)
+    try:
+        yield tag
+    finally:
+        _current_tag.reset(token)
+
+
+def parse_weights(spec: str) -> dict[str, float]:
+    """
+    Parse a weight spec such as ``"ui=4,nightly-batch=1"``.
+
+    Entries without a positive numeric weight are skipped with a warning.
+    """
+    weights: dict[str, float] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        tenant, sep, value = entry.partition("=")
+        try:
+            weight = float(value)
+        except ValueError:
+            weight = 0.0
+        if not sep or not tenant.strip() or weight <= 0:
+            logger.warning("Ignoring invalid tenant weight %r", entry)
+            continue
+        weights[tenant.strip()] = weight
+    return weights
+
+
+class _Waiter:
+    __slots__ = ("tag", "finish", "enqueued", "event")
+
+    def __init__(self, tag: CallTag, finish: float, enqueued: float):
+        self.tag = tag
+        self.finish = finish
+        self.enqueued = enqueued
+        self.event = anyio.Event()
+
+
+class FairLimiter:  # Concurrency limit shared fairly between tenants, interactive calls first
+    """
+    Concurrency limit whose free slots are scheduled between tagged callers.
+
+    A released slot goes to a waiting interactive call if there is one, and to a
+    batch call only otherwise (strict priority). Within a priority class, tenants
+    share slots by self-clocked weighted fair queuing: a queued call finishes, in
+    virtual time, ``1 / weight`` after the later of its tenant's previous call and
+    the finish time of the last call served, and the earliest finish goes first, so
+    backlogged tenants get slots in proportion to their weights however many calls
+    each one queues. A tenant already holding ``tenant_cap`` slots is passed over.
+
+    Time spent queued is recorded per priority and per tenant. Events are created
+    per wait, so the limiter is not bound to the event loop it was created in.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: float,
+        tenant_cap: int = 0,
+        weights: Optional[dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.limit = float(limit)
+        self.tenant_cap = max(0, tenant_cap)
+        self.weights = dict(weights or {})
+        self._clock = clock
+        self.inflight = 0
+        self.inflight_by_tenant: dict[str, int] = {}
+        self._queues: dict[str, dict[str, deque[_Waiter]]] = {p: {} for p in PRIORITIES}
+        self._virtual_time = dict.fromkeys(PRIORITIES, 0.0)
+        self._last_finish: dict[tuple[str, str], float] = {}
+        self._queue_time: dict[str, list[float]] = {}  # tenant -> [calls, seconds queued]
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(q) for queues in self._queues.values() for q in queues.values())
+
+    async def acquire(self, tag: Optional[CallTag] = None) -> None:
+        tag = tag or current_tag()
+        if not self.waiting and self._has_room(tag.tenant):
+            self._grant(tag, 0.0)
+            self._publish()
+            return
+        waiter = self._enqueue(tag)
+        try:
+            await waiter.event.wait()
+        except BaseException:
+            if waiter.event.is_set():
+                self.release(tag)  # the slot was handed over while being cancelled; pass it on
+            else:
+                self._remove(waiter)
+            raise
+        finally:
+            self._publish()
+
+    def release(self, tag: Optional[CallTag] = None) -> None:
+        tenant = (tag or current_tag()).tenant
+        self.inflight -= 1
+        held = self.inflight_by_tenant.get(tenant, 0) - 1
+        if held > 0:
+            self.inflight_by_tenant[tenant] = held
+        else:
+            self.inflight_by_tenant.pop(tenant, None)
+        self._dispatch()
+
+    def snapshot(self) -> dict:
+        tenants = {}
+        for tenant in set(self.inflight_by_tenant) | set(self._queue_time) | {
+            t for queues in self._queues.values() for t in queues
+        }:
+            calls, seconds = self._queue_time.get(tenant, (0, 0.0))
+            tenants[tenant] = {
+                "inflight": self.inflight_by_tenant.get(tenant, 0),
+                "waiting": sum(len(queues.get(tenant, ())) for queues in self._queues.values()),
+                "queue_s_mean": round(seconds / calls, 4) if calls else 0.0,
+            }
+        return {
+            "limit": round(self.limit, 2),
+            "inflight": self.inflight,
+            "waiting": self.waiting,
+            "tenants": tenants,
+        }
+
+    def _has_room(self, tenant: str) -> bool:
+        if self.inflight + 1 > self.limit:
+            return False
+        return not self.tenant_cap or self.inflight_by_tenant.get(tenant, 0) < self.tenant_cap
+
+    def _enqueue(self, tag: CallTag) -> _Waiter:
+        key = (tag.priority, tag.tenant)
+        start = max(self._virtual_time[tag.priority], self._last_finish.get(key, 0.0))
+        finish = start + 1 / self.weights.get(tag.tenant, 1.0)
+        self._last_finish[key] = finish
+        waiter = _Waiter(tag, finish, self._clock())
+        self._queues[tag.priority].setdefault(tag.tenant, deque()).append(waiter)
+        self._dispatch()
+        return waiter
+
+    def _next(self) -> Optional[_Waiter]:
+        for priority in PRIORITIES:
+            queues = self._queues[priority]
+            best = None
+            for tenant, queue in queues.items():
+                if self._has_room(tenant) and (best is None or queue[0].finish < best[0].finish):
+                    best = queue
+            if best is not None:
+                waiter = best.popleft()
+                self._virtual_time[priority] = max(self._virtual_time[priority], waiter.finish)
+                if not best:
+                    self._forget(priority, waiter.tag.tenant)
+                return waiter
+        return None
+
+    def _remove(self, waiter: _Waiter) -> None:
+        priority, tenant = waiter.tag.priority, waiter.tag.tenant
+        queue = self._queues[priority].get(tenant)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                self._forget(priority, tenant)
+
+    def _forget(self, priority: str, tenant: str) -> None:
+        # An idle tenant keeps its finish time only while it is ahead of virtual time,
+        # so it cannot save up credit by staying idle and state stays bounded.
+        del self._queues[priority][tenant]
+        if self._last_finish.get((priority, tenant), 0.0) <= self._virtual_time[priority]:
+            self._last_finish.pop((priority, tenant), None)
+
+    def _grant(self, tag: CallTag, waited_s: float) -> None:
+        self.inflight += 1
+        self.inflight_by_tenant[tag.tenant] = self.inflight_by_tenant.get(tag.tenant, 0) + 1
+        stats = self._queue_time.setdefault(tag.tenant, [0, 0.0])
+        stats[0] += 1
+        stats[1] += waited_s
+        metrics.increment(f"limiter.{self.name}.calls.{tag.priority}")
+        metrics.increment(f"limiter.{self.name}.queue_s.{tag.priority}", waited_s)
+        metrics.increment(f"limiter.{self.name}.tenant.{tag.tenant}.queue_s", waited_s)
+
+    def _dispatch(self) -> None:
+        # A grown limit or a freed tenant slot may admit several waiters at once.
+        while self.inflight + 1 <= self.limit:
+            waiter = self._next()
+            if waiter is None:
+                break
+            self._grant(waiter.tag, self._clock() - waiter.enqueued)
+            waiter.event.set()
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge(f"limiter.{self.name}.inflight", self.inflight)
+        for priority, queues in self._queues.items():
+            metrics.set_gauge(f"limiter.{self.name}.waiting.{priority}", sum(len(q) for q in queues.values()))
@@ -0,0 +1,29 @@
+import logging
+
+from pydantic import BaseModel
+
+from ..config import LLM_STRUCTURED_OUTPUT
+
+logger = logging.getLogger(__name__)
+
+
+async def generate_structured(client, prompt: str, schema: type[BaseModel]) -> str:
+    """
+    Generate a response constrained to ``schema`` when the client supports it.
+
+    Clients exposing ``generate_json_async`` use provider-native structured output
+    (OpenAI JSON schema, Gemini response schema, Anthropic tool use). Other clients,
+    or deployments with LLM_STRUCTURED_OUTPUT disabled, fall back to plain text
+    generation and rely on heuristic JSON parsing.
+
+    Args:
+        client: Any LLM client with ``generate_async``.
+        prompt: The input prompt.
+        schema: Pydantic model describing the expected JSON object.
+
+    Returns:
+        The raw response text (a JSON document when structured output was used).
+    """
+    if LLM_STRUCTURED_OUTPUT and hasattr(client, "generate_json_async"):
+        return await client.generate_json_async(prompt, schema)
+    return await client.generate_async(prompt)
@@ -0,0 +1,37 @@
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from peer_review_mcp import metrics
+
+_usage: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("llm_usage", default=None)
+
+
+def report_usage(provider: str, input_tokens: Optional[int], output_tokens: Optional[int]) -> None:
+    """
+    Report the token counts of one provider response (called by the clients' ``send``).
+
+    Counts are added to the ``llm.<provider>.input_tokens`` / ``.output_tokens``
+    counters and handed to an enclosing ``capture_usage`` block, if any. Missing
+    counts (responses without usage data) are ignored.
+    """
+    input_tokens = input_tokens if isinstance(input_tokens, int) else None
+    output_tokens = output_tokens if isinstance(output_tokens, int) else None
+    if input_tokens is not None:
+        metrics.increment(f"llm.{provider}.input_tokens", input_tokens)
+    if output_tokens is not None:
+        metrics.increment(f"llm.{provider}.output_tokens", output_tokens)
+    captured = _usage.get()
+    if captured is not None:
+        captured.update(input_tokens=input_tokens, output_tokens=output_tokens)
+
+
+@contextmanager
+def capture_usage() -> Iterator[dict]:
+    """Collect the token counts reported inside the block into the yielded dict."""
+    captured: dict = {}
+    token = _usage.set(captured)
+    try:
+        yield captured
+    finally:
+        _usage.reset(token)
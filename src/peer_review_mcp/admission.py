@@ -0,0 +1,142 @@
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Literal, Optional
+
+import anyio
+
+from peer_review_mcp import metrics
+from peer_review_mcp.config import (
+    ADMISSION_MAX_CONCURRENT,
+    ADMISSION_MAX_QUEUE,
+    ADMISSION_INITIAL_LATENCY_S,
+)
+
+logger = logging.getLogger(__name__)
+
+Mode = Literal["full", "degraded"]
+
+# Degraded requests skip Phase B and run one reviewer; until measured, assume this share of a full request.
+_DEGRADED_COST_RATIO = 0.5
+
+
+@dataclass
+class AdmissionDecision:
+    action: Literal["admit", "reject"]
+    mode: Mode
+    estimated_wait_s: float
+    reason: str
+
+
+class AdmissionController:  # Bounded request queue with latency-based load shedding
+    """
+    Admission control for tool calls.
+
+    At most ``max_concurrent`` requests run at once and at most ``max_queue`` wait
+    for a slot; requests beyond that are rejected immediately. Queue time is
+    estimated from an exponentially weighted moving average of recent request
+    latency per mode. When a caller passes a time budget and the estimated wait plus
+    a full run would exceed it, the request is admitted in degraded mode if that
+    fits, otherwise rejected, so no LLM calls are spent on results nobody reads.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = ADMISSION_MAX_CONCURRENT,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        initial_latency_s: float = ADMISSION_INITIAL_LATENCY_S,
+        alpha: float = 0.2,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.alpha = alpha
+        self.latency_s: dict[str, float] = {
+            "full": initial_latency_s,
+            "degraded": initial_latency_s * _DEGRADED_COST_RATIO,
+        }
+        self.active = 0
+        # FIFO of waiters; a released slot is handed straight to the oldest one. Events are
+        # created per wait, so the controller is not bound to the event loop it was built in.
+        self._waiters: deque[anyio.Event] = deque()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrent > 0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def estimate_wait_s(self) -> float:
+        """Expected time until a new request gets a slot."""
+        if not self.enabled or self.active + self.waiting < self.max_concurrent:
+            return 0.0
+        # Requests ahead of this one drain max_concurrent at a time.
+        ahead = self.active + self.waiting - self.max_concurrent + 1
+        return ahead / self.max_concurrent * self.latency_s["full"]
+
+    def admit(self, budget_s: Optional[float] = None) -> AdmissionDecision:
+        """Decide whether (and how) to run a request with the caller's time budget."""
+        if not self.enabled:
+            return AdmissionDecision("admit", "full", 0.0, "admission_disabled")
+        wait = round(self.estimate_wait_s(), 3)
+        if self.active + self.waiting >= self.max_concurrent and self.waiting >= self.max_queue:
+            metrics.increment("admission.rejected")
+            return AdmissionDecision("reject", "full", wait, "queue_full")
+        if budget_s is None or budget_s <= 0 or wait + self.latency_s["full"] <= budget_s:
+            metrics.increment("admission.admitted")
+            return AdmissionDecision("admit", "full", wait, "within_budget")
+        if wait + self.latency_s["degraded"] <= budget_s:
+            metrics.increment("admission.degraded")
+            return AdmissionDecision("admit", "degraded", wait, "over_budget_degraded")
+        metrics.increment("admission.rejected")
+        return AdmissionDecision("reject", "full", wait, "over_budget")
+
+    @asynccontextmanager
+    async def slot(self, mode: Mode = "full") -> AsyncIterator[None]:
+        """Hold a request slot; completed requests update the latency estimate."""
+        if not self.enabled:
+            yield
+            return
+        await self._acquire()
+        t0 = time.monotonic()
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            self._release()
+            # Cancelled or failed requests say little about service time.
+            if completed:
+                self._observe(mode, time.monotonic() - t0)
+
+    async def _acquire(self) -> None:
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            metrics.set_gauge("admission.active", self.active)
+            return
+        event = anyio.Event()
+        self._waiters.append(event)
+        metrics.set_gauge("admission.waiting", self.waiting)
+        try:
+            await event.wait()
+        except BaseException:
+            if event in self._waiters:
+                self._waiters.remove(event)
+            else:
+                self._release()  # the slot was handed over while being cancelled; pass it on
+            raise
+        finally:
+            metrics.set_gauge("admission.waiting", self.waiting)
+
+    def _release(self) -> None:
+        if self._waiters:
+            self._waiters.popleft().set()  # slot stays counted as active for the next request
+        else:
+            self.active -= 1
+        metrics.set_gauge("admission.active", self.active)
+
+    def _observe(self, mode: Mode, elapsed_s: float) -> None:
+        self.latency_s[mode] = (1 - self.alpha) * self.latency_s[mode] + self.alpha * elapsed_s
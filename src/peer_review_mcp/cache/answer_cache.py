@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from peer_review_mcp import metrics
+from peer_review_mcp.cache.backend import CacheBackend, get_cache_backend
+from peer_review_mcp.cache.embedding import normalize_text, text_hash
+from peer_review_mcp.config import (
+    ANSWER_CACHE_TTL_S,
+    ANSWER_CACHE_STALE_S,
+    ANSWER_CACHE_POPULAR_HITS,
+    ANSWER_CACHE_POPULAR_WINDOW_S,
+    ANSWER_CACHE_REFRESH_AHEAD,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedAnswer:
+    value: dict
+    age_s: float
+    stale: bool  # past the TTL, served within the stale window
+    refresh: bool  # the caller should refresh the entry in the background
+
+
+class _Popularity:  # Hit counts per key over a tumbling window, bounded in size
+    def __init__(self, window_s: float, max_keys: int = 4096):
+        self.window_s = window_s
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._hits: "OrderedDict[str, tuple[float, int]]" = OrderedDict()  # key -> (window start, hits)
+
+    def hit(self, key: str, now: float) -> int:
+        with self._lock:
+            start, hits = self._hits.get(key, (now, 0))
+            if now - start > self.window_s:
+                start, hits = now, 0
+            self._hits[key] = (start, hits + 1)
+            self._hits.move_to_end(key)
+            while len(self._hits) > self.max_keys:
+                self._hits.popitem(last=False)
+            return hits + 1
+
+
+class AnswerCache:  # Exact question + context cache of final orchestrator results
+    """
+    Returns the stored result for a repeated question with the same context summary.
+
+    Questions are compared after normalization (case, whitespace, punctuation).
+    Results live in the shared cache backend, so with the SQLite backend an answer
+    produced by one server process is served by every other process on the host.
+
+    With ``stale_s`` set, entries outlive their TTL by that long and are returned
+    as stale, flagged for a background refresh (stale-while-revalidate). Keys hit
+    at least ``popular_hits`` times within ``popular_window_s`` are flagged once
+    ``refresh_ahead`` of their TTL has passed, so hot answers are refreshed before
+    they ever go stale.
+    """
+
+    NAMESPACE = "answers"
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl_s: float = ANSWER_CACHE_TTL_S,
+        stale_s: float = ANSWER_CACHE_STALE_S,
+        popular_hits: int = ANSWER_CACHE_POPULAR_HITS,
+        popular_window_s: float = ANSWER_CACHE_POPULAR_WINDOW_S,
+        refresh_ahead: float = ANSWER_CACHE_REFRESH_AHEAD,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend or get_cache_backend()
+        self.ttl_s = ttl_s
+        self.stale_s = max(0.0, stale_s) if ttl_s else 0.0
+        self.popular_hits = popular_hits
+        self.refresh_ahead = refresh_ahead
+        self._clock = clock
+        self._popularity = _Popularity(popular_window_s)
+
+    @property
+    def revalidates(self) -> bool:
+        """Whether lookups can ask for background refreshes."""
+        return bool(self.ttl_s) and (self.stale_s > 0 or self.popular_hits > 0)
+
+    @staticmethod
+    def key(question: str, context_summary: Optional[str] = None) -> str:
+        material = normalize_text(question) + "\x00" + text_hash(context_summary)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def lookup(self, question: str, context_summary: Optional[str] = None) -> Optional[dict]:
+        entry = self.lookup_entry(question, context_summary)
+        return entry.value if entry is not None else None
+
+    def lookup_entry(self, question: str, context_summary: Optional[str] = None) -> Optional[CachedAnswer]:
+        metrics.increment("cache.answer.lookups")
+        key = self.key(question, context_summary)
+        try:
+            stored = self.backend.get(self.NAMESPACE, key)
+        except Exception:
+            logger.exception("Answer cache read failed")
+            return None
+        return self._entry(key, stored)
+
+    async def alookup_entry(self, question: str, context_summary: Optional[str] = None) -> Optional[CachedAnswer]:
+        """``lookup_entry`` for the event loop: a blocking backend is read from a worker thread."""
+        metrics.increment("cache.answer.lookups")
+        key = self.key(question, context_summary)
+        try:
+            stored = await self.backend.aget(self.NAMESPACE, key)
+        except Exception:
+            logger.exception("Answer cache read failed")
+            return None
+        return self._entry(key, stored)
+
+    def _entry(self, key: str, stored) -> Optional[CachedAnswer]:
+        if not isinstance(stored, dict):
+            return None
+
+        now = self._clock()
+        if "stored_at" in stored and isinstance(stored.get("value"), dict):
+            value, age = stored["value"], max(0.0, now - stored["stored_at"])
+        else:
+            value, age = stored, 0.0  # written without an envelope: treat as fresh
+        stale = bool(self.ttl_s) and age >= self.ttl_s
+        if stale and age >= self.ttl_s + self.stale_s:
+            return None  # the backend TTL is coarser than the clock
+        hits = self._popularity.hit(key, now)
+
+        refresh = stale
+        if not stale and self.popular_hits and self.ttl_s:
+            refresh = hits >= self.popular_hits and age >= self.ttl_s * self.refresh_ahead
+        metrics.increment("cache.answer.hits")
+        if stale:
+            metrics.increment("cache.answer.stale_hits")
+        return CachedAnswer(value=value, age_s=age, stale=stale, refresh=refresh)
+
+    def store(self, question: str, context_summary: Optional[str], value: dict) -> None:
+        try:
+            self.backend.set(self.NAMESPACE, self.key(question, context_summary), *self._envelope(value))
+        except Exception:
+            logger.exception("Answer cache write failed")
+
+    async def astore(self, question: str, context_summary: Optional[str], value: dict) -> None:
+        try:
+            await self.backend.aset(self.NAMESPACE, self.key(question, context_summary), *self._envelope(value))
+        except Exception:
+            logger.exception("Answer cache write failed")
+
+    def _envelope(self, value: dict) -> tuple[dict, Optional[float]]:
+        """The stored entry and its backend TTL, which covers the stale window."""
+        return {"stored_at": self._clock(), "value": value}, (self.ttl_s + self.stale_s if self.ttl_s else None)
+
+    def hit_rate(self) -> float:
+        return metrics.ratio("cache.answer.hits", "cache.answer.lookups")
+
+    def stale_rate(self) -> float:
+        """Share of hits served stale."""
+        return metrics.ratio("cache.answer.stale_hits", "cache.answer.hits")
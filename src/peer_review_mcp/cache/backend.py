@@ -0,0 +1,125 @@
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import anyio
+
+from peer_review_mcp.config import CACHE_BACKEND, CACHE_PATH, CACHE_MAX_BYTES, CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):  # Storage interface shared by the LLM response cache and the orchestrator caches
+    """
+    Namespaced key/value store for JSON-serializable values.
+
+    Namespaces separate users of one backend (e.g. "llm", "answers", "semantic").
+
+    Code running on the event loop uses the ``a*`` methods: for a ``blocking``
+    backend (one doing file or network I/O) they run the call in a worker thread,
+    so a slow or locked store never stalls other requests.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl_s`` of None means no expiry."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove the key if present."""
+
+    @abstractmethod
+    def items(self, namespace: str, since: float = 0.0) -> list[tuple[str, Any, float]]:
+        """Return live ``(key, value, created_at)`` entries created after ``since``, oldest first."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+    async def aget(self, namespace: str, key: str) -> Optional[Any]:
+        return await self._call(self.get, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        await self._call(self.set, namespace, key, value, ttl_s)
+
+    async def aitems(self, namespace: str, since: float = 0.0) -> list[tuple[str, Any, float]]:
+        return await self._call(self.items, namespace, since)
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self.blocking:
+            return fn(*args)
+        return await anyio.to_thread.run_sync(fn, *args)
+
+
+class MemoryCacheBackend(CacheBackend):  # In-process LRU backend (default; not shared between processes)
+    """Values are kept JSON-encoded, so callers get independent copies as with SQLite."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (namespace, key) -> (encoded value, created_at, expires_at)
+        self._data: "OrderedDict[tuple[str, str], tuple[str, float, Optional[float]]]" = OrderedDict()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get((namespace, key))
+            if entry is None:
+                return None
+            value, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[(namespace, key)]
+                return None
+            self._data.move_to_end((namespace, key))
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            self._data[(namespace, key)] = (payload, now, now + ttl_s if ttl_s else None)
+            self._data.move_to_end((namespace, key))
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._data.pop((namespace, key), None)
+
+    def items(self, namespace: str, since: float = 0.0) -> list[tuple[str, Any, float]]:
+        now = time.time()
+        with self._lock:
+            found = [
+                (key, json.loads(value), created_at)
+                for (ns, key), (value, created_at, expires_at) in self._data.items()
+                if ns == namespace and created_at > since and (expires_at is None or expires_at > now)
+            ]
+        return sorted(found, key=lambda item: item[2])
+
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Return the process-wide backend selected by CACHE_BACKEND ("memory" or "sqlite")."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if CACHE_BACKEND == "sqlite":
+                from peer_review_mcp.cache.sqlite_backend import SQLiteCacheBackend
+
+                _backend = SQLiteCacheBackend(CACHE_PATH, max_bytes=CACHE_MAX_BYTES)
+            else:
+                if CACHE_BACKEND != "memory":
+                    logger.warning("Unknown cache backend %r, using memory", CACHE_BACKEND)
+                _backend = MemoryCacheBackend()
+        return _backend
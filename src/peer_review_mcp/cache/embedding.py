@@ -0,0 +1,101 @@
+import hashlib
+import re
+import zlib
+from typing import Optional
+
+import numpy as np
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_NEGATION_RE = re.compile(r"n['’]t\b", re.IGNORECASE)
+_CLITIC_RE = re.compile(r"(?<=\w)['’][a-z]{1,2}\b", re.IGNORECASE)  # 's, 'd, 'm, 're, 've, 'll
+_SPACE_RE = re.compile(r"\s+")
+_STOPWORDS = frozenset(
+    "a an the and or but if of to in on at by for with about from into as is are was were be been being "
+    "do does did doing can could should would will shall may might must have has had having it its this "
+    "that these those there here what which who whom whose when where why how i me my we our you your "
+    "he she they them their please tell explain describe give show me some any make makes made".split()
+)
+# Words that carry how a question is phrased rather than what it asks.
+_PHRASING = frozenset(
+    "way ways possible possibly proper properly correct correctly right simple simpler simplest simply easy easier "
+    "easily easiest quick quicker quickest quickly go going get able need want know like someone anyone one also just actually really "
+    "basically hi hello thanks thank question wondering try trying help achieve accomplish".split()
+)
+# Relation words stay in the key text so that "int to str" and "str to int" do not look alike.
+_RELATION_WORDS = frozenset("to from in into on at by for with without of as than vs versus not no between".split())
+_FRAMING = (_STOPWORDS - _RELATION_WORDS) | _PHRASING
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    if not text:
+        return ""
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", text.lower())).strip()
+
+
+def text_hash(text: Optional[str]) -> str:
+    """Stable hash of the normalized text (used to gate cache hits on matching context)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def _tokens(text: Optional[str]) -> list[str]:
+    """Normalized tokens, with "n't" spelled "not" and other contraction suffixes ("'s", "'re") dropped."""
+    if not text:
+        return []
+    return normalize_text(_CLITIC_RE.sub("", _NEGATION_RE.sub(" not", text))).split()
+
+
+def _fold(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") else word
+
+
+def content_words(text: Optional[str]) -> frozenset[str]:
+    """Non-stopword tokens with a trailing plural "s" stripped."""
+    return frozenset(_fold(word) for word in _tokens(text) if word not in _STOPWORDS)
+
+
+def key_words(text: Optional[str]) -> frozenset[str]:
+    """Content words that distinguish a question, without phrasing words such as "way" or "simplest"."""
+    return frozenset(word for word in content_words(text) if word not in _PHRASING)
+
+
+def key_text(text: Optional[str]) -> str:
+    """The question reduced to its key words and the relation words between them, in order."""
+    return " ".join(_fold(word) for word in _tokens(text) if word not in _FRAMING)
+
+
+class HashingEmbedder:  # Local text embedding: hashed character n-grams + word unigrams (no network)
+    """
+    Hashing-trick embedding over character n-grams and words.
+
+    Features are hashed with CRC32 (stable across processes) into ``dim`` buckets
+    with a sign bit to reduce collision bias, weighted by sublinear term frequency
+    and L2-normalized so a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim: int = 1024, ngram_range: tuple[int, int] = (3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def _features(self, text: str) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for word in text.split():
+            counts["w:" + word] = counts.get("w:" + word, 0) + 1
+        padded = f" {text} "
+        lo, hi = self.ngram_range
+        for n in range(lo, hi + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i : i + n]
+                counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, count in self._features(normalize_text(text)).items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if h & 0x80000000 else -1.0
+            vector[h % self.dim] += sign * (1.0 + np.log(count))
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
@@ -0,0 +1,263 @@
+import copy
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+import numpy as np
+
+from peer_review_mcp import metrics
+from peer_review_mcp.cache.backend import CacheBackend
+from peer_review_mcp.cache.embedding import HashingEmbedder, key_text, key_words, text_hash
+from peer_review_mcp.config import (
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_TTL_S,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RandomProjectionLSH:  # In-process approximate nearest-neighbour index for cosine similarity
+    """
+    Random-hyperplane LSH.
+
+    Each of ``num_tables`` tables hashes a vector to ``num_bits`` sign bits; vectors
+    sharing a bucket in any table are candidates. With 16 tables of 8 bits a pair
+    with cosine 0.9 collides in at least one table with probability > 0.99.
+    """
+
+    def __init__(self, dim: int, num_tables: int = 16, num_bits: int = 8, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((num_tables, num_bits, dim)).astype(np.float32)
+        self._powers = (1 << np.arange(num_bits)).astype(np.int64)
+        self._tables: list[dict[int, set[Hashable]]] = [{} for _ in range(num_tables)]
+        self._signatures: dict[Hashable, np.ndarray] = {}
+
+    def _signature(self, vector: np.ndarray) -> np.ndarray:
+        bits = (self._planes @ vector) > 0  # (tables, bits)
+        return bits.astype(np.int64) @ self._powers
+
+    def add(self, key: Hashable, vector: np.ndarray) -> None:
+        signature = self._signature(vector)
+        self._signatures[key] = signature
+        for table, bucket in zip(self._tables, signature):
+            table.setdefault(int(bucket), set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for table, bucket in zip(self._tables, signature):
+            members = table.get(int(bucket))
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del table[int(bucket)]
+
+    def candidates(self, vector: np.ndarray) -> set[Hashable]:
+        found: set[Hashable] = set()
+        for table, bucket in zip(self._tables, self._signature(vector)):
+            found.update(table.get(int(bucket), ()))
+        return found
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+@dataclass
+class CacheEntry:
+    question: str
+    context_hash: str
+    vector: np.ndarray
+    words: frozenset[str]
+    value: dict
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class CacheHit:
+    value: dict
+    similarity: float
+    matched_question: str
+
+
+class SemanticCache:  # Near-duplicate question cache in front of the orchestrator
+    """
+    Returns a cached answer for a paraphrased repeat of an earlier question.
+
+    A hit requires the same normalized context summary, a cosine similarity of
+    at least ``threshold`` between the embeddings of the questions' key text (key
+    words and the relation words between them, without question forms and phrasing
+    such as "what is the way to"), and the same set of key words. Character n-grams
+    alone rate "capital of France" and "capital of Spain" as close, so the word
+    check keeps entity changes from being served stale answers, while rephrasings
+    ("How do I reverse lists in Python?", "What's the way to reverse a list in
+    Python?") still match.
+    Entries expire after ``ttl_s`` and the least recently used entries are evicted
+    above ``max_entries``.
+
+    With a ``backend`` every stored entry is also written to the shared cache, and
+    entries written by other processes are pulled in at most every
+    ``sync_interval_s`` seconds. Only questions and answers are persisted; vectors
+    are recomputed locally since the embedder is deterministic.
+    """
+
+    NAMESPACE = "semantic"
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_s: float = SEMANTIC_CACHE_TTL_S,
+        embedder: Optional[HashingEmbedder] = None,
+        backend: Optional[CacheBackend] = None,
+        sync_interval_s: float = 5.0,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.embedder = embedder or HashingEmbedder()
+        self.index = RandomProjectionLSH(self.embedder.dim)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.backend = backend
+        self.sync_interval_s = sync_interval_s
+        self._synced_at = 0.0  # created_at of the newest backend entry seen
+        self._last_sync = 0.0
+        if backend is not None:
+            self._sync(force=True)
+
+    def lookup(self, question: str, context_summary: Optional[str] = None) -> Optional[CacheHit]:
+        self._sync()
+        return self._lookup(question, context_summary)
+
+    async def alookup(self, question: str, context_summary: Optional[str] = None) -> Optional[CacheHit]:
+        """``lookup`` for the event loop: a blocking backend is synced from a worker thread."""
+        await self._async_sync()
+        return self._lookup(question, context_summary)
+
+    def _lookup(self, question: str, context_summary: Optional[str]) -> Optional[CacheHit]:
+        metrics.increment("cache.semantic.lookups")
+        vector = self._embed(question)
+        words = key_words(question)
+        context_hash = text_hash(context_summary)
+        now = time.time()
+
+        best_id, best_similarity = None, -1.0
+        for entry_id in self.index.candidates(vector):
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            if now - entry.created_at > self.ttl_s:
+                self._evict(entry_id)
+                continue
+            if entry.context_hash != context_hash or entry.words != words:
+                continue
+            similarity = float(vector @ entry.vector)
+            if similarity > best_similarity:
+                best_id, best_similarity = entry_id, similarity
+
+        if best_id is None or best_similarity < self.threshold:
+            return None
+
+        self._entries.move_to_end(best_id)
+        entry = self._entries[best_id]
+        metrics.increment("cache.semantic.hits")
+        return CacheHit(
+            value=copy.deepcopy(entry.value),
+            similarity=round(best_similarity, 4),
+            matched_question=entry.question,
+        )
+
+    def store(self, question: str, context_summary: Optional[str], value: dict) -> None:
+        entry_id, data = self._store_local(question, context_summary, value)
+        if self.backend is not None:
+            try:
+                self.backend.set(self.NAMESPACE, entry_id, data, ttl_s=self.ttl_s)
+            except Exception:
+                logger.exception("Failed to persist semantic cache entry")
+
+    async def astore(self, question: str, context_summary: Optional[str], value: dict) -> None:
+        entry_id, data = self._store_local(question, context_summary, value)
+        if self.backend is not None:
+            try:
+                await self.backend.aset(self.NAMESPACE, entry_id, data, ttl_s=self.ttl_s)
+            except Exception:
+                logger.exception("Failed to persist semantic cache entry")
+
+    def _store_local(self, question: str, context_summary: Optional[str], value: dict) -> tuple[str, dict]:
+        """Add the entry to the local index; returns its id and what to persist."""
+        entry_id = uuid.uuid4().hex
+        context_hash = text_hash(context_summary)
+        self._add(entry_id, question, context_hash, copy.deepcopy(value), time.time())
+        return entry_id, {"question": question, "context_hash": context_hash, "value": value}
+
+    def hit_rate(self) -> float:
+        return metrics.ratio("cache.semantic.hits", "cache.semantic.lookups")
+
+    def _add(self, entry_id: str, question: str, context_hash: str, value: dict, created_at: float) -> None:
+        entry = CacheEntry(
+            question=question,
+            context_hash=context_hash,
+            vector=self._embed(question),
+            words=key_words(question),
+            value=value,
+            created_at=created_at,
+        )
+        self._entries[entry_id] = entry
+        self.index.add(entry_id, entry.vector)
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+        metrics.set_gauge("cache.semantic.entries", len(self._entries))
+
+    def _embed(self, question: str) -> np.ndarray:
+        return self.embedder.embed(key_text(question) or question)
+
+    def _sync(self, force: bool = False) -> None:
+        """Load entries other processes wrote to the backend since the last sync."""
+        if not self._sync_due(force):
+            return
+        try:
+            found = self.backend.items(self.NAMESPACE, since=self._synced_at)
+        except Exception:
+            logger.exception("Failed to load semantic cache entries from backend")
+            return
+        self._load(found)
+
+    async def _async_sync(self) -> None:
+        if not self._sync_due():
+            return
+        try:
+            found = await self.backend.aitems(self.NAMESPACE, since=self._synced_at)
+        except Exception:
+            logger.exception("Failed to load semantic cache entries from backend")
+            return
+        self._load(found)
+
+    def _sync_due(self, force: bool = False) -> bool:
+        if self.backend is None:
+            return False
+        now = time.time()
+        if not force and now - self._last_sync < self.sync_interval_s:
+            return False
+        self._last_sync = now
+        return True
+
+    def _load(self, found: list[tuple[str, object, float]]) -> None:
+        for entry_id, data, created_at in found:
+            self._synced_at = max(self._synced_at, created_at)
+            if entry_id in self._entries or not isinstance(data, dict):
+                continue
+            try:
+                self._add(entry_id, data["question"], data["context_hash"], data["value"], created_at)
+            except (KeyError, TypeError):
+                continue
+
+    def _evict(self, entry_id: str) -> None:
+        self._entries.pop(entry_id, None)
+        self.index.remove(entry_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
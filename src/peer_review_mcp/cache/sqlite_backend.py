@@ -0,0 +1,198 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from peer_review_mcp import metrics
+from peer_review_mcp.cache.backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at);
+CREATE INDEX IF NOT EXISTS cache_entries_created ON cache_entries (namespace, created_at);
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):  # Host-wide cache shared by every server process (one file, WAL mode)
+    """
+    SQLite-backed cache for multi-process deployments.
+
+    MCP stdio starts one server process per client, so in-process caches are
+    duplicated and lost on exit. This backend keeps one database file per host:
+
+    - WAL journaling lets any number of processes read while one writes, and a
+      crash loses at most the uncommitted write, never the file.
+    - Reads go through a memory-mapped view of the database (``mmap_size``).
+    - When the stored values exceed ``max_bytes`` the expired entries, then the
+      least recently accessed ones, are deleted down to ``compact_ratio`` of the
+      limit. Compaction runs in a background thread every ``compact_every``
+      writes, so no write waits for it.
+
+    Values are stored as JSON text. One connection per process is shared across
+    threads under a lock; operations are short single-statement transactions. Calls
+    can wait up to ``busy_timeout_ms`` for another process's write lock, so the
+    backend is ``blocking`` and async callers reach it through the ``a*`` methods.
+    """
+
+    blocking = True
+    ACCESS_RESOLUTION_S = 60.0  # last-access updates are skipped if more recent than this
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        compact_ratio: float = 0.8,
+        compact_every: int = 256,
+        busy_timeout_ms: int = 5000,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_ratio = compact_ratio
+        self.compact_every = compact_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=busy_timeout_ms / 1000, check_same_thread=False, isolation_level=None)
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size = {int(max_bytes)}")
+        self._conn.executescript(_SCHEMA)
+        logger.info("SQLite cache backend opened at %s (max %d bytes)", path, max_bytes)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at, accessed_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+                return None
+            if now - accessed_at > self.ACCESS_RESOLUTION_S:
+                self._conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, namespace, key),
+                )
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.warning("Discarding undecodable cache entry %s/%s", namespace, key)
+            self.delete(namespace, key)
+            return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        payload = json.dumps(value, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, size, created_at, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload), now, now + ttl_s if ttl_s else None, now),
+            )
+            self._writes += 1
+            due = self._writes % self.compact_every == 0
+        if due:
+            self._compact_in_background()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def items(self, namespace: str, since: float = 0.0) -> list[tuple[str, Any, float]]:
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, created_at FROM cache_entries "
+                "WHERE namespace = ? AND created_at > ? AND (expires_at IS NULL OR expires_at > ?) "
+                "ORDER BY created_at",
+                (namespace, since, now),
+            ).fetchall()
+        found = []
+        for key, value, created_at in rows:
+            try:
+                found.append((key, json.loads(value), created_at))
+            except ValueError:
+                continue
+        return found
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+
+    def compact(self) -> int:
+        """Drop expired entries, then least recently accessed ones, until under the size budget."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                removed = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+                ).rowcount
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+                if total > self.max_bytes:
+                    target = int(self.max_bytes * self.compact_ratio)
+                    excess = total - target
+                    # Oldest-accessed rows whose running size covers the excess.
+                    removed += self._conn.execute(
+                        "DELETE FROM cache_entries WHERE (namespace, key) IN ("
+                        "  SELECT namespace, key FROM ("
+                        "    SELECT namespace, key, SUM(size) OVER (ORDER BY accessed_at, created_at"
+                        "      ROWS UNBOUNDED PRECEDING) - size AS before FROM cache_entries"
+                        "  ) WHERE before < ?"
+                        ")",
+                        (excess,),
+                    ).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            if removed:
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        if removed:
+            metrics.increment("cache.backend.compacted", removed)
+            logger.info("Cache compaction removed %d entries", removed)
+        return removed
+
+    def _compact_in_background(self) -> None:
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return  # the running pass covers these writes too
+            self._compactor = threading.Thread(target=self._compact_quietly, name="cache-compaction", daemon=True)
+            self._compactor.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception:
+            logger.exception("Cache compaction failed")
+
+    def close(self) -> None:
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            self._conn.close()
@@ -3,6 +3,28 @@ import os
 
 load_dotenv()
 
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
 # Gemini Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 DEFAULT_MODEL = "models/gemini-flash-latest"
@@ -15,9 +37,183 @@ CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
 CHATGPT_API_KEY = os.getenv("OPENAI_API_KEY")
 CHATGPT_MODEL = "gpt-4o-mini"
 
+# Optional API base URLs (proxies, gateways, or the mock server in benchmarks/)
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL") or None
+CLAUDE_BASE_URL = os.getenv("CLAUDE_BASE_URL") or None
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+
 # Concurrency limits
 try:
     LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "0") or "0")
 except ValueError:
     LLM_MAX_CONCURRENCY = 0
 
+# Adaptive per-provider concurrency (AIMD with a latency gradient): each provider's
+# in-flight limit starts at ADAPTIVE_CONCURRENCY_INITIAL, grows while latency is stable
+# and is cut on 429s, timeouts or rising latency, within [MIN, MAX]. LLM_MAX_CONCURRENCY
+# still caps all providers together when set. Off by default: until the limit has grown,
+# it caps every provider below what an unthrottled deployment sends.
+ADAPTIVE_CONCURRENCY = _env_flag("ADAPTIVE_CONCURRENCY", False)
+ADAPTIVE_CONCURRENCY_INITIAL = _env_int("ADAPTIVE_CONCURRENCY_INITIAL", 8)
+ADAPTIVE_CONCURRENCY_MIN = _env_int("ADAPTIVE_CONCURRENCY_MIN", 1)
+ADAPTIVE_CONCURRENCY_MAX = _env_int("ADAPTIVE_CONCURRENCY_MAX", 64)
+
+# Fair scheduling of LLM calls between callers. Each call carries a tenant and a
+# priority ("interactive" or "batch") from the tool call; queued interactive calls
+# always go first, and within a priority tenants share slots by weighted fair
+# queuing. TENANT_WEIGHTS is "tenant=weight,..." (others weigh 1);
+# TENANT_MAX_CONCURRENCY caps any one tenant's in-flight calls (0 = no cap).
+TENANT_WEIGHTS = os.getenv("TENANT_WEIGHTS", "")
+TENANT_MAX_CONCURRENCY = _env_int("TENANT_MAX_CONCURRENCY", 0)
+
+# Provider-native structured output (JSON schema / response schema / tool use)
+LLM_STRUCTURED_OUTPUT = _env_flag("LLM_STRUCTURED_OUTPUT", True)
+
+# Validation mode: "split" runs the risk and clarity reviewers as separate calls,
+# "fused" asks for both sets of findings in a single structured call.
+VALIDATION_MODE = os.getenv("VALIDATION_MODE", "split").strip().lower() or "split"
+
+# Phase B mode: "two_call" runs a polish review and then a rewrite,
+# "single_call" critiques and rewrites in one structured call, "patch" critiques
+# and returns anchored edits that are applied locally (rewrite if they do not apply).
+POLISH_MODE = os.getenv("POLISH_MODE", "two_call").strip().lower() or "two_call"
+
+# Tiered model routing. Each phase declares a comma-separated ladder of
+# "provider:model" tiers, cheapest first. Providers: gemini, openai, claude.
+MODEL_LADDER_VALIDATION = os.getenv("MODEL_LADDER_VALIDATION") or f"gemini:{DEFAULT_MODEL}"
+MODEL_LADDER_SYNTHESIS = os.getenv("MODEL_LADDER_SYNTHESIS") or f"openai:{CHATGPT_MODEL}"
+MODEL_LADDER_POLISH = os.getenv("MODEL_LADDER_POLISH") or f"gemini:{DEFAULT_MODEL}"
+# Escalate synthesis to the next tier below this self-reported confidence...
+ESCALATION_CONFIDENCE_THRESHOLD = _env_float("ESCALATION_CONFIDENCE_THRESHOLD", 0.7)
+# ...and start above the first tier when validation finds this many high-severity points.
+ESCALATION_HIGH_SEVERITY_POINTS = _env_int("ESCALATION_HIGH_SEVERITY_POINTS", 2)
+
+# Complexity pre-classifier: route trivial questions to a single-call fast path.
+COMPLEXITY_ROUTING = _env_flag("COMPLEXITY_ROUTING", False)
+FAST_PATH_MAX_SCORE = _env_float("FAST_PATH_MAX_SCORE", 0.25)
+# Optional JSONL log of routing decisions/outcomes for calibration reports.
+COMPLEXITY_LOG_PATH = os.getenv("COMPLEXITY_LOG_PATH") or None
+
+# Local clarity pre-check: questions the heuristic scores as clearly clear (unclear
+# score <= CLARITY_CLEAR_MAX_SCORE) or clearly unclear (>= CLARITY_UNCLEAR_MIN_SCORE)
+# get their clarity points without an LLM call; the rest go to the LLM reviewer.
+CLARITY_FAST_PATH = _env_flag("CLARITY_FAST_PATH", False)
+CLARITY_CLEAR_MAX_SCORE = _env_float("CLARITY_CLEAR_MAX_SCORE", 0.2)
+CLARITY_UNCLEAR_MIN_SCORE = _env_float("CLARITY_UNCLEAR_MIN_SCORE", 0.8)
+# Optional JSONL log of heuristic verdicts next to the LLM reviewer's, for agreement reports.
+CLARITY_LOG_PATH = os.getenv("CLARITY_LOG_PATH") or None
+# With both the fast path and the log on, this share of confident verdicts still goes
+# to the LLM reviewer, so the log covers the questions the fast path answers too.
+CLARITY_AUDIT_RATE = _env_float("CLARITY_AUDIT_RATE", 0.05)
+
+# Map-reduce for large context summaries: a context longer than CONTEXT_CHUNK_CHARS
+# (0 = off) is split into overlapping chunks (at most CONTEXT_MAX_CHUNKS) that the
+# context-reading reviewers validate in parallel; their points are merged and deduped.
+# Synthesis and polishing get an extractive digest of at most CONTEXT_DIGEST_CHARS.
+CONTEXT_CHUNK_CHARS = _env_int("CONTEXT_CHUNK_CHARS", 0)
+CONTEXT_CHUNK_OVERLAP_CHARS = _env_int("CONTEXT_CHUNK_OVERLAP_CHARS", 200)
+CONTEXT_MAX_CHUNKS = _env_int("CONTEXT_MAX_CHUNKS", 8)
+CONTEXT_DIGEST_CHARS = _env_int("CONTEXT_DIGEST_CHARS", 4000)
+
+# Semantic near-duplicate question cache (local embeddings + LSH index).
+SEMANTIC_CACHE = _env_flag("SEMANTIC_CACHE", False)
+SEMANTIC_CACHE_THRESHOLD = _env_float("SEMANTIC_CACHE_THRESHOLD", 0.8)
+SEMANTIC_CACHE_MAX_ENTRIES = _env_int("SEMANTIC_CACHE_MAX_ENTRIES", 1024)
+SEMANTIC_CACHE_TTL_S = _env_float("SEMANTIC_CACHE_TTL_S", 3600.0)
+
+# Reuse of validation results across follow-up questions sharing a context summary.
+VALIDATION_REUSE = _env_flag("VALIDATION_REUSE", False)
+VALIDATION_REUSE_THRESHOLD = _env_float("VALIDATION_REUSE_THRESHOLD", 0.6)
+VALIDATION_REUSE_TTL_S = _env_float("VALIDATION_REUSE_TTL_S", 1800.0)
+VALIDATION_REUSE_MAX_SESSIONS = _env_int("VALIDATION_REUSE_MAX_SESSIONS", 256)
+
+# Shared cache backend: "memory" (per process) or "sqlite" (one WAL-mode file shared
+# by every server process on the host).
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").strip().lower() or "memory"
+CACHE_PATH = os.getenv("CACHE_PATH") or os.path.join(
+    os.path.expanduser("~"), ".cache", "peer_review_mcp", "cache.sqlite3"
+)
+CACHE_MAX_BYTES = _env_int("CACHE_MAX_BYTES", 256 * 1024 * 1024)
+CACHE_MAX_ENTRIES = _env_int("CACHE_MAX_ENTRIES", 4096)
+# Exact-prompt LLM response cache (per provider, model and response schema).
+LLM_RESPONSE_CACHE = _env_flag("LLM_RESPONSE_CACHE", False)
+LLM_RESPONSE_CACHE_TTL_S = _env_float("LLM_RESPONSE_CACHE_TTL_S", 86400.0)
+# Exact question + context final answer cache.
+ANSWER_CACHE = _env_flag("ANSWER_CACHE", False)
+ANSWER_CACHE_TTL_S = _env_float("ANSWER_CACHE_TTL_S", 3600.0)
+# Stale-while-revalidate: answers up to ANSWER_CACHE_STALE_S past their TTL are still
+# served while a background task re-runs the pipeline for them (0 = expire at the TTL).
+# Keys hit ANSWER_CACHE_POPULAR_HITS times within ANSWER_CACHE_POPULAR_WINDOW_S are
+# refreshed ahead of expiry once ANSWER_CACHE_REFRESH_AHEAD of their TTL has passed
+# (0 hits = off). At most ANSWER_CACHE_REFRESH_CONCURRENCY refreshes run at once.
+ANSWER_CACHE_STALE_S = _env_float("ANSWER_CACHE_STALE_S", 0.0)
+ANSWER_CACHE_POPULAR_HITS = _env_int("ANSWER_CACHE_POPULAR_HITS", 0)
+ANSWER_CACHE_POPULAR_WINDOW_S = _env_float("ANSWER_CACHE_POPULAR_WINDOW_S", 600.0)
+ANSWER_CACHE_REFRESH_AHEAD = _env_float("ANSWER_CACHE_REFRESH_AHEAD", 0.8)
+ANSWER_CACHE_REFRESH_CONCURRENCY = _env_int("ANSWER_CACHE_REFRESH_CONCURRENCY", 2)
+
+# LLM traffic cassette: "record" appends every provider call (prompt hash, model,
+# response, latency, token counts) and every tool request to LLM_CASSETTE_PATH;
+# "replay" serves provider calls from it instead, sleeping the recorded latency times
+# LLM_CASSETTE_LATENCY_SCALE (0 = no delay). A ".gz" path is gzip-compressed and
+# "{pid}" in the path is replaced by the process id, one file per worker.
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "off").strip().lower() or "off"
+LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", "llm_cassette.jsonl.gz")
+LLM_CASSETTE_LATENCY_SCALE = _env_float("LLM_CASSETTE_LATENCY_SCALE", 1.0)
+
+# Per-request profiling: a sampled share of requests (PROFILE_SAMPLE_RATE, 0 = off)
+# and any tool call passing profile=true run under cProfile with an event-loop stall
+# watchdog (stalls over PROFILE_STALL_MS record the blocking stack). One JSON summary
+# and one .prof file per request go to PROFILE_DIR, keeping the newest PROFILE_MAX_FILES.
+PROFILE_SAMPLE_RATE = _env_float("PROFILE_SAMPLE_RATE", 0.0)
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "peer_review_mcp", "profiles"
+)
+PROFILE_MAX_FILES = _env_int("PROFILE_MAX_FILES", 200)
+PROFILE_STALL_MS = _env_float("PROFILE_STALL_MS", 50.0)
+
+# Server transport: "stdio" (default, one process per client), "sse" or
+# "streamable-http" (one warm pool serving many clients on MCP_HOST:MCP_PORT).
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "stdio").strip().lower() or "stdio"
+MCP_HOST = os.getenv("MCP_HOST") or "127.0.0.1"
+MCP_PORT = _env_int("MCP_PORT", 8000)
+# Worker processes behind one port (streamable-http only; each has its own orchestrator).
+MCP_WORKERS = _env_int("MCP_WORKERS", 1)
+# Seconds to wait for in-flight tool calls on shutdown before cancelling them.
+SHUTDOWN_GRACE_S = _env_float("SHUTDOWN_GRACE_S", 30.0)
+
+# Admission control: concurrent requests (0, the default, disables it and leaves
+# concurrency unbounded), waiting requests beyond which new ones are rejected, and the
+# latency assumed before any request has completed.
+ADMISSION_MAX_CONCURRENT = _env_int("ADMISSION_MAX_CONCURRENT", 0)
+ADMISSION_MAX_QUEUE = _env_int("ADMISSION_MAX_QUEUE", 32)
+ADMISSION_INITIAL_LATENCY_S = _env_float("ADMISSION_INITIAL_LATENCY_S", 15.0)
+
+# Per-provider circuit breakers: open when at least BREAKER_FAILURE_RATE of the last
+# BREAKER_WINDOW calls (min BREAKER_MIN_CALLS) failed or took over BREAKER_SLOW_CALL_S,
+# then probe again after BREAKER_OPEN_S.
+CIRCUIT_BREAKER = _env_flag("CIRCUIT_BREAKER", True)
+BREAKER_FAILURE_RATE = _env_float("BREAKER_FAILURE_RATE", 0.5)
+BREAKER_WINDOW = _env_int("BREAKER_WINDOW", 20)
+BREAKER_MIN_CALLS = _env_int("BREAKER_MIN_CALLS", 5)
+BREAKER_SLOW_CALL_S = _env_float("BREAKER_SLOW_CALL_S", 20.0)
+BREAKER_OPEN_S = _env_float("BREAKER_OPEN_S", 30.0)
+
+# Pipelined Phase A: start synthesis once a quorum of validation results is in
+# (QUORUM_MIN_REVIEWERS reviewers done, QUORUM_HIGH_SEVERITY high-severity points,
+# or QUORUM_CUTOFF_S seconds, 0 = no cutoff); later points feed the Phase B decision.
+PHASE_A_PIPELINING = _env_flag("PHASE_A_PIPELINING", False)
+QUORUM_MIN_REVIEWERS = _env_int("QUORUM_MIN_REVIEWERS", 1)
+QUORUM_HIGH_SEVERITY = _env_int("QUORUM_HIGH_SEVERITY", 2)
+QUORUM_CUTOFF_S = _env_float("QUORUM_CUTOFF_S", 0.0)
+
+# Timeout for the Phase B polishing step in seconds (0 = none); on expiry the draft answer is returned.
+POLISH_TIMEOUT_S = _env_float("POLISH_TIMEOUT_S", 0.0)
+# Include the per-node pipeline execution trace (status and timing) in response meta.
+PIPELINE_TRACE = _env_flag("PIPELINE_TRACE", False)
+
+# Coalesce concurrent requests with the same normalized question and context.
+REQUEST_COALESCING = _env_flag("REQUEST_COALESCING", True)
+
+# Deadline for a whole request in seconds (0 = none); callers may pass a tighter one.
+REQUEST_DEADLINE_S = _env_float("REQUEST_DEADLINE_S", 0.0)
@@ -0,0 +1,50 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+
+class ServerShuttingDown(RuntimeError):
+    """Raised for tool calls that arrive after shutdown has started."""
+
+
+class InflightTracker:  # Counts running tool calls so shutdown can wait for them
+    """
+    Tracks in-flight requests for graceful shutdown.
+
+    ``drain`` stops admitting new requests and waits until the running ones finish
+    (or the timeout passes), so LLM calls already paid for are not cut off mid-flight.
+    """
+
+    POLL_INTERVAL_S = 0.05
+
+    def __init__(self):
+        self.count = 0
+        self.closing = False
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        if self.closing:
+            raise ServerShuttingDown("Server is shutting down; retry on another instance")
+        self.count += 1
+        try:
+            yield
+        finally:
+            self.count -= 1
+
+    async def drain(self, timeout_s: float) -> bool:
+        """Stop admitting requests and wait for in-flight ones; True if all finished."""
+        self.closing = True
+        deadline = time.monotonic() + timeout_s
+        if self.count:
+            logger.info("Draining %d in-flight request(s) (up to %.0fs)", self.count, timeout_s)
+        while self.count and time.monotonic() < deadline:
+            await anyio.sleep(self.POLL_INTERVAL_S)
+        if self.count:
+            logger.warning("Shutdown grace period elapsed with %d request(s) still running", self.count)
+            return False
+        return True
@@ -2,6 +2,8 @@ import json
 import re
 from typing import Any
 
+from peer_review_mcp import metrics
+
 
 def strip_code_fences(text: str) -> str:
     cleaned = text.strip()
@@ -63,6 +65,27 @@ def try_parse_json(text: str) -> Any | None:
     return None
 
 
+def extract_items(data: Any) -> list | None:
+    """Return the list of items from a bare JSON array or a structured ``{"items": [...]}`` object."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        return data["items"]
+    return None
+
+
+def record_parse_outcome(source: str, *, ok: bool) -> None:
+    """Count a parse attempt for ``source`` and whether it needed a heuristic fallback."""
+    metrics.increment(f"parse.{source}.total")
+    if not ok:
+        metrics.increment(f"parse.{source}.fallback")
+
+
+def parse_fallback_rate(source: str) -> float:
+    """Fraction of responses from ``source`` that required a fallback parse."""
+    return metrics.ratio(f"parse.{source}.fallback", f"parse.{source}.total")
+
+
 def strip_markdown(text: str) -> str:
     lines = text.splitlines()
     cleaned_lines: list[str] = []
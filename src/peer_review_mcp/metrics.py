@@ -0,0 +1,52 @@
+import threading
+from collections import defaultdict
+
+# Process-local counters and gauges. Values are plain floats keyed by dotted names,
+# e.g. "parse.risk_reviewer.fallback".
+_lock = threading.Lock()
+_counters: dict[str, float] = defaultdict(float)
+_gauges: dict[str, float] = {}
+
+
+def increment(name: str, value: float = 1.0) -> None:
+    """Add ``value`` to the counter ``name``."""
+    with _lock:
+        _counters[name] += value
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Set the gauge ``name`` to ``value``."""
+    with _lock:
+        _gauges[name] = value
+
+
+def get(name: str, default: float = 0.0) -> float:
+    """Return the current value of a counter or gauge."""
+    with _lock:
+        if name in _gauges:
+            return _gauges[name]
+        return _counters.get(name, default)
+
+
+def ratio(numerator: str, denominator: str) -> float:
+    """Return ``numerator / denominator`` for two counters, or 0.0 when empty."""
+    with _lock:
+        total = _counters.get(denominator, 0.0)
+        if not total:
+            return 0.0
+        return _counters.get(numerator, 0.0) / total
+
+
+def snapshot() -> dict[str, float]:
+    """Return a copy of all counters and gauges."""
+    with _lock:
+        data = dict(_counters)
+        data.update(_gauges)
+        return data
+
+
+def reset() -> None:
+    """Clear all metrics (used by tests and benchmarks)."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
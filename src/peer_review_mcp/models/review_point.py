@@ -1,20 +1,42 @@
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import Optional, Literal, get_args
 
 RiskType = Literal["assumptions", "api_tooling", "edge_cases", "concurrency", "security", "other"]
 Severity = Literal["low", "medium", "high"]
 
+# One shared str object per known label: points parsed from LLM JSON reuse these
+# instead of each carrying its own copy, and comparisons hit the identity fast path.
+_LABELS = {
+    label: label
+    for label in (*get_args(RiskType), *get_args(Severity), "risk", "clarity", "system")
+}
 
-@dataclass
+
+def _canonical(value: Optional[str]) -> Optional[str]:
+    return _LABELS.get(value, value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
 class ReviewPoint:
     """
     Structured review point with classification.
     Used by validation and synthesis engines to provide context about potential issues.
+
+    Immutable and slotted: points are shared between requests (validation reuse,
+    coalesced callers), so nobody may mutate them, and many live at once under load.
     """
     text: str
     risk_type: Optional[RiskType] = None
     severity: Optional[Severity] = None
     confidence: Optional[float] = None  # 0.0-1.0, importance of this review point
+    source: Optional[str] = None  # Reviewer that produced the point, e.g. "risk" or "clarity"
+
+    def __post_init__(self):
+        for name in ("risk_type", "severity", "source"):
+            value = getattr(self, name)
+            canonical = _canonical(value)
+            if canonical is not value:
+                object.__setattr__(self, name, canonical)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/debugging."""
@@ -23,5 +45,5 @@ class ReviewPoint:
             "risk_type": self.risk_type,
             "severity": self.severity,
             "confidence": self.confidence,
+            "source": self.source,
         }
-
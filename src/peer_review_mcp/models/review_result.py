@@ -5,7 +5,7 @@ from peer_review_mcp.models.review_point import ReviewPoint
 
 ReviewMode = Literal["validate", "polish"]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReviewResult:
     mode: ReviewMode
     items: List[ReviewPoint | str]
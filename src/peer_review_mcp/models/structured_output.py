@@ -0,0 +1,102 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from peer_review_mcp.models.review_point import RiskType, Severity
+
+
+class ReviewPointSchema(BaseModel):
+    """Wire schema for a single ReviewPoint returned by a reviewer."""
+    model_config = ConfigDict(extra="forbid")
+
+    text: str = Field(..., description="Specific, actionable description of the issue")
+    risk_type: RiskType
+    severity: Severity
+    confidence: float = Field(..., description="0.0-1.0, how confident you are this is an actual issue")
+
+
+class ReviewPointList(BaseModel):
+    """Structured reviewer response. Providers require an object at the top level."""
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[ReviewPointSchema]
+
+
+class FusedReviewPointSchema(ReviewPointSchema):
+    """ReviewPoint wire schema tagged with the review that produced it."""
+
+    source: Literal["risk", "clarity"]
+
+
+class FusedReviewPointList(BaseModel):
+    """Structured response of the fused risk + clarity reviewer."""
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[FusedReviewPointSchema]
+
+
+class IncrementalReviewSchema(BaseModel):
+    """Structured incremental validation: new findings plus indexes of known points that no longer apply."""
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[FusedReviewPointSchema]
+    obsolete: list[int] = Field(..., description="1-based numbers of known review points that no longer apply")
+
+
+class SynthesisSchema(BaseModel):
+    """Structured answer synthesis response."""
+    model_config = ConfigDict(extra="forbid")
+
+    answer: str = Field(..., description="Final, user-facing answer in plain text")
+    confidence: float = Field(..., description="0.0-1.0 self-assessed answer quality")
+    needs_polish: bool
+
+
+class SelfCritiqueSchema(BaseModel):
+    """Structured single-call Phase B response: critique plus optional rewrite."""
+    model_config = ConfigDict(extra="forbid")
+
+    comments: list[str] = Field(..., description="Material issues found in the answer")
+    material_issues: bool
+    revised_answer: str = Field(..., description="Rewritten answer, or empty when there are no material issues")
+
+
+class AnswerEditSchema(BaseModel):
+    """One anchored edit to an answer (see tools.answer_patch)."""
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["replace", "insert_before", "insert_after", "delete"]
+    anchor: str = Field(..., description="Passage copied verbatim from the current answer; must occur only once")
+    text: str = Field(..., description="Replacement or inserted text; empty for delete")
+
+
+class PolishPatchSchema(BaseModel):
+    """Structured patch-mode Phase B response: critique plus targeted edits instead of a rewrite."""
+    model_config = ConfigDict(extra="forbid")
+
+    comments: list[str] = Field(..., description="Material issues found in the answer")
+    material_issues: bool
+    edits: list[AnswerEditSchema] = Field(..., description="Edits fixing the issues; empty when there are none")
+
+
+def json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Return the JSON schema of ``model`` with all ``$ref`` pointers inlined.
+
+    Not every provider resolves ``$defs`` in tool/response schemas, so nested
+    models are expanded in place.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def _inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                return _inline(defs[ref.split("/")[-1]])
+            return {key: _inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_inline(value) for value in node]
+        return node
+
+    return _inline(schema)
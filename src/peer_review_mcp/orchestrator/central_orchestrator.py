@@ -1,19 +1,57 @@
+import copy
 import time
 import logging
 from typing import Optional, List
 
-from peer_review_mcp.tools.validate_tool import validate_tool
+import anyio
+
+from peer_review_mcp.tools.validate_tool import validate_tool, validate_stream
 from peer_review_mcp.tools.answer_tool import answer_tool
 from peer_review_mcp.tools.polishing_engine import PolishingEngine
+from peer_review_mcp.tools.context_chunking import ContextChunker
 from peer_review_mcp.models.review_point import ReviewPoint
-
-from peer_review_mcp.LLM.gemini_client import GeminiClient
+from peer_review_mcp.cache.answer_cache import AnswerCache
+from peer_review_mcp.cache.backend import get_cache_backend
+from peer_review_mcp.cache.semantic_cache import SemanticCache
+from peer_review_mcp.cache.embedding import normalize_text, text_hash
+from peer_review_mcp.orchestrator.dag import Dag, Node
+from peer_review_mcp.orchestrator.decision_trace import DecisionTrace
+from peer_review_mcp.orchestrator.quorum import QuorumPolicy, count_high_severity
+from peer_review_mcp.orchestrator.revalidator import Revalidator
+from peer_review_mcp.orchestrator.single_flight import SingleFlight
+from peer_review_mcp.orchestrator.complexity_classifier import ComplexityAssessment, ComplexityClassifier
+from peer_review_mcp.outcome_log import OutcomeLog
+
+from peer_review_mcp import metrics
 from peer_review_mcp.LLM.limiter import configure_llm_concurrency
-from peer_review_mcp.config import LLM_MAX_CONCURRENCY
+from peer_review_mcp.LLM.routing import get_router
+from peer_review_mcp.LLM.circuit_breaker import get_breaker
+from peer_review_mcp.LLM.scheduling import call_tag, current_tag
+from peer_review_mcp.config import (
+    LLM_MAX_CONCURRENCY,
+    TENANT_MAX_CONCURRENCY,
+    POLISH_MODE,
+    ESCALATION_CONFIDENCE_THRESHOLD,
+    ESCALATION_HIGH_SEVERITY_POINTS,
+    COMPLEXITY_ROUTING,
+    COMPLEXITY_LOG_PATH,
+    SEMANTIC_CACHE,
+    ANSWER_CACHE,
+    CACHE_BACKEND,
+    REQUEST_COALESCING,
+    REQUEST_DEADLINE_S,
+    PHASE_A_PIPELINING,
+    POLISH_TIMEOUT_S,
+    PIPELINE_TRACE,
+)
 from peer_review_mcp.prompts.polish_synthesis import POLISH_SYNTHESIS_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Degradation ladder, least valuable work first: a provider in trouble sheds the
+# clarity reviewer, then validation, then polishing.
+DEGRADATION_STEPS = ("drop_clarity", "drop_validation", "skip_polish")
+
 
 class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (validation, synthesis, polishing)
     """
@@ -27,22 +65,77 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
     2. Synthesis: Generates answer considering review points
        + model confidence & polish recommendation
     3. Polishing: Optional improvement pass
+
+    Phases A and B run as a DAG (see ``_build_pipeline``): every node starts as
+    soon as its inputs are ready, and each run yields a per-node timing trace.
+
+    An oversized context summary is validated in chunks (see ValidationEngine),
+    while synthesis and polishing work from its digest (see ContextChunker).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        polish_mode: Optional[str] = None,
+        complexity_routing: Optional[bool] = None,
+        semantic_cache: Optional[bool] = None,
+        answer_cache: Optional[bool] = None,
+        coalescing: Optional[bool] = None,
+        pipelining: Optional[bool] = None,
+    ):
         logger.info("CentralOrchestrator initialized")
-        if LLM_MAX_CONCURRENCY:
+        if LLM_MAX_CONCURRENCY or TENANT_MAX_CONCURRENCY:
             configure_llm_concurrency(LLM_MAX_CONCURRENCY)
+        self.router = get_router()
         self.polishing_engine = PolishingEngine()
-        self.polish_llm = GeminiClient()
-
-    async def process(self, *, question: str, context_summary: Optional[str] = None) -> dict:
+        self.polish_llm = self.router.client("polish")
+        self.polish_mode = polish_mode or POLISH_MODE
+        self.context_chunker = ContextChunker()
+        # The classifier also runs (without routing) when only outcome logging is enabled,
+        # so a deployment can collect calibration data before turning the fast path on.
+        self.complexity_routing = COMPLEXITY_ROUTING if complexity_routing is None else complexity_routing
+        self.outcome_log = OutcomeLog(COMPLEXITY_LOG_PATH) if COMPLEXITY_LOG_PATH else None
+        self.complexity_classifier = (
+            ComplexityClassifier() if self.complexity_routing or self.outcome_log else None
+        )
+        use_answer_cache = ANSWER_CACHE if answer_cache is None else answer_cache
+        self.answer_cache = AnswerCache() if use_answer_cache else None
+        self.revalidator = Revalidator()
+        use_cache = SEMANTIC_CACHE if semantic_cache is None else semantic_cache
+        # Semantic entries are only persisted when the backend is shared between processes.
+        shared = get_cache_backend() if use_cache and CACHE_BACKEND == "sqlite" else None
+        self.semantic_cache = SemanticCache(backend=shared) if use_cache else None
+        use_coalescing = REQUEST_COALESCING if coalescing is None else coalescing
+        self.single_flight = SingleFlight() if use_coalescing else None
+        use_pipelining = PHASE_A_PIPELINING if pipelining is None else pipelining
+        self.quorum = QuorumPolicy() if use_pipelining else None
+        self.pipelines = {pipelined: self._build_pipeline(pipelined) for pipelined in (False, True)}
+
+    async def aclose(self) -> None:
+        """Cancel background work started by earlier requests (cache refreshes)."""
+        await self.revalidator.aclose()
+
+    async def process(
+        self,
+        *,
+        question: str,
+        context_summary: Optional[str] = None,
+        degraded: bool = False,
+        deadline_s: Optional[float] = None,
+    ) -> dict:
         """
         Orchestrates the multi-phase peer review process.
 
+        All work runs inside this call's cancel scope: when the caller is cancelled or
+        the deadline passes, every outstanding provider call is cancelled and its
+        limiter slot released before this method returns.
+
         Args:
             question: The question to process.
             context_summary: Optional context about previous discussion.
+            degraded: Under load, run a single reviewer and skip Phase B.
+            deadline_s: Seconds allowed for the whole request (default REQUEST_DEADLINE_S;
+                0 or None for no deadline). On expiry the answer is None with
+                error "deadline_exceeded".
 
         Returns:
             A dictionary containing the final answer and metadata about the process.
@@ -51,16 +144,154 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
                 - confidence: Model confidence in the answer.
                 - review_points_count: Number of review points identified.
                 - polishing_applied: Whether polishing was applied.
+                - synthesis_tier / synthesis_model: Model ladder tier that served the answer.
+                - escalation_reason: Why a tier above the first was used, if any.
+                - route / complexity_score: Pre-classifier routing ("fast_path" or "peer_review").
+                - cache: Cache hit flag, layer ("exact" or "semantic"), similarity and
+                  semantic hit rate (when a cache is enabled); stale exact hits also
+                  carry ``stale`` and ``age_s``, and ``refreshing`` when a background
+                  refresh was started.
+                - degraded: Present and True when admission control ran the request degraded.
+                - degradation_level / degradation: Highest ladder step applied (0 = none)
+                  and the steps taken because of provider health or load.
+                - coalesced: Present and True when the result was shared with an
+                  identical request already in flight.
         """
+        deadline = REQUEST_DEADLINE_S if deadline_s is None else deadline_s
+        if not deadline or deadline <= 0:
+            return await self._process_shared(question, context_summary, degraded)
+
+        with anyio.move_on_after(deadline):
+            return await self._process_shared(question, context_summary, degraded)
+        logger.warning("Request deadline of %.1fs exceeded: %s", deadline, question[:100])
+        metrics.increment("orchestrator.deadline_exceeded")
+        return {
+            "answer": None,
+            "meta": {
+                "used_peer_review": False,
+                "error": "deadline_exceeded",
+                "deadline_s": deadline,
+            },
+        }
+
+    async def _process_shared(self, question: str, context_summary: Optional[str], degraded: bool) -> dict:
+        """Coalesce with an identical in-flight request, if any."""
+        if self.single_flight is None:
+            return await self._process(question, context_summary, degraded)
+
+        key = (normalize_text(question), text_hash(context_summary), degraded)
+        result, shared = await self.single_flight.do(
+            key, lambda: self._process(question, context_summary, degraded)
+        )
+        result = copy.deepcopy(result)  # waiters share one result; each gets its own dict to annotate
+        if shared:
+            result["meta"]["coalesced"] = True
+        return result
+
+    async def _process(self, question: str, context_summary: Optional[str], degraded: bool) -> dict:
+        """Cache lookups around the pipeline for one (possibly coalesced) request."""
+        if self.answer_cache is None and self.semantic_cache is None:
+            return await self._run_pipeline(question, context_summary, degraded)
+
+        if self.answer_cache is not None:
+            entry = await self.answer_cache.alookup_entry(question, context_summary)
+            if entry is not None:
+                logger.info("Answer cache hit%s: %s", " (stale)" if entry.stale else "", question[:100])
+                cached = entry.value
+                cached["meta"]["cache"] = {"hit": True, "layer": "exact", "similarity": 1.0}
+                if entry.stale:
+                    cached["meta"]["cache"].update(stale=True, age_s=round(entry.age_s, 1))
+                if entry.refresh and self.answer_cache.revalidates:
+                    refreshing = self.revalidator.schedule(
+                        self.answer_cache.key(question, context_summary),
+                        lambda tenant=current_tag().tenant: self._refresh(question, context_summary, tenant),
+                    )
+                    if refreshing:
+                        cached["meta"]["cache"]["refreshing"] = True
+                return cached
+
+        if self.semantic_cache is not None:
+            hit = await self.semantic_cache.alookup(question, context_summary)
+            if hit is not None:
+                logger.info("Semantic cache hit (similarity %.3f): %s", hit.similarity, hit.matched_question[:100])
+                hit.value["meta"]["cache"] = {
+                    "hit": True,
+                    "layer": "semantic",
+                    "similarity": hit.similarity,
+                    "hit_rate": round(self.semantic_cache.hit_rate(), 4),
+                }
+                return hit.value
+
+        result = await self._run_pipeline(question, context_summary, degraded)
+        await self._store(question, context_summary, result)
+        result["meta"]["cache"] = {"hit": False}
+        if self.semantic_cache is not None:
+            result["meta"]["cache"]["hit_rate"] = round(self.semantic_cache.hit_rate(), 4)
+        return result
+
+    async def _store(self, question: str, context_summary: Optional[str], result: dict) -> None:
+        # Degraded answers are not cached, so later requests get the full review.
+        if result.get("answer") is None or result["meta"].get("degradation_level"):
+            return
+        if self.answer_cache is not None:
+            await self.answer_cache.astore(question, context_summary, result)
+        if self.semantic_cache is not None:
+            await self.semantic_cache.astore(question, context_summary, result)
+
+    async def _refresh(self, question: str, context_summary: Optional[str], tenant: str) -> None:
+        """Re-run the pipeline for a cached answer; runs detached, at batch priority."""
+        deadline = REQUEST_DEADLINE_S if REQUEST_DEADLINE_S and REQUEST_DEADLINE_S > 0 else None
+        with call_tag(tenant, "batch"), anyio.move_on_after(deadline):
+            result = await self._run_pipeline(question, context_summary)
+            await self._store(question, context_summary, result)
+            return
+        metrics.increment("cache.refresh.deadline_exceeded")
+
+    async def _run_pipeline(
+        self, question: str, context_summary: Optional[str], degraded: bool = False
+    ) -> dict:
+        """Run the pre-classifier, Phase A and (optionally) Phase B for one question."""
         t0 = time.time()  # Start measuring the processing time for performance tracking
-        decision_log: list[str] = []
+        decision_log = DecisionTrace()
 
         logger.info("Starting process for new question: %s", question[:100])  # Log the first 100 characters of the question to avoid overly long logs
 
-        # Phase A – validation + synthesis
-        review_points, synthesis = await self._run_phase_a(
-            question, context_summary, decision_log
+        # Pre-classifier: trivial questions get a single synthesis call, no peer review
+        assessment: Optional[ComplexityAssessment] = None
+        if self.complexity_classifier is not None:
+            assessment = self.complexity_classifier.assess(question, context_summary)
+            decision_log.append(
+                "complexity: %s (score %s, %s)", assessment.route, assessment.score, assessment.reason
+            )
+        fell_back = False
+        if self.complexity_routing and assessment is not None and assessment.route == "fast_path":
+            fast = await self._run_fast_path(question, context_summary, decision_log)
+            if fast is not None:
+                processing_time_ms = int((time.time() - t0) * 1000)
+                self._log_decision_trace(decision_log, processing_time_ms)
+                await self._record_outcome(assessment, fast["meta"], confidence=fast.pop("confidence"))
+                fast["meta"]["complexity_score"] = assessment.score
+                return fast
+            fell_back = True
+
+        degradation = self._degradation_steps(degraded)
+        if degradation:
+            decision_log.append("degradation: %s", ", ".join(degradation))
+        if self.context_chunker.oversized(context_summary):
+            digest = self.context_chunker.digest(question, context_summary)
+            decision_log.append("context_digest: %d -> %d chars", len(context_summary), len(digest))
+            metrics.increment("context.digests")
+
+        # Phase A (validation + synthesis) and Phase B (decision + polishing) as a DAG
+        run = await self.pipelines[self.quorum is not None].run(
+            question=question,
+            context_summary=context_summary,
+            degradation=degradation,
+            decision_log=decision_log,
         )
+        decision_log.append("dag: %s", run.trace)
+        review_points = run.values["review_points"]
+        synthesis = run.values["synthesis"]
 
         if synthesis is None:
             logger.warning("Phase A failed to generate answer")
@@ -73,53 +304,115 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
                     "review_points_count": len(review_points),
                     "polishing_applied": False,
                     "error": "answer_generation_failed",
+                    "route": "peer_review",
+                    "complexity_score": assessment.score if assessment else None,
+                    **self._degradation_meta(degradation),
+                    **({"trace": run.trace.to_dict()} if PIPELINE_TRACE else {}),
                 },
             }
 
         answer = synthesis["answer"]
         confidence = synthesis.get("confidence", 0.8)  # Default confidence to 0.8 if not provided
-        needs_polish = synthesis.get("needs_polish", False)
+        tier = synthesis.get("tier", 0)
+        should_polish, _ = run.values["decision"]
+        polish_status = run.trace.status("polished_answer")
+        if polish_status == "ok":
+            answer = run.values["polished_answer"]
+        elif should_polish:
+            decision_log.append("phase_b_%s: keeping draft answer", polish_status)
+
+        processing_time_ms = int((time.time() - t0) * 1000)
+        self._log_decision_trace(decision_log, processing_time_ms)
+
+        meta = {
+            "used_peer_review": True,
+            "review_points_count": len(review_points),
+            "polishing_applied": polish_status == "ok",
+            "synthesis_tier": tier,
+            "synthesis_model": synthesis.get("model"),
+            "escalation_reason": synthesis.get("escalation_reason"),
+            "route": "peer_review",
+            "complexity_score": assessment.score if assessment else None,
+            **self._degradation_meta(degradation),
+        }
+        if degraded:
+            meta["degraded"] = True
+        if "quorum" in synthesis:
+            meta["quorum"] = {"reason": synthesis["quorum"], "late_points": synthesis["late_points"]}
+        if PIPELINE_TRACE:
+            meta["trace"] = run.trace.to_dict()
+        if assessment is not None:
+            high = sum(1 for p in review_points if isinstance(p, ReviewPoint) and p.severity == "high")
+            await self._record_outcome(
+                assessment, meta, confidence=confidence, high_severity_points=high, fell_back=fell_back
+            )
+        return {"answer": answer, "meta": meta}
 
-        decision_log.append(f"model_confidence: {confidence}")
-        decision_log.append(f"model_requested_polish: {needs_polish}")
+    # Fast path
 
-        # Heuristic quality score (still useful as a secondary signal)
-        quality_score = self._heuristic_quality_score(len(review_points))
-        decision_log.append(f"quality_score_heuristic: {quality_score}")
-
-        # Phase B decision
-        should_polish, polish_reason = self._decide_phase_b(
-            review_points_count=len(review_points),
-            quality_score=quality_score,
-            model_confidence=confidence,
-            model_requested_polish=needs_polish,
-        )
-        decision_log.append(f"phase_b_decision: {should_polish} ({polish_reason})")
+    async def _run_fast_path(
+        self,
+        question: str,
+        context_summary: Optional[str],
+        decision_log: DecisionTrace,
+    ) -> Optional[dict]:
+        """
+        Single synthesis call without validation or polishing.
 
-        if should_polish:
-            answer = await self._run_phase_b(
-                question, answer, context_summary, decision_log
+        Returns None (caller falls back to full peer review) if the call fails or the
+        model reports low confidence or asks for polishing.
+        """
+        try:
+            synthesis = await answer_tool(
+                question=question,
+                context_summary=self.context_chunker.digest(question, context_summary),
+                review_points=[],
             )
+        except Exception:
+            logger.exception("answer_tool failed on fast path")
+            decision_log.append("fast_path_fallback: answer_failed")
+            return None
 
-        processing_time_ms = int((time.time() - t0) * 1000)
-        self._log_decision_trace(decision_log, processing_time_ms)
+        confidence = synthesis.get("confidence", 0.8)
+        if synthesis.get("needs_polish", False) or confidence < 0.85:
+            decision_log.append("fast_path_fallback: low_confidence (%s)", confidence)
+            metrics.increment("routing.fast_path.fallbacks")
+            return None
 
+        metrics.increment("routing.fast_path.served")
         return {
-            "answer": answer,
+            "answer": synthesis["answer"],
+            "confidence": confidence,
             "meta": {
-                "used_peer_review": True,
-                "review_points_count": len(review_points),
-                "polishing_applied": should_polish,
+                "used_peer_review": False,
+                "review_points_count": 0,
+                "polishing_applied": False,
+                "synthesis_tier": synthesis.get("tier", 0),
+                "synthesis_model": synthesis.get("model"),
+                "escalation_reason": None,
+                "route": "fast_path",
             },
         }
 
+    async def _record_outcome(self, assessment: ComplexityAssessment, meta: dict, **outcome) -> None:
+        if self.outcome_log is None:
+            return
+        await self.outcome_log.arecord(
+            assessment,
+            served_route=meta.get("route"),
+            polishing_applied=meta.get("polishing_applied", False),
+            review_points_count=meta.get("review_points_count", 0),
+            **outcome,
+        )
+
     # Phase A
 
     async def _run_phase_a(
         self,
         question: str,
         context_summary: Optional[str],
-        decision_log: list[str],
+        decision_log: DecisionTrace,
+        degradation: tuple[str, ...] = (),
     ) -> tuple[List[ReviewPoint], Optional[dict]]:
         """
         Executes Phase A: validation and synthesis.
@@ -127,7 +420,9 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
         Args:
             question: The question to validate and synthesize an answer for.
             context_summary: Optional context about previous discussion.
-            decision_log: A list to record decisions made during the process.
+            decision_log: Trace recording the decisions made during the process.
+            degradation: Ladder steps in effect ("drop_clarity" runs only the first
+                reviewer, "drop_validation" skips validation).
 
         Returns:
             A tuple containing:
@@ -136,40 +431,298 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
         """
         logger.debug("Running Phase A for question: %s", question[:100])  # Log the first 100 characters of the question
 
+        if self.quorum is not None and "drop_validation" not in degradation:
+            return await self._run_phase_a_pipelined(question, context_summary, decision_log, degradation)
+        review_points = await self._validate(question, context_summary, decision_log, degradation)
+        return review_points, await self._synthesize(question, context_summary, review_points, decision_log)
+
+    async def _validate(
+        self,
+        question: str,
+        context_summary: Optional[str],
+        decision_log: DecisionTrace,
+        degradation: tuple[str, ...] = (),
+    ) -> List[ReviewPoint]:
+        """Phase A step 1: run validation and return its findings (reviewer failures dropped)."""
         # Step 1: Validation
         # This step uses the validate_tool to analyze the question and context.
         # It identifies potential issues or weaknesses in the question and returns
         # a list of review points that highlight these issues.
         review_points: list[ReviewPoint] = []
+        if "drop_validation" in degradation:
+            decision_log.append("validation_skipped: degradation")
+        else:
+            try:
+                validation = await validate_tool(
+                    question,
+                    context_summary,
+                    **({"max_reviewers": 1} if "drop_clarity" in degradation else {}),
+                )  # Analyze the question and context asynchronously
+                review_points = validation.get("items", [])  # Extract review points from the validation results
+                if not isinstance(review_points, list):
+                    review_points = []  # Ensure review_points is a list
+                if validation.get("reused"):
+                    decision_log.append("validation_reused_points: %s", validation["reused"])
+            except Exception:
+                logger.exception("validate_tool failed")
+                review_points = []
+
+        findings = self._findings(review_points)
+        self._note_reviewer_failures(len(review_points) - len(findings), decision_log)
+        review_points = findings
+
+        decision_log.append("review_points_count: %d", len(review_points))
+        return review_points
+
+    async def _run_phase_a_pipelined(
+        self,
+        question: str,
+        context_summary: Optional[str],
+        decision_log: DecisionTrace,
+        degradation: tuple[str, ...] = (),
+    ) -> tuple[List[ReviewPoint], Optional[dict]]:
+        """
+        Phase A with synthesis overlapped with the slower reviewers.
+
+        Review points are read from the validation stream until the quorum policy is
+        met; synthesis then starts on those points while the remaining reviewers keep
+        running. Their ("late") points are returned with the others and reported in
+        the synthesis result (``late_points``, ``late_high_severity``) for the Phase B
+        decision. If synthesis fails, the remaining reviewers are cancelled.
+        """
+        early: list[ReviewPoint] = []
+        late: list[ReviewPoint] = []
+        reason = "validation_failed"
+        synthesis = None
+        synthesized = False
         try:
-            validation = await validate_tool(
-                question, context_summary
-            )  # Analyze the question and context asynchronously
-            review_points = validation.get("items", [])  # Extract review points from the validation results
-            if not isinstance(review_points, list):
-                review_points = []  # Ensure review_points is a list
+            async with validate_stream(
+                question,
+                context_summary,
+                **({"max_reviewers": 1} if "drop_clarity" in degradation else {}),
+            ) as batches:
+                reason = await self._await_quorum(batches, early)
+                findings = self._findings(early)
+                decision_log.append("quorum: %s (%d points)", reason, len(findings))
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(self._collect_late, batches, late)
+                    synthesized = True
+                    synthesis = await self._synthesize(question, context_summary, findings, decision_log)
+                    if synthesis is None:
+                        tg.cancel_scope.cancel()
         except Exception:
-            logger.exception("validate_tool failed")
-            review_points = []
+            logger.exception("Pipelined validation failed")
+        metrics.increment(f"phase_a.quorum.{reason}")
+
+        findings = self._findings(early)
+        if not synthesized:
+            synthesis = await self._synthesize(question, context_summary, findings, decision_log)
+        late_findings = self._findings(late)
+        self._note_reviewer_failures(len(early) + len(late) - len(findings) - len(late_findings), decision_log)
+        review_points = findings + late_findings
+        if late_findings:
+            decision_log.append("late_review_points: %d", len(late_findings))
+            metrics.increment("phase_a.late_points", len(late_findings))
+        decision_log.append("review_points_count: %d", len(review_points))
 
-        decision_log.append(f"review_points_count: {len(review_points)}")
+        if synthesis is None:
+            return review_points, None
+        return review_points, {
+            **synthesis,
+            "quorum": reason,
+            "late_points": len(late_findings),
+            "late_high_severity": count_high_severity(late_findings),
+        }
 
+    async def _await_quorum(self, batches, points: list) -> str:
+        """Read review batches into ``points`` until the quorum is met; returns the reason."""
+        done = 0
+        with anyio.move_on_after(self.quorum.cutoff_s or None):
+            async for batch in batches:
+                points.extend(batch.points)
+                # A failed reviewer reported nothing about the question; it doesn't count toward quorum.
+                if self._findings(batch.points):
+                    done += 1
+                reason = self.quorum.reached(done, points)
+                if reason:
+                    return reason
+            return "all_reviewers"
+        return "cutoff"
+
+    @staticmethod
+    async def _collect_late(batches, points: list) -> None:
+        async for batch in batches:
+            points.extend(batch.points)
+
+    @staticmethod
+    def _findings(review_points: list) -> list:
+        # Synthetic "reviewer failed" points say nothing about the question; counting them
+        # would push answers into Phase B exactly when providers are struggling.
+        return [p for p in review_points if not (isinstance(p, ReviewPoint) and p.source == "system")]
+
+    @staticmethod
+    def _note_reviewer_failures(failures: int, decision_log: DecisionTrace) -> None:
+        if failures:
+            decision_log.append("reviewer_failures: %d", failures)
+            metrics.increment("validation.reviewer_failures", failures)
+
+    async def _synthesize(
+        self,
+        question: str,
+        context_summary: Optional[str],
+        review_points: List[ReviewPoint],
+        decision_log: DecisionTrace,
+    ) -> Optional[dict]:
+        """Run synthesis with tiered escalation; returns None when the first call fails."""
         # Step 2: Synthesis
         # This step uses the answer_tool to generate an answer based on the question,
         # context, and the review points identified in the validation step.
         # The synthesis process considers the review points to improve the quality
         # and relevance of the generated answer.
+        # Tiered routing: start on the cheapest model unless validation already flagged
+        # several high-severity risks, then escalate one tier at a time on low confidence.
+        tier, escalation_reason = self._initial_synthesis_tier(review_points)
+        context_summary = self.context_chunker.digest(question, context_summary)
+        if escalation_reason:
+            decision_log.append("synthesis_start_tier: %s (%s)", tier, escalation_reason)
         try:
             synthesis = await answer_tool(
                 question=question,
                 context_summary=context_summary,
                 review_points=review_points,  # Pass review points to the synthesis tool
+                **({"tier": tier} if tier else {}),
             )
         except Exception:
             logger.exception("answer_tool failed")
-            return review_points, None
+            return None
+
+        while tier < self.router.max_tier("synthesis"):
+            confidence = synthesis.get("confidence", 0.8)
+            if confidence >= ESCALATION_CONFIDENCE_THRESHOLD:
+                break
+            escalation_reason = "low_model_confidence"
+            decision_log.append("synthesis_escalation: tier %d (confidence %s)", tier + 1, confidence)
+            metrics.increment("routing.synthesis.escalations")
+            try:
+                synthesis = await answer_tool(
+                    question=question,
+                    context_summary=context_summary,
+                    review_points=review_points,
+                    tier=tier + 1,
+                )
+            except Exception:
+                logger.exception("answer_tool failed at tier %d, keeping tier %d answer", tier + 1, tier)
+                break
+            tier += 1
+
+        metrics.increment(f"routing.synthesis.tier_{tier}")
+        return {**synthesis, "tier": tier, "escalation_reason": escalation_reason}
+
+    def _initial_synthesis_tier(self, review_points: List[ReviewPoint]) -> tuple[int, Optional[str]]:
+        """Pick the starting synthesis tier from validation severity."""
+        if self.router.max_tier("synthesis") == 0:
+            return 0, None
+        high = sum(
+            1
+            for p in review_points
+            if isinstance(p, ReviewPoint) and p.severity == "high" and p.source != "system"
+        )
+        if high >= ESCALATION_HIGH_SEVERITY_POINTS:
+            return 1, f"high_severity_points={high}"
+        return 0, None
 
-        return review_points, synthesis
+    # Pipeline graph
+
+    def _build_pipeline(self, pipelined: bool) -> Dag:
+        """
+        Phase A and Phase B as a DAG.
+
+        Seeds: question, context_summary, degradation, decision_log. Nodes:
+        review_points -> synthesis -> decision -> polished_answer, where the
+        polish node is a conditional edge on the Phase B decision and is bounded by
+        POLISH_TIMEOUT_S (the draft answer is kept when it fails or times out). In
+        pipelined mode one phase_a node produces review points and synthesis
+        together, since synthesis overlaps with validation there.
+        """
+        request = ("question", "context_summary", "decision_log", "degradation")
+        if pipelined:
+            phase_a = [
+                Node("phase_a", self._run_phase_a, inputs=request, default=([], None)),
+                Node("review_points", lambda phase_a: phase_a[0], inputs=("phase_a",), default=[]),
+                Node("synthesis", lambda phase_a: phase_a[1], inputs=("phase_a",)),
+            ]
+        else:
+            phase_a = [
+                Node("review_points", self._validate, inputs=request, default=[]),
+                Node(
+                    "synthesis",
+                    self._synthesize,
+                    inputs=("question", "context_summary", "review_points", "decision_log"),
+                ),
+            ]
+        return Dag([
+            *phase_a,
+            Node(
+                "decision",
+                self._decide_polish,
+                inputs=("review_points", "synthesis", "degradation", "decision_log"),
+                when=lambda v: v["synthesis"] is not None,
+                default=(False, "no_answer"),
+            ),
+            Node(
+                "polished_answer",
+                self._polish,
+                inputs=("question", "context_summary", "synthesis", "decision", "decision_log"),
+                when=lambda v: v["decision"][0],
+                timeout_s=POLISH_TIMEOUT_S or None,
+            ),
+        ])
+
+    def _decide_polish(
+        self,
+        review_points: List[ReviewPoint],
+        synthesis: dict,
+        degradation: tuple[str, ...],
+        decision_log: DecisionTrace,
+    ) -> tuple[bool, str]:
+        """Phase B decision node: combine model self-assessment, heuristics and degradation."""
+        confidence = synthesis.get("confidence", 0.8)  # Default confidence to 0.8 if not provided
+        needs_polish = synthesis.get("needs_polish", False)
+
+        decision_log.append("model_confidence: %s", confidence)
+        decision_log.append("model_requested_polish: %s", needs_polish)
+
+        # Heuristic quality score (still useful as a secondary signal)
+        quality_score = self._heuristic_quality_score(len(review_points))
+        decision_log.append("quality_score_heuristic: %s", quality_score)
+
+        if "skip_polish" in degradation:
+            should_polish, polish_reason = False, "degraded_mode"
+        elif synthesis.get("late_high_severity"):
+            # Pipelined Phase A: synthesis never saw these, so the answer needs a review pass.
+            should_polish, polish_reason = True, "late_high_severity_points"
+        else:
+            should_polish, polish_reason = self._decide_phase_b(
+                review_points_count=len(review_points),
+                quality_score=quality_score,
+                model_confidence=confidence,
+                model_requested_polish=needs_polish,
+            )
+        decision_log.append("phase_b_decision: %s (%s)", should_polish, polish_reason)
+        return should_polish, polish_reason
+
+    async def _polish(
+        self,
+        question: str,
+        context_summary: Optional[str],
+        synthesis: dict,
+        decision: tuple[bool, str],
+        decision_log: DecisionTrace,
+    ) -> str:
+        """Phase B node: polish the synthesized answer on the tier that produced it."""
+        return await self._run_phase_b(
+            question, synthesis["answer"], context_summary, decision_log, tier=synthesis.get("tier", 0)
+        )
 
     # Phase B decision
 
@@ -214,7 +767,8 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
         question: str,
         answer: str,
         context_summary: Optional[str],
-        decision_log: list[str],
+        decision_log: DecisionTrace,
+        tier: int = 0,
     ) -> str:
         """
         Execute Phase B: polishing the answer.
@@ -223,24 +777,47 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
             question: The original question.
             answer: The synthesized answer to polish.
             context_summary: Optional context about previous discussion.
-            decision_log: A list to record decisions made during the process.
+            decision_log: Trace recording the decisions made during the process.
+            tier: Synthesis tier that produced the answer; the rewrite uses the same
+                tier of the polish ladder so escalated answers are not downgraded.
 
         Returns:
             The polished answer, or the original answer if no polishing was applied.
         """
-        logger.debug("Running Phase B polishing")
+        logger.debug("Running Phase B polishing (%s)", self.polish_mode)
+        context_summary = self.context_chunker.digest(question, context_summary)
+
+        escalated_llm = self.router.client("polish", tier) if tier else None
+
+        if self.polish_mode == "single_call":
+            return await self._run_phase_b_single_call(
+                question, answer, context_summary, decision_log, escalated_llm
+            )
+        if self.polish_mode == "patch":
+            return await self._run_phase_b_patch(question, answer, context_summary, decision_log, escalated_llm)
 
         comments = await self.polishing_engine.review_for_polish(
             question=question,
             answer=answer,
             context_summary=context_summary,
         )  # Generate polishing comments asynchronously
-        decision_log.append(f"polish_comments_count: {len(comments)}")
+        decision_log.append("polish_comments_count: %d", len(comments))
 
         if not comments:
             return answer  # Return the original answer if no comments were generated
 
-        formatted = "\n".join(f"- {c.text}" for c in comments)  # Format comments as a bullet list
+        return await self._rewrite(question, answer, [c.text for c in comments], context_summary, escalated_llm)
+
+    async def _rewrite(
+        self,
+        question: str,
+        answer: str,
+        comments: list[str],
+        context_summary: Optional[str],
+        escalated_llm=None,
+    ) -> str:
+        """Regenerate the whole answer applying ``comments`` (two-call Phase B rewrite step)."""
+        formatted = "\n".join(f"- {c}" for c in comments)  # Format comments as a bullet list
 
         prompt = POLISH_SYNTHESIS_PROMPT.format(
             question=question,
@@ -249,12 +826,119 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
             context=context_summary if context_summary else "(No previous context)",
         )
 
-        polished = await self.polish_llm.generate_async(
+        polished = await (escalated_llm or self.polish_llm).generate_async(
             prompt
         )  # Generate the polished answer asynchronously
         polished = polished.strip()
         return polished or answer  # Return the polished answer, or the original if polishing failed
 
+    async def _run_phase_b_single_call(
+        self,
+        question: str,
+        answer: str,
+        context_summary: Optional[str],
+        decision_log: DecisionTrace,
+        escalated_llm=None,
+    ) -> str:
+        """
+        Execute Phase B as one self-critique-and-rewrite call.
+
+        Short-circuits (keeps the original answer) when the critique reports no
+        material issues; the model is told to leave the rewrite empty in that case,
+        so no output tokens are spent regenerating an unchanged answer.
+        """
+        comments, revised = await self.polishing_engine.critique_and_rewrite(
+            question=question,
+            answer=answer,
+            context_summary=context_summary,
+            client=escalated_llm,
+        )
+        decision_log.append("polish_comments_count: %d", len(comments))
+
+        if revised is None:
+            decision_log.append("polish_short_circuit: no_material_issues")
+            return answer
+        return revised
+
+    async def _run_phase_b_patch(
+        self,
+        question: str,
+        answer: str,
+        context_summary: Optional[str],
+        decision_log: DecisionTrace,
+        escalated_llm=None,
+    ) -> str:
+        """
+        Execute Phase B as one critique call returning anchored edits, applied locally.
+
+        Keeps the original answer when the critique reports no material issues. When
+        the edits cannot be applied (missing or ambiguous anchors, overlaps, issues
+        without edits), falls back to a full rewrite from the critique and the edits,
+        as in two-call mode; when the response was unparseable and so left nothing to
+        rewrite from, falls back to a single-call critique and rewrite.
+        """
+        comments, patched, unapplied = await self.polishing_engine.critique_and_patch(
+            question=question,
+            answer=answer,
+            context_summary=context_summary,
+            client=escalated_llm,
+        )
+        decision_log.append("polish_comments_count: %d", len(comments))
+
+        if patched is not None:
+            decision_log.append("polish_patch: applied")
+            return patched
+        if unapplied is None:
+            decision_log.append("polish_short_circuit: no_material_issues")
+            return answer
+
+        decision_log.append("polish_patch_fallback: rewrite")
+        metrics.increment("polish.patch.fallbacks")
+        notes = [c.text for c in comments] + [edit.describe() for edit in unapplied]
+        if notes:
+            return await self._rewrite(question, answer, notes, context_summary, escalated_llm)
+
+        comments, revised = await self.polishing_engine.critique_and_rewrite(
+            question=question,
+            answer=answer,
+            context_summary=context_summary,
+            client=escalated_llm,
+        )
+        decision_log.append("polish_comments_count: %d", len(comments))
+        return revised or answer
+
+    # Degradation ladder
+
+    def _degradation_steps(self, degraded: bool = False) -> tuple[str, ...]:
+        """
+        Pick ladder steps from provider circuit breakers (and admission degraded mode).
+
+        Any strained provider in the pipeline drops the clarity reviewer; an open
+        validation provider drops validation; an open polish provider skips Phase B.
+        Admission-degraded requests drop clarity and skip polish.
+        """
+        steps = set()
+        if degraded:
+            steps.update(("drop_clarity", "skip_polish"))
+        breakers = {
+            phase: get_breaker(self.router.tier(phase).provider)
+            for phase in ("validation", "synthesis", "polish")
+        }
+        if any(b is not None and b.strained for b in breakers.values()):
+            steps.add("drop_clarity")
+        if breakers["validation"] is not None and breakers["validation"].state == "open":
+            steps.add("drop_validation")
+        if breakers["polish"] is not None and breakers["polish"].state == "open":
+            steps.add("skip_polish")
+        if steps:
+            metrics.increment("degradation.requests")
+        return tuple(step for step in DEGRADATION_STEPS if step in steps)
+
+    @staticmethod
+    def _degradation_meta(degradation: tuple[str, ...]) -> dict:
+        level = max((DEGRADATION_STEPS.index(step) + 1 for step in degradation), default=0)
+        return {"degradation_level": level, "degradation": list(degradation)}
+
     # Helpers
 
     def _heuristic_quality_score(self, review_points_count: int) -> float:
@@ -267,10 +951,10 @@ class CentralOrchestrator:  # Orchestrates the multi-phase peer-review flow (val
             return 0.80
         return 0.72
 
-    def _log_decision_trace(self, decision_log: list[str], processing_time_ms: int):
+    def _log_decision_trace(self, decision_log: DecisionTrace, processing_time_ms: int):
         # Log the decision trace and the total processing time for debugging and analysis.
         logger.info(
             "Decision trace: %s | processing_time_ms: %d",
-            " | ".join(decision_log),
+            decision_log,  # formatted by logging only if INFO is enabled
             processing_time_ms,
         )
@@ -0,0 +1,179 @@
+import argparse
+import json
+import logging
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+from peer_review_mcp.config import FAST_PATH_MAX_SCORE
+
+logger = logging.getLogger(__name__)
+
+Route = Literal["fast_path", "peer_review"]
+
+# Explicit verification requests must always get full peer review (see the tool description).
+_VERIFY_RE = re.compile(
+    r"\b(verify|verified|double[- ]check|check (my|your|this|the)|validate|confirm|be sure|make sure|precisely|"
+    r"prove)\b",
+    re.IGNORECASE,
+)
+_HIGH_STAKES_RE = re.compile(
+    r"\b(security|secure|safe|vulnerab\w*|auth\w*|encrypt\w*|passwords?|medical|medication|dosage|legal|law|"
+    r"tax|financ\w*|invest\w*|production|outage|data loss|migration|compliance|safety)\b",
+    re.IGNORECASE,
+)
+_REASONING_RE = re.compile(
+    r"\b(why|how (do|does|should|can|would)|design|architect\w*|trade-?offs?|compare|versus|vs\.?|analy[sz]e|"
+    r"explain|implement\w*|optimi[sz]\w*|debug\w*|failure modes?|edge cases?|concurren\w*|race condition|"
+    r"deadlock|scal\w*|best (way|practice)|pros and cons|step[- ]by[- ]step)\b",
+    re.IGNORECASE,
+)
+_FACTUAL_RE = re.compile(
+    r"^\s*(what is|what's|what are|who (is|was|wrote|invented|discovered|founded)|when (is|was|did)|where is|"
+    r"define|how many|how much|"
+    r"which (is|was)|what does .{1,40} stand for)\b",
+    re.IGNORECASE,
+)
+_CODE_RE = re.compile(r"```|`[^`]+`|\w+\([^)]*\)|[{};]|=>|::|\b(def|class|import|SELECT|async|await)\b")
+_MULTI_PART_RE = re.compile(r"(\n\s*(\d+[.)]|[-*•])\s+)|\b(also|additionally|and then|as well as)\b", re.IGNORECASE)
+
+# Logistic model weights over the features below; bias favours full review.
+_WEIGHTS = {
+    "words": 0.045,
+    "questions": 0.35,
+    "sentences": 0.25,
+    "reasoning_terms": 0.9,
+    "high_stakes_terms": 1.2,
+    "code": 1.0,
+    "multi_part": 0.8,
+    "context_words": 0.01,
+    "factual_opening": -1.6,
+}
+_BIAS = -1.3
+
+
+@dataclass
+class ComplexityAssessment:
+    route: Route
+    score: float  # 0.0 (trivial) - 1.0 (complex)
+    reason: str
+    features: dict[str, float] = field(default_factory=dict)
+
+
+class ComplexityClassifier:  # Local, CPU-only question complexity pre-classifier (no network)
+    """
+    Rules + lightweight features routing trivial questions to a single-call fast path.
+
+    Hard rules force full peer review for explicit verification requests and
+    high-stakes topics; otherwise a small logistic score over lexical features is
+    compared with ``max_fast_score``.
+    """
+
+    def __init__(self, max_fast_score: float = FAST_PATH_MAX_SCORE):
+        self.max_fast_score = max_fast_score
+
+    def features(self, question: str, context_summary: Optional[str] = None) -> dict[str, float]:
+        words = question.split()
+        sentences = [s for s in re.split(r"[.!?]+\s", question.strip()) if s.strip()]
+        return {
+            "words": float(len(words)),
+            "questions": float(question.count("?")),
+            "sentences": float(len(sentences)),
+            "reasoning_terms": float(len(_REASONING_RE.findall(question))),
+            "high_stakes_terms": float(len(_HIGH_STAKES_RE.findall(question))),
+            "code": 1.0 if _CODE_RE.search(question) else 0.0,
+            "multi_part": float(len(_MULTI_PART_RE.findall(question))),
+            "context_words": float(len(context_summary.split())) if context_summary else 0.0,
+            "factual_opening": 1.0 if _FACTUAL_RE.search(question) else 0.0,
+            "verification_request": 1.0 if _VERIFY_RE.search(question) else 0.0,
+        }
+
+    def assess(self, question: str, context_summary: Optional[str] = None) -> ComplexityAssessment:
+        features = self.features(question, context_summary)
+        linear = _BIAS + sum(weight * features[name] for name, weight in _WEIGHTS.items())
+        score = round(1.0 / (1.0 + math.exp(-linear)), 3)
+
+        if features["verification_request"]:
+            return ComplexityAssessment("peer_review", score, "verification_requested", features)
+        if features["high_stakes_terms"]:
+            return ComplexityAssessment("peer_review", score, "high_stakes_topic", features)
+        if score <= self.max_fast_score:
+            return ComplexityAssessment("fast_path", score, "low_complexity", features)
+        return ComplexityAssessment("peer_review", score, "complex", features)
+
+
+def needed_review(entry: dict) -> bool:
+    """
+    Whether a logged request turned out to need more than a single call.
+
+    A request the fast path served, or gave up on, is judged by whether it fell
+    back; every other request (including those the classifier would have sent down
+    the fast path while routing is off) by its peer review outcome.
+    """
+    if entry.get("served_route") == "fast_path" or entry.get("fell_back"):
+        return bool(entry.get("fell_back"))
+    return bool(
+        entry.get("polishing_applied")
+        or entry.get("high_severity_points", 0) > 0
+        or entry.get("confidence", 1.0) < 0.85
+    )
+
+
+def calibration_report(entries: list[dict], buckets: int = 10, max_miss_rate: float = 0.1) -> dict:
+    """
+    Bucket logged outcomes by score and suggest a fast-path threshold.
+
+    The suggested threshold is the highest bucket edge for which the share of
+    requests below it that needed review stays within ``max_miss_rate``.
+    Requests forced to peer review by a hard rule are excluded.
+    """
+    scored = [e for e in entries if e.get("reason") in ("low_complexity", "complex")]
+    rows = []
+    for i in range(buckets):
+        lo, hi = i / buckets, (i + 1) / buckets
+        in_bucket = [e for e in scored if lo <= e["score"] < hi or (i == buckets - 1 and e["score"] == 1.0)]
+        needed = sum(1 for e in in_bucket if needed_review(e))
+        rows.append({
+            "range": [round(lo, 2), round(hi, 2)],
+            "count": len(in_bucket),
+            "needed_review_rate": round(needed / len(in_bucket), 3) if in_bucket else None,
+        })
+
+    suggested = 0.0
+    for i in range(1, buckets + 1):
+        edge = i / buckets
+        below = [e for e in scored if e["score"] < edge]
+        if below and sum(1 for e in below if needed_review(e)) / len(below) <= max_miss_rate:
+            suggested = edge
+    # Served shares come from what actually ran, not from the classifier's verdict.
+    served_fast = [e for e in entries if e.get("served_route") == "fast_path"]
+    attempted = [e for e in entries if e.get("served_route") == "fast_path" or e.get("fell_back")]
+    return {
+        "requests": len(entries),
+        "scored_requests": len(scored),
+        "fast_path_share": round(len(served_fast) / len(entries), 3) if entries else 0.0,
+        "fast_path_fallback_rate": (
+            round(sum(1 for e in attempted if e.get("fell_back")) / len(attempted), 3) if attempted else None
+        ),
+        "buckets": rows,
+        "suggested_max_fast_score": suggested,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Calibration report for the complexity pre-classifier")
+    parser.add_argument("log", help="JSONL outcome log written via COMPLEXITY_LOG_PATH")
+    parser.add_argument("--buckets", type=int, default=10)
+    parser.add_argument("--max-miss-rate", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    with open(args.log, encoding="utf-8") as fh:
+        entries = [json.loads(line) for line in fh if line.strip()]
+    print(json.dumps(calibration_report(entries, args.buckets, args.max_miss_rate), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Node:
+    """
+    One step of a Dag.
+
+    ``fn`` is called with keyword arguments named after ``inputs``, each either the
+    result of another node or a seed passed to ``Dag.run``; it may be sync or async.
+    The node's result is stored under its ``name``.
+
+    Args:
+        when: Conditional edge; called with the input values, a false result skips
+            the node.
+        timeout_s: Per-node timeout; on expiry the node's work is cancelled.
+        default: Result used when the node is skipped, fails or times out, so
+            dependents still run (they decide for themselves what a default means).
+        cache_key: Memoize successful results under ``(name, cache_key(inputs))``
+            in the Dag's LRU cache.
+    """
+
+    name: str
+    fn: Callable[..., Any]
+    inputs: tuple[str, ...] = ()
+    when: Optional[Callable[[dict], bool]] = None
+    timeout_s: Optional[float] = None
+    default: Any = None
+    cache_key: Optional[Callable[[dict], Hashable]] = None
+
+
+@dataclass
+class NodeRun:
+    name: str
+    status: str  # "ok", "cached", "skipped", "failed" or "timeout"
+    start_ms: float
+    duration_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class DagTrace:
+    """Per-node status and timing of one Dag run, in completion order."""
+
+    edges: list[tuple[str, str]]
+    runs: list[NodeRun] = field(default_factory=list)
+
+    def status(self, name: str) -> Optional[str]:
+        return next((r.status for r in self.runs if r.name == name), None)
+
+    def to_dict(self) -> list[dict]:
+        return [
+            {
+                "node": r.name,
+                "status": r.status,
+                "start_ms": round(r.start_ms, 1),
+                "duration_ms": round(r.duration_ms, 1),
+                **({"error": r.error} if r.error else {}),
+            }
+            for r in self.runs
+        ]
+
+    def to_mermaid(self) -> str:
+        """Render as a Mermaid flowchart: one box per node with status and duration."""
+        lines = ["flowchart LR"]
+        for r in self.runs:
+            lines.append(f'    {r.name}["{r.name}<br/>{r.status} {r.duration_ms:.0f} ms"]:::{r.status}')
+        ran = {r.name for r in self.runs}
+        lines.extend(f"    {src} --> {dst}" for src, dst in self.edges if src in ran and dst in ran)
+        lines.extend([
+            "    classDef ok fill:#d4edda",
+            "    classDef cached fill:#d1ecf1",
+            "    classDef skipped fill:#eeeeee,stroke-dasharray:4",
+            "    classDef failed fill:#f8d7da",
+            "    classDef timeout fill:#fff3cd",
+        ])
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return ", ".join(f"{r.name}={r.status}@{r.start_ms:.0f}+{r.duration_ms:.0f}ms" for r in self.runs)
+
+
+@dataclass
+class DagRun:
+    values: dict[str, Any]
+    trace: DagTrace
+
+
+class Dag:  # Runs a graph of nodes with maximal parallelism, conditional edges and a trace
+    """
+    Small dataflow executor.
+
+    Every node starts as soon as all of its node inputs have finished, so
+    independent branches run concurrently in one task group; cancelling the run
+    cancels every running node. Inputs that name no node are seeds supplied to
+    ``run``. Node names must be unique and the graph acyclic (checked here).
+    """
+
+    def __init__(self, nodes: Iterable[Node], cache_size: int = 256):
+        self.nodes = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate node {node.name!r}")
+            self.nodes[node.name] = node
+        self.seeds = {i for node in self.nodes.values() for i in node.inputs if i not in self.nodes}
+        self.edges = [(i, node.name) for node in self.nodes.values() for i in node.inputs if i in self.nodes]
+        self.order = self._topological_order()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, Any] = OrderedDict()
+
+    def _topological_order(self) -> list[Node]:
+        pending = {name: {i for i in node.inputs if i in self.nodes} for name, node in self.nodes.items()}
+        order: list[Node] = []
+        while pending:
+            ready = [name for name, deps in pending.items() if not deps]
+            if not ready:
+                raise ValueError(f"Cycle between nodes {sorted(pending)}")
+            for name in ready:
+                order.append(self.nodes[name])
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return order
+
+    async def run(self, **seeds: Any) -> DagRun:
+        missing = self.seeds - seeds.keys()
+        if missing:
+            raise ValueError(f"Missing seed inputs: {sorted(missing)}")
+        values = dict(seeds)
+        finished = {name: anyio.Event() for name in self.nodes}
+        trace = DagTrace(edges=self.edges)
+        t0 = time.perf_counter()
+
+        async def _run(node: Node) -> None:
+            for dep in node.inputs:
+                if dep in finished:
+                    await finished[dep].wait()
+            args = {i: values[i] for i in node.inputs}
+            start = time.perf_counter()
+            try:
+                status, value, error = await self._execute(node, args)
+            finally:
+                finished[node.name].set()  # also on cancellation, so no sibling waits forever
+            values[node.name] = value
+            trace.runs.append(
+                NodeRun(node.name, status, (start - t0) * 1000, (time.perf_counter() - start) * 1000, error)
+            )
+
+        async with anyio.create_task_group() as tg:
+            for node in self.order:
+                tg.start_soon(_run, node)
+        return DagRun(values=values, trace=trace)
+
+    async def _execute(self, node: Node, args: dict) -> tuple[str, Any, Optional[str]]:
+        if node.when is not None and not node.when(args):
+            return "skipped", node.default, None
+
+        key = (node.name, node.cache_key(args)) if node.cache_key is not None else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return "cached", self._cache[key], None
+
+        with anyio.move_on_after(node.timeout_s) as scope:
+            try:
+                value = node.fn(**args)
+                if inspect.isawaitable(value):
+                    value = await value
+            except Exception as exc:
+                logger.exception("DAG node %s failed", node.name)
+                return "failed", node.default, f"{type(exc).__name__}: {exc}"
+        if scope.cancelled_caught:
+            logger.warning("DAG node %s timed out after %ss", node.name, node.timeout_s)
+            return "timeout", node.default, None
+
+        if key is not None and self.cache_size:
+            self._cache[key] = value
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return "ok", value, None
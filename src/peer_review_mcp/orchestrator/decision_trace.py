@@ -0,0 +1,30 @@
+from typing import Any, Iterator
+
+
+class DecisionTrace:  # Per-request decision log, formatted only when read
+    """
+    Ordered log of the decisions taken for one request.
+
+    Entries are stored like logging records, as a %-style template plus its
+    arguments, and are only formatted when the trace is read (iterated or turned
+    into a string). The trace is passed to the logger as an argument, so with INFO
+    disabled a request builds no trace strings at all.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries: list[tuple[str, tuple[Any, ...]]] = []
+
+    def append(self, template: str, *args: Any) -> None:
+        self._entries.append((template, args))
+
+    def __iter__(self) -> Iterator[str]:
+        for template, args in self._entries:
+            yield template % args if args else template
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return " | ".join(self)
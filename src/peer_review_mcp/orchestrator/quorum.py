@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.config import QUORUM_MIN_REVIEWERS, QUORUM_HIGH_SEVERITY, QUORUM_CUTOFF_S
+
+
+@dataclass(frozen=True)
+class QuorumPolicy:
+    """
+    When pipelined Phase A may start synthesis without waiting for every reviewer.
+
+    Synthesis starts as soon as ``min_reviewers`` reviewers have reported, or
+    ``high_severity_points`` high-severity findings have arrived (0 disables either
+    rule), or ``cutoff_s`` seconds have passed since validation started (0 = never).
+    Points that arrive later are not seen by synthesis; they feed the Phase B decision.
+    """
+
+    min_reviewers: int = QUORUM_MIN_REVIEWERS
+    high_severity_points: int = QUORUM_HIGH_SEVERITY
+    cutoff_s: float = QUORUM_CUTOFF_S
+
+    def reached(self, reviewers_done: int, points: list[ReviewPoint]) -> Optional[str]:
+        """Return the rule that was met ("reviewers" or "high_severity"), or None."""
+        if self.min_reviewers and reviewers_done >= self.min_reviewers:
+            return "reviewers"
+        if self.high_severity_points and count_high_severity(points) >= self.high_severity_points:
+            return "high_severity"
+        return None
+
+
+def count_high_severity(points: list) -> int:
+    return sum(
+        1 for p in points if isinstance(p, ReviewPoint) and p.severity == "high" and p.source != "system"
+    )
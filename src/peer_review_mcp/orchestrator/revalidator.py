@@ -0,0 +1,79 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+from peer_review_mcp import metrics
+from peer_review_mcp.config import ANSWER_CACHE_REFRESH_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+
+class Revalidator:  # Runs cache refreshes in the background, off the request path
+    """
+    Bounded background refreshes.
+
+    ``schedule`` starts ``fn`` as a detached task and returns immediately, so the
+    request that noticed a stale entry is answered from the cache without waiting.
+    At most ``max_concurrency`` refreshes run at once and at most ``max_pending``
+    are queued; further requests are dropped (the next hit asks again). A key
+    already being refreshed is not scheduled twice. Tasks start in an empty
+    context, so they are not attributed to the request (call tags, profiles) that
+    triggered them; ``fn`` sets up whatever context it needs. ``aclose`` cancels
+    outstanding refreshes.
+    """
+
+    def __init__(self, max_concurrency: int = ANSWER_CACHE_REFRESH_CONCURRENCY, max_pending: int = 64):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def schedule(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """Start refreshing ``key`` unless it already is or the queue is full."""
+        if key in self._tasks:
+            metrics.increment("cache.refresh.deduplicated")
+            return False
+        if len(self._tasks) >= self.max_pending:
+            metrics.increment("cache.refresh.dropped")
+            logger.warning("Background refresh queue full (%d), dropping refresh", len(self._tasks))
+            return False
+        task = contextvars.Context().run(asyncio.ensure_future, self._run(fn))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _, k=key, t=task: self._forget(k, t))
+        metrics.increment("cache.refresh.scheduled")
+        metrics.set_gauge("cache.refresh.pending", len(self._tasks))
+        return True
+
+    async def _run(self, fn: Callable[[], Awaitable[Any]]) -> None:
+        async with self._semaphore:
+            try:
+                await fn()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                metrics.increment("cache.refresh.errors")
+                logger.exception("Background refresh failed")
+            else:
+                metrics.increment("cache.refresh.completed")
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            metrics.set_gauge("cache.refresh.pending", len(self._tasks))
+
+    async def join(self) -> None:
+        """Wait for every scheduled refresh to finish."""
+        while self._tasks:
+            await asyncio.wait(list(self._tasks.values()))
+
+    async def aclose(self) -> None:
+        """Cancel outstanding refreshes and wait for them to unwind."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
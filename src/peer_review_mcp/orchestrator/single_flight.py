@@ -0,0 +1,72 @@
+import asyncio
+import contextvars
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+import anyio
+
+from peer_review_mcp import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Call:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:  # Coalesces concurrent calls with the same key onto one in-flight task
+    """
+    Single-flight execution.
+
+    The first caller for a key starts the work as a task; concurrent callers with
+    the same key wait on that task instead of starting their own. Each waiter is
+    shielded, so a cancelled waiter leaves the work running for the others; the
+    work itself is cancelled only when its last waiter goes away, and that waiter
+    returns only after the work has finished unwinding, so no task outlives the
+    requests that wanted it. Completed keys are forgotten immediately, so this never
+    serves stale results.
+
+    The work starts in an empty context rather than the first caller's: callers
+    sharing it may differ in tenant and priority, so it runs with the default call
+    tag (interactive priority) and is not attributed to the first caller's profile.
+    An interactive caller therefore never waits behind work queued at batch priority.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Run ``fn`` once per concurrent ``key``; returns ``(result, shared)``."""
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = _Call(contextvars.Context().run(asyncio.ensure_future, fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _, k=key, c=call: self._forget(k, c))
+            metrics.set_gauge("coalesce.inflight", len(self._calls))
+        else:
+            metrics.increment("coalesce.shared")
+            logger.info("Coalescing with in-flight request (%d waiting)", call.waiters + 1)
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left to read the result: stop the work and let new callers start afresh.
+                self._forget(key, call)
+                call.task.cancel()
+                with anyio.CancelScope(shield=True):
+                    await asyncio.wait({call.task})
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+            metrics.set_gauge("coalesce.inflight", len(self._calls))
+
+    def __len__(self) -> int:
+        return len(self._calls)
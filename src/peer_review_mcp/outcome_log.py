@@ -0,0 +1,40 @@
+import dataclasses
+import json
+import logging
+import threading
+import time
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+
+class OutcomeLog:  # Append-only JSONL log of local decisions and their outcomes
+    """
+    Thread-safe JSONL writer used to calibrate local classifiers offline.
+
+    Code on the event loop uses ``arecord``/``awrite``, which append from a worker
+    thread so a slow disk never stalls other requests.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, assessment, **outcome) -> None:
+        """Append the fields of ``assessment`` (a dataclass) together with ``outcome``."""
+        self.write({**dataclasses.asdict(assessment), **outcome})
+
+    async def arecord(self, assessment, **outcome) -> None:
+        await self.awrite({**dataclasses.asdict(assessment), **outcome})
+
+    async def awrite(self, entry: dict) -> None:
+        await anyio.to_thread.run_sync(self.write, entry)
+
+    def write(self, entry: dict) -> None:
+        """Append one timestamped entry."""
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps({"ts": time.time(), **entry}) + "\n")
+        except OSError:
+            logger.exception("Failed to write outcome log %s", self.path)
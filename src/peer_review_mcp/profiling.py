@@ -0,0 +1,344 @@
+import argparse
+import asyncio
+import contextvars
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import traceback
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Optional
+
+from peer_review_mcp.config import PROFILE_DIR, PROFILE_MAX_FILES, PROFILE_SAMPLE_RATE, PROFILE_STALL_MS
+
+logger = logging.getLogger(__name__)
+
+# Where self time is spent, by source file (first match wins). Builtins are matched by name.
+CATEGORIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("parsing", (
+        "peer_review_mcp/llm_parsing.py", "peer_review_mcp/LLM/structured.py", "json/decoder.py",
+        "pydantic", "<built-in method loads>", "<method 'match' of", "<method 'search' of",
+    )),
+    ("formatting", (
+        "peer_review_mcp/prompts/", "json/encoder.py", "<method 'format' of 'str'", "<method 'join' of 'str'",
+    )),
+    ("provider_sdk", ("httpx", "httpcore", "h11", "ssl.py", "<method 'read' of '_ssl", "google/", "openai/", "anthropic/")),
+    ("logging", ("logging/",)),
+    ("event_loop", ("asyncio/", "anyio/", "selectors.py", "<method 'poll' of", "<method 'control' of")),
+    ("peer_review_mcp", ("peer_review_mcp/",)),
+)
+
+_current: contextvars.ContextVar[Optional["RequestProfile"]] = contextvars.ContextVar("request_profile", default=None)
+
+
+def current_profile() -> Optional["RequestProfile"]:
+    """Profile of the request being served in this context, if it is profiled."""
+    return _current.get()
+
+
+def categorize(filename: str, function: str) -> str:
+    where = f"{filename.replace(os.sep, '/')} {function}"
+    for category, patterns in CATEGORIES:
+        if any(p in where for p in patterns):
+            return category
+    return "other"
+
+
+class RequestProfile:
+    """Timings collected while one request runs: LLM spans, loop stalls and (optionally) cProfile stats."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started_at = datetime.now(timezone.utc)
+        self.llm_calls = 0
+        self.llm_queue_s = 0.0
+        self.llm_provider_s = 0.0
+        self.stalls: list[dict] = []
+        self.stats: Optional[pstats.Stats] = None
+        self.wall_s = 0.0
+        self.loop_cpu_s = 0.0
+        self.path: Optional[str] = None
+
+    def record_llm(self, queued: float, started: Optional[float], finished: float) -> None:
+        """One provider call: queued for the limiters from ``queued`` until ``started``, then in flight."""
+        self.llm_calls += 1
+        if started is None:  # never got a slot
+            self.llm_queue_s += finished - queued
+        else:
+            self.llm_queue_s += started - queued
+            self.llm_provider_s += finished - started
+
+    def to_dict(self, top: int = 30) -> dict:
+        data = {
+            "label": self.label,
+            "started_at": self.started_at.isoformat(),
+            "wall_s": round(self.wall_s, 6),
+            "loop_cpu_s": round(self.loop_cpu_s, 6),
+            "llm": {
+                "calls": self.llm_calls,
+                "queue_s": round(self.llm_queue_s, 6),
+                "provider_s": round(self.llm_provider_s, 6),
+            },
+            "stalls": self.stalls,
+            "cpu_by_category": {},
+            "top_functions": [],
+        }
+        if self.stats is not None:
+            by_category: dict[str, float] = {}
+            rows = []
+            for (filename, line, function), (_, calls, self_s, cumulative_s, _) in self.stats.stats.items():
+                category = categorize(filename, function)
+                by_category[category] = by_category.get(category, 0.0) + self_s
+                rows.append((self_s, cumulative_s, calls, f"{filename}:{line}({function})", category))
+            rows.sort(reverse=True)
+            data["cpu_by_category"] = {k: round(v, 6) for k, v in sorted(by_category.items(), key=lambda kv: -kv[1])}
+            data["top_functions"] = [
+                {"function": name, "category": category, "calls": calls,
+                 "self_s": round(self_s, 6), "cumulative_s": round(cumulative_s, 6)}
+                for self_s, cumulative_s, calls, name, category in rows[:top]
+            ]
+        return data
+
+
+class _StallWatchdog:
+    """
+    Detects event-loop stalls while a profiled request runs.
+
+    A loop callback stamps a heartbeat every ``interval_s``; a helper thread that
+    finds the heartbeat older than the threshold captures the loop thread's stack,
+    so each stall is reported with the code that blocked the loop. Stalls are
+    loop-wide: the blocking code may belong to another request.
+    """
+
+    def __init__(self, profile: RequestProfile, threshold_s: float, interval_s: float = 0.005):
+        self.profile = profile
+        self.threshold_s = threshold_s
+        self.interval_s = interval_s
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._origin = time.perf_counter()
+        self._heartbeat = self._origin
+        self._stack: Optional[list[str]] = None
+        self._stop = threading.Event()
+        self._handle = self._loop.call_later(interval_s, self._beat)
+        self._thread = threading.Thread(target=self._watch, name="profile-stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        lag = now - self._heartbeat - self.interval_s
+        if lag > self.threshold_s:
+            self.profile.stalls.append({
+                "at_ms": round((self._heartbeat - self._origin) * 1000, 1),
+                "duration_ms": round(lag * 1000, 1),
+                "stack": self._stack or [],
+            })
+        self._stack = None
+        self._heartbeat = now
+        self._handle = self._loop.call_later(self.interval_s, self._beat)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            if self._stack is None and time.perf_counter() - self._heartbeat > self.threshold_s:
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is not None:
+                    self._stack = [
+                        f"{f.filename}:{f.lineno}({f.name})" for f in traceback.extract_stack(frame)[-12:]
+                    ]
+
+    def stop(self) -> None:
+        self._handle.cancel()
+        self._stop.set()
+        self._thread.join()
+
+
+class Profiler:  # Samples requests for profiling and writes one rotating profile per request
+    """
+    On-demand per-request profiling.
+
+    A request is profiled when the caller forces it or with probability
+    ``sample_rate``. Its LLM calls record time queued for the limiters and time
+    awaiting the provider; loop CPU time and event-loop stalls are measured for its
+    duration. cProfile is per thread and the loop interleaves requests, so only one
+    request at a time gets a cProfile; its stats include whatever other requests ran
+    on the loop meanwhile. Results are written to ``directory`` as
+    ``<timestamp>-<label>.json`` (plus ``.prof`` for pstats or snakeviz), keeping
+    the newest ``max_files``.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = PROFILE_SAMPLE_RATE,
+        directory: str = PROFILE_DIR,
+        max_files: int = PROFILE_MAX_FILES,
+        stall_ms: float = PROFILE_STALL_MS,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.max_files = max_files
+        self.stall_s = stall_ms / 1000
+        self._rng = rng
+        self._cprofile_busy = False
+
+    @asynccontextmanager
+    async def request(self, label: str, forced: bool = False) -> AsyncIterator[Optional[RequestProfile]]:
+        """Profile the body if it is forced or sampled; yields the profile, or None."""
+        if not forced and not (self.sample_rate > 0 and self._rng() < self.sample_rate):
+            yield None
+            return
+        profile = RequestProfile(label)
+        profiler = None
+        if not self._cprofile_busy:
+            self._cprofile_busy = True
+            profiler = cProfile.Profile()
+        token = _current.set(profile)
+        watchdog = _StallWatchdog(profile, self.stall_s)
+        started, cpu_started = time.perf_counter(), time.thread_time()
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler or tracer owns the thread
+                profiler, self._cprofile_busy = None, False
+        try:
+            yield profile
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._cprofile_busy = False
+            profile.wall_s = time.perf_counter() - started
+            profile.loop_cpu_s = time.thread_time() - cpu_started
+            watchdog.stop()
+            _current.reset(token)
+            if profiler is not None:
+                profile.stats = pstats.Stats(profiler)
+            self._write(profile, profiler)
+
+    def _write(self, profile: RequestProfile, profiler: Optional[cProfile.Profile]) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            slug = "".join(c if c.isalnum() else "-" for c in profile.label[:40]).strip("-") or "request"
+            stem = os.path.join(self.directory, f"{profile.started_at:%Y%m%dT%H%M%S%f}-{slug}")
+            data = profile.to_dict()
+            if profiler is not None:
+                profiler.dump_stats(stem + ".prof")
+                data["cprofile"] = os.path.basename(stem + ".prof")
+            with open(stem + ".json", "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=1)
+            profile.path = stem + ".json"
+            self._rotate()
+        except OSError:
+            logger.exception("Could not write request profile to %s", self.directory)
+
+    def _rotate(self) -> None:
+        summaries = sorted(f for f in os.listdir(self.directory) if f.endswith(".json"))
+        for name in summaries[: max(0, len(summaries) - self.max_files)]:
+            for path in (name, name[:-5] + ".prof"):
+                try:
+                    os.remove(os.path.join(self.directory, path))
+                except FileNotFoundError:
+                    pass
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def summarize(profiles: list[dict], top: int = 15) -> dict:
+    """
+    Aggregate request profiles: wall-time percentiles, how wall time splits between
+    limiter queueing, provider calls and loop CPU, CPU by category, the hottest
+    functions, the slowest requests and the longest loop stalls.
+    """
+    walls = [p["wall_s"] for p in profiles]
+    total_wall = sum(walls) or 1.0
+    by_category: dict[str, float] = {}
+    functions: dict[str, list[float]] = {}
+    for p in profiles:
+        for category, seconds in p.get("cpu_by_category", {}).items():
+            by_category[category] = by_category.get(category, 0.0) + seconds
+        for row in p.get("top_functions", []):
+            stats = functions.setdefault(row["function"], [0.0, 0.0, 0])
+            stats[0] += row["self_s"]
+            stats[1] += row["cumulative_s"]
+            stats[2] += row["calls"]
+    cpu_total = sum(by_category.values()) or 1.0
+    stalls = sorted(
+        ({**s, "label": p["label"]} for p in profiles for s in p.get("stalls", [])),
+        key=lambda s: -s["duration_ms"],
+    )
+    return {
+        "requests": len(profiles),
+        "wall_s": {
+            "p50": round(_percentile(walls, 0.5), 4),
+            "p95": round(_percentile(walls, 0.95), 4),
+            "max": round(max(walls, default=0.0), 4),
+        },
+        "wall_share": {
+            "llm_queue": round(sum(p["llm"]["queue_s"] for p in profiles) / total_wall, 4),
+            "llm_provider": round(sum(p["llm"]["provider_s"] for p in profiles) / total_wall, 4),
+            "loop_cpu": round(sum(p["loop_cpu_s"] for p in profiles) / total_wall, 4),
+        },
+        "llm_calls_per_request": round(sum(p["llm"]["calls"] for p in profiles) / len(profiles), 2) if profiles else 0,
+        "cpu_by_category": {
+            k: {"seconds": round(v, 4), "share": round(v / cpu_total, 4)}
+            for k, v in sorted(by_category.items(), key=lambda kv: -kv[1])
+        },
+        "top_functions": [
+            {"function": name, "self_s": round(s[0], 4), "cumulative_s": round(s[1], 4), "calls": s[2]}
+            for name, s in sorted(functions.items(), key=lambda kv: -kv[1][0])[:top]
+        ],
+        "slowest_requests": [
+            {"label": p["label"], "wall_s": p["wall_s"], "llm_queue_s": p["llm"]["queue_s"],
+             "llm_provider_s": p["llm"]["provider_s"], "loop_cpu_s": p["loop_cpu_s"], "stalls": len(p["stalls"])}
+            for p in sorted(profiles, key=lambda p: -p["wall_s"])[:top]
+        ],
+        "longest_stalls": [
+            {"label": s["label"], "duration_ms": s["duration_ms"], "at": s["stack"][-1] if s["stack"] else None}
+            for s in stalls[:top]
+        ],
+    }
+
+
+def load_profiles(path: str) -> list[dict]:
+    """Load one profile summary, or every ``*.json`` summary in a directory."""
+    paths = [path] if os.path.isfile(path) else sorted(
+        os.path.join(path, f) for f in os.listdir(path) if f.endswith(".json")
+    )
+    profiles = []
+    for p in paths:
+        with open(p, encoding="utf-8") as fh:
+            profiles.append(json.load(fh))
+    return profiles
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize per-request profiles written via PROFILE_DIR")
+    parser.add_argument("path", nargs="?", default=PROFILE_DIR, help="profile directory or one .json summary")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--merge-prof", metavar="OUT", help="also merge the .prof files into one pstats file")
+    args = parser.parse_args(argv)
+
+    profiles = load_profiles(args.path)
+    if not profiles:
+        print(f"No profiles in {args.path}", file=sys.stderr)
+        return 1
+    print(json.dumps(summarize(profiles, args.top), indent=2))
+    if args.merge_prof:
+        directory = args.path if os.path.isdir(args.path) else os.path.dirname(args.path)
+        prof_files = [os.path.join(directory, p["cprofile"]) for p in profiles if p.get("cprofile")]
+        prof_files = [f for f in prof_files if os.path.exists(f)]
+        if prof_files:
+            pstats.Stats(*prof_files).dump_stats(args.merge_prof)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
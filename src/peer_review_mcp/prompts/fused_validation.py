@@ -0,0 +1,58 @@
+FUSED_VALIDATION_PROMPT = """
+You are an independent expert reviewer performing two reviews in one pass.
+
+You are given:
+- A question
+- Optional context about what has been discussed before
+
+Do NOT answer the question.
+
+Review 1 - risk (source: "risk"). Identify potential issues with the question, considering the context:
+- incorrect assumptions (especially related to context)
+- missing edge cases
+- factual risks
+- logical gaps
+- redundancy or repetition of what was already discussed
+- security concerns
+- API/tooling misuse
+
+Review 2 - clarity (source: "clarity"). Identify clarity issues in the question itself:
+- unclear wording
+- missing context
+- ambiguous terms
+- parts that could confuse an LLM
+- places where the intent is not explicit
+
+For each issue, classify it by:
+- source: "risk" or "clarity", depending on which review found it
+- risk_type: one of [assumptions, api_tooling, edge_cases, concurrency, security, other]
+  (for clarity issues, usually "edge_cases" or "assumptions")
+- severity: one of [low, medium, high]
+- confidence: 0.0-1.0, how confident you are this is an actual issue
+
+Return a JSON array with this structure:
+[
+  {{
+    "source": "risk|clarity",
+    "text": "description of the issue",
+    "risk_type": "assumptions|api_tooling|edge_cases|concurrency|security|other",
+    "severity": "low|medium|high",
+    "confidence": 0.85
+  }},
+  ...
+]
+
+IMPORTANT:
+- Return ONLY the JSON array, no other text
+- Be specific and actionable in your descriptions
+- Do not report the same issue under both sources
+- Clarity findings must not judge correctness, only clarity
+- Assign high severity only to critical issues
+- Be honest about confidence levels
+
+Context (if provided):
+{context}
+
+Question:
+{question}
+"""
@@ -0,0 +1,47 @@
+INCREMENTAL_VALIDATION_PROMPT = """
+You are an independent expert reviewer doing an incremental review.
+
+Earlier in this conversation a closely related question was reviewed and the
+review points below were found. You are now given a follow-up question.
+
+Your task:
+1. Decide which known review points no longer apply to the NEW question and list
+   their numbers in "obsolete".
+2. Identify only NEW issues with the new question that the known points do not
+   already cover: incorrect assumptions, missing edge cases, factual risks, logical
+   gaps, unclear or ambiguous wording, security concerns, API/tooling misuse.
+
+Do NOT answer the question. Do NOT repeat known points.
+
+For each new issue, classify it by:
+- source: "risk" for correctness/risk issues, "clarity" for wording/intent issues
+- risk_type: one of [assumptions, api_tooling, edge_cases, concurrency, security, other]
+- severity: one of [low, medium, high]
+- confidence: 0.0-1.0, how confident you are this is an actual issue
+
+Return JSON with this structure ONLY, no other text:
+{{
+  "items": [
+    {{
+      "source": "risk|clarity",
+      "text": "description of the new issue",
+      "risk_type": "assumptions|api_tooling|edge_cases|concurrency|security|other",
+      "severity": "low|medium|high",
+      "confidence": 0.85
+    }}
+  ],
+  "obsolete": [1, 3]
+}}
+
+Context (if provided):
+{context}
+
+Previous question:
+{previous_question}
+
+Known review points:
+{known_points}
+
+New question:
+{question}
+"""
@@ -1,17 +1,38 @@
 from .base import BaseReviewer
 from ..models.review_result import ReviewResult, ReviewMode
 from ..LLM.gemini_client import GeminiClient
+from ..LLM.structured import generate_structured
+from ..models.structured_output import ReviewPointList
 from ..prompts.clarity_validation import CLARITY_VALIDATION_PROMPT
-from ..llm_parsing import try_parse_json
+from ..llm_parsing import try_parse_json, extract_items, record_parse_outcome
+from ..config import CLARITY_AUDIT_RATE, CLARITY_FAST_PATH, CLARITY_LOG_PATH
+from ..outcome_log import OutcomeLog
+from peer_review_mcp import metrics
+from .clarity_heuristics import ClarityHeuristic
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
 
 class ClarityReviewer(BaseReviewer):  # Reviewer that checks clarity and extracts validation points
 
-    def __init__(self, client: GeminiClient):
+    source = "clarity"
+
+    def __init__(
+        self,
+        client: GeminiClient,
+        fast_path: bool | None = None,
+        audit_rate: float = CLARITY_AUDIT_RATE,
+        rng=random.random,
+    ):
         self.client = client
+        self.fast_path = CLARITY_FAST_PATH if fast_path is None else fast_path
+        self.heuristic = ClarityHeuristic()
+        self.outcome_log = OutcomeLog(CLARITY_LOG_PATH) if CLARITY_LOG_PATH else None
+        # Share of confident verdicts still sent to the LLM (when logging) to keep measuring agreement.
+        self.audit_rate = audit_rate
+        self._rng = rng
 
     async def review(
         self,
@@ -25,27 +46,59 @@ class ClarityReviewer(BaseReviewer):  # Reviewer that checks clarity and extract
         if mode != "validate":
             raise ValueError("Clarity reviewer supports validate mode only")
 
+        assessment = None
+        if self.fast_path or self.outcome_log:
+            assessment = self.heuristic.assess(question, context_summary)
+        if self.fast_path:
+            metrics.increment("clarity.heuristic.checks")
+            audited = self.outcome_log is not None and self.audit_rate > 0 and self._rng() < self.audit_rate
+            if assessment.decision != "uncertain" and audited:
+                metrics.increment("clarity.heuristic.audited")
+            elif assessment.decision != "uncertain":
+                # Confidently clear or unclear: the local points stand in for the LLM's.
+                metrics.increment("clarity.heuristic.hits")
+                metrics.increment(f"clarity.heuristic.{assessment.decision}")
+                return ReviewResult(mode=mode, items=[dict(p) for p in assessment.points])
+
         prompt = CLARITY_VALIDATION_PROMPT.format(question=question)
 
-        raw_text = await self.client.generate_async(prompt)
+        raw_text = await generate_structured(self.client, prompt, ReviewPointList)
 
         items = self._parse_items(raw_text)
 
+        if self.outcome_log and assessment is not None:
+            # No question text: the log only holds what the agreement report needs.
+            await self.outcome_log.awrite({
+                "score": assessment.score,
+                "decision": assessment.decision,
+                "checks": assessment.checks,
+                "features": assessment.features,
+                "llm_points": [
+                    {k: item.get(k) for k in ("severity", "risk_type", "confidence")}
+                    for item in items
+                    if isinstance(item, dict)
+                ],
+            })
+
         return ReviewResult(mode=mode, items=items)
 
     def _parse_items(self, text: str) -> list[dict | str]:
         """Try to parse as JSON first, fallback to bullet list."""
         try:
-            return self._parse_json_items(text)
+            items = self._parse_json_items(text)
         except Exception:
+            record_parse_outcome("clarity_reviewer", ok=False)
             return self._parse_bullet_list(text)
+        record_parse_outcome("clarity_reviewer", ok=True)
+        return items
 
     def _parse_json_items(self, text: str) -> list[dict]:
-        """Parse JSON array of review points with classification."""
+        """Parse JSON array (or structured ``{"items": [...]}``) of review points with classification."""
         data = try_parse_json(text)
-        if not isinstance(data, list):
+        items = extract_items(data)
+        if items is None:
             raise ValueError(f"Expected list, got {type(data)}")
-        return data
+        return items
 
     def _parse_bullet_list(self, text: str) -> list[dict]:
         """Fallback: parse bullet list and create dict structure."""
@@ -0,0 +1,72 @@
+from .base import BaseReviewer
+from ..models.review_result import ReviewResult, ReviewMode
+from ..LLM.gemini_client import GeminiClient
+from ..LLM.structured import generate_structured
+from ..models.structured_output import FusedReviewPointList
+from ..prompts.fused_validation import FUSED_VALIDATION_PROMPT
+from ..llm_parsing import try_parse_json, extract_items, record_parse_outcome
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FusedReviewer(BaseReviewer):  # Reviewer that returns risk and clarity findings from a single LLM call
+    """
+    Fused risk + clarity reviewer.
+
+    Asks for both review passes in one structured response so the question and
+    context are sent once. Each item carries a ``source`` tag ("risk" or "clarity").
+    """
+
+    source = "fused"
+    uses_context = True
+
+    def __init__(self, client: GeminiClient):
+        self.client = client
+
+    async def review(
+        self,
+        *,
+        question: str,
+        answer: str | None = None,
+        context_summary: str | None = None,
+        mode: ReviewMode
+    ) -> ReviewResult:
+
+        if mode != "validate":
+            raise ValueError("Fused reviewer supports validate mode only")
+
+        context_text = context_summary if context_summary else "(No context)"
+        prompt = FUSED_VALIDATION_PROMPT.format(question=question, context=context_text)
+
+        raw_text = await generate_structured(self.client, prompt, FusedReviewPointList)
+
+        return ReviewResult(mode=mode, items=self._parse_items(raw_text))
+
+    def _parse_items(self, text: str) -> list[dict]:
+        """Parse the fused response; untagged items default to the risk source."""
+        items = extract_items(try_parse_json(text))
+        if items is None:
+            logger.warning("Failed to parse JSON from fused reviewer")
+            record_parse_outcome("fused_reviewer", ok=False)
+            # Conservative defaults preserve a structured shape when JSON parsing fails.
+            return [
+                {
+                    "text": line.strip("-• ").strip(),
+                    "risk_type": "other",
+                    "severity": "medium",
+                    "confidence": 0.7,
+                    "source": "risk",
+                }
+                for line in text.splitlines()
+                if line.strip()
+            ]
+
+        record_parse_outcome("fused_reviewer", ok=True)
+        parsed = []
+        for item in items:
+            if isinstance(item, dict):
+                if item.get("source") not in ("risk", "clarity"):
+                    item = {**item, "source": "risk"}
+                parsed.append(item)
+        return parsed
@@ -1,9 +1,11 @@
 from .base import BaseReviewer
 from ..models.review_result import ReviewResult, ReviewMode
 from ..LLM.gemini_client import GeminiClient
+from ..LLM.structured import generate_structured
+from ..models.structured_output import ReviewPointList
 from ..prompts.validation import VALIDATION_PROMPT
 from ..prompts.polishing import POLISHING_PROMPT
-from ..llm_parsing import try_parse_json
+from ..llm_parsing import try_parse_json, extract_items, record_parse_outcome
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +13,9 @@ logger = logging.getLogger(__name__)
 
 class RiskReviewer(BaseReviewer):  # Reviewer that identifies risk/validation items and polish suggestions
 
+    source = "risk"
+    uses_context = True
+
     def __init__(self, client: GeminiClient):
         self.client = client
 
@@ -42,8 +47,12 @@ class RiskReviewer(BaseReviewer):  # Reviewer that identifies risk/validation it
             # Raise an error for unsupported modes
             raise ValueError(f"Unknown mode: {mode}")
 
-        # Generate raw text using the client based on the constructed prompt
-        raw_text = await self.client.generate_async(prompt)
+        # Generate raw text using the client based on the constructed prompt.
+        # Validate mode requests a schema-constrained response to avoid parse fallbacks.
+        if mode == "validate":
+            raw_text = await generate_structured(self.client, prompt, ReviewPointList)
+        else:
+            raw_text = await self.client.generate_async(prompt)
         return self._parse_result(raw_text, mode)  # Pass mode explicitly
 
     def _parse_result(self, raw_text: str, mode: ReviewMode) -> ReviewResult:
@@ -64,16 +73,19 @@ class RiskReviewer(BaseReviewer):  # Reviewer that identifies risk/validation it
             ]
 
     def _parse_json_items(self, text: str) -> list[dict]:
-        """Parse JSON array of review points with classification."""
+        """Parse JSON array (or structured ``{"items": [...]}``) of review points with classification."""
         data = try_parse_json(text)
-        if not isinstance(data, list):
+        items = extract_items(data)
+        if items is None:
             if data is not None:
                 logger.warning("Expected JSON array, got: %s", type(data))
             else:
                 logger.warning("Failed to parse JSON from reviewer")
+            record_parse_outcome("risk_reviewer", ok=False)
             return self._fallback_parse(text)
 
-        return data
+        record_parse_outcome("risk_reviewer", ok=True)
+        return items
 
     def _fallback_parse(self, text: str) -> list[dict]:
         """Fallback: parse bullet list and create dict structure."""
@@ -3,6 +3,9 @@ from ..models.review_result import ReviewResult, ReviewMode
 
 class BaseReviewer(ABC):  # Base interface for reviewers
 
+    # Whether validate mode reads context_summary; oversized context is then reviewed in chunks.
+    uses_context: bool = False
+
     @abstractmethod
     async def review(
         self,
@@ -0,0 +1,279 @@
+import argparse
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+from peer_review_mcp.config import CLARITY_CLEAR_MAX_SCORE, CLARITY_UNCLEAR_MIN_SCORE
+
+Decision = Literal["clear", "unclear", "uncertain"]
+
+_PRONOUN = r"(?:it|this|that|these|those|they)"
+# Not a dummy subject: "Is it safe to ...", "It's possible that ..." refer to nothing.
+_NOT_DUMMY = r"(?!(?:'s|\s+(?:is|was|seems))?\s+\w+\s+(?:to|that|if|whether)\b)"
+# Pronouns count only where they stand for something the question never names:
+# opening a sentence, as the subject after an auxiliary, or as the closing object.
+_REFERENCE_RES = (
+    re.compile(rf"(?:^|[.!?;:]\s+)\W*(?P<term>{_PRONOUN})\b{_NOT_DUMMY}", re.IGNORECASE),
+    re.compile(
+        rf"\b(?:is|was|are|were|does|did|do|can|could|will|would|should)\s+(?P<term>{_PRONOUN})\b{_NOT_DUMMY}",
+        re.IGNORECASE,
+    ),
+    re.compile(r"\b(?P<term>it|this|that|these|those|them)\W*$", re.IGNORECASE),
+    re.compile(
+        r"\b(?P<term>the above|above code|the previous( one)?|as mentioned|the same|"
+        r"my (code|script|function|error|issue|problem|setup|project)|the (error|issue|problem|code|bug|script))\b",
+        re.IGNORECASE,
+    ),
+)
+_VAGUE_RE = re.compile(
+    r"\b(something|stuff|things?|etc\.?|somehow|whatever|and so on|kind of|sort of|some kind|or something)\b",
+    re.IGNORECASE,
+)
+_SUPERLATIVE_RE = re.compile(
+    r"\b(best|fastest|optimal|most efficient|better|good|recommended|ideal|right way|should i (use|pick|choose))\b",
+    re.IGNORECASE,
+)
+# Signs that the asker stated constraints: numbers and units, versions, platforms, "for/with/under ..." clauses.
+_CONSTRAINT_RE = re.compile(
+    r"\d|\b(for (a|an|my|our|the)|with|under|without|using|on (linux|windows|mac\w*|aws|gcp|azure|kubernetes)|"
+    r"version|v\d|budget|latency|throughput|memory|requests?|users?|rows|records)\b",
+    re.IGNORECASE,
+)
+_ASK_RE = re.compile(
+    r"\?|^\s*(what|why|how|when|where|which|who|can|could|should|is|are|does|do|explain|describe|compare|list|"
+    r"write|show|give|tell|help|find|fix|implement|review|summari[sz]e)\b",
+    re.IGNORECASE,
+)
+# Concrete specifics: code, numbers/versions, CamelCase or acronym names, calls, dotted names or file names.
+_SPECIFIC_RE = re.compile(r"```|`[^`]+`|\b\d+(\.\d+)*\b|\b[A-Z][a-z]*[A-Z0-9]\w*|\b\w+\(\)|\b\w+\.\w+\b")
+
+# Logistic model weights for the probability that the question is unclear.
+_WEIGHTS = {
+    "dangling_reference": 1.8,
+    "vague_terms": 0.9,
+    "missing_constraints": 1.1,
+    "too_short": 1.6,
+    "no_explicit_ask": 0.7,
+    "many_questions": 0.6,
+    "rambling": 0.8,
+    "specifics": -0.6,
+    "context_given": -0.8,
+}
+_BIAS = -2.0
+_MAX_SPECIFICS = 3.0
+
+
+@dataclass
+class ClarityAssessment:
+    decision: Decision
+    score: float  # 0.0 (clear) - 1.0 (unclear)
+    points: list[dict] = field(default_factory=list)  # review-point dicts, same shape as the LLM reviewer's
+    checks: list[str] = field(default_factory=list)  # names of the checks that produced ``points``
+    features: dict[str, float] = field(default_factory=dict)
+
+
+def _references(question: str) -> list[str]:
+    """Dangling references in ``question``, in order of appearance."""
+    matches = [m for pattern in _REFERENCE_RES for m in pattern.finditer(question)]
+    return [m.group("term") for m in sorted(matches, key=lambda m: m.start("term"))]
+
+
+class ClarityHeuristic:  # Local, CPU-only clarity pre-check (no network)
+    """
+    Lexical clarity checks for a question, scored like the LLM clarity reviewer.
+
+    Each check that fires yields a review point (dangling references, vague terms,
+    superlatives without constraints, very short or very long questions, no
+    explicit ask, many questions at once). A logistic score over the same features,
+    reduced by concrete specifics and by available context, gives the probability
+    that the question is unclear. Scores at or below ``clear_max`` with no points
+    are "clear", scores at or above ``unclear_min`` are "unclear", and everything
+    in between is "uncertain" and should go to the LLM reviewer.
+    """
+
+    def __init__(self, clear_max: float = CLARITY_CLEAR_MAX_SCORE, unclear_min: float = CLARITY_UNCLEAR_MIN_SCORE):
+        self.clear_max = clear_max
+        self.unclear_min = unclear_min
+
+    def features(self, question: str, context_summary: Optional[str] = None) -> dict[str, float]:
+        words = question.split()
+        has_context = bool(context_summary and context_summary.strip())
+        has_code = "`" in question or "\n    " in question
+        references = _references(question)
+        return {
+            "words": float(len(words)),
+            "dangling_reference": 1.0 if references and not has_context and not has_code and len(words) < 25 else 0.0,
+            "vague_terms": float(len(_VAGUE_RE.findall(question))),
+            "missing_constraints": (
+                1.0 if _SUPERLATIVE_RE.search(question) and not _CONSTRAINT_RE.search(question) else 0.0
+            ),
+            "too_short": 1.0 if len(words) < 6 and not has_code else 0.0,
+            "no_explicit_ask": 0.0 if _ASK_RE.search(question) else 1.0,
+            "many_questions": 1.0 if question.count("?") >= 3 else 0.0,
+            "rambling": 1.0 if len(words) > 120 and question.count("?") != 1 else 0.0,
+            "specifics": min(float(len(_SPECIFIC_RE.findall(question))), _MAX_SPECIFICS),
+            "context_given": 1.0 if has_context else 0.0,
+        }
+
+    def assess(self, question: str, context_summary: Optional[str] = None) -> ClarityAssessment:
+        features = self.features(question, context_summary)
+        linear = _BIAS + sum(weight * features[name] for name, weight in _WEIGHTS.items())
+        score = round(1.0 / (1.0 + math.exp(-linear)), 3)
+        checks, points = self._points(question, features)
+
+        if score >= self.unclear_min and points:
+            decision: Decision = "unclear"
+        elif score <= self.clear_max and not points:
+            decision = "clear"
+        else:
+            decision = "uncertain"
+        return ClarityAssessment(decision, score, points, checks, features)
+
+    @staticmethod
+    def _points(question: str, features: dict[str, float]) -> tuple[list[str], list[dict]]:
+        checks: list[str] = []
+        points: list[dict] = []
+
+        def _add(check: str, text: str, risk_type: str, severity: str, confidence: float) -> None:
+            checks.append(check)
+            points.append({"text": text, "risk_type": risk_type, "severity": severity, "confidence": confidence})
+
+        if features["dangling_reference"]:
+            term = _references(question)[0]
+            _add("dangling_reference", f'The question refers to "{term}" without saying what it is',
+                 "assumptions", "high" if features["too_short"] else "medium", 0.75)
+        if features["too_short"]:
+            _add("too_short", "The question is very short; the intent and expected answer are not explicit",
+                 "assumptions", "medium", 0.65)
+        if features["missing_constraints"]:
+            _add("missing_constraints", "Asks for the best option without stating constraints "
+                 "(scale, environment, priorities) that decide it", "assumptions", "medium", 0.7)
+        if features["vague_terms"]:
+            term = _VAGUE_RE.search(question).group(0)
+            _add("vague_terms", f'Vague wording ("{term}") leaves the scope open', "edge_cases", "low", 0.6)
+        if features["no_explicit_ask"]:
+            _add("no_explicit_ask", "No explicit question or request; what answer is wanted is unclear",
+                 "other", "low", 0.55)
+        if features["many_questions"]:
+            _add("many_questions", "Several questions at once; which one matters most is unclear",
+                 "edge_cases", "low", 0.55)
+        if features["rambling"]:
+            _add("rambling", "Long question without a single clear ask", "other", "low", 0.5)
+        return checks, points
+
+
+def llm_found_issue(entry: dict) -> bool:
+    """Whether the LLM reviewer reported a medium or high severity clarity issue for a logged question."""
+    return any(p.get("severity") in ("medium", "high") for p in entry.get("llm_points", []))
+
+
+def agreement_report(
+    entries: list[dict],
+    clear_max: float = CLARITY_CLEAR_MAX_SCORE,
+    unclear_min: float = CLARITY_UNCLEAR_MIN_SCORE,
+    buckets: int = 10,
+    max_miss_rate: float = 0.1,
+) -> dict:
+    """
+    Compare logged heuristic verdicts with the LLM clarity reviewer's findings.
+
+    Verdicts are recomputed from the logged scores for the given thresholds, so the
+    report shows what a threshold change would do: the share of questions decided
+    locally, how often the LLM agreed with those decisions, the precision of each
+    check, the LLM issue rate per score bucket, and suggested thresholds keeping
+    disagreement within ``max_miss_rate`` on each side.
+    """
+    scored = [e for e in entries if "score" in e and "llm_points" in e]
+
+    def _decision(e: dict) -> str:
+        if e["score"] >= unclear_min and e.get("checks"):
+            return "unclear"
+        if e["score"] <= clear_max and not e.get("checks"):
+            return "clear"
+        return "uncertain"
+
+    decided = {"clear": [], "unclear": []}
+    for e in scored:
+        decision = _decision(e)
+        if decision in decided:
+            decided[decision].append(e)
+    agree_clear = sum(1 for e in decided["clear"] if not llm_found_issue(e))
+    agree_unclear = sum(1 for e in decided["unclear"] if llm_found_issue(e))
+    local = len(decided["clear"]) + len(decided["unclear"])
+
+    checks: dict[str, list[int]] = {}
+    for e in scored:
+        for check in e.get("checks", []):
+            stats = checks.setdefault(check, [0, 0])
+            stats[0] += 1
+            stats[1] += llm_found_issue(e)
+
+    rows = []
+    for i in range(buckets):
+        lo, hi = i / buckets, (i + 1) / buckets
+        in_bucket = [e for e in scored if lo <= e["score"] < hi or (i == buckets - 1 and e["score"] == 1.0)]
+        rows.append({
+            "range": [round(lo, 2), round(hi, 2)],
+            "count": len(in_bucket),
+            "llm_issue_rate": (
+                round(sum(llm_found_issue(e) for e in in_bucket) / len(in_bucket), 3) if in_bucket else None
+            ),
+        })
+
+    suggested_clear = 0.0
+    suggested_unclear = 1.0
+    for i in range(1, buckets + 1):
+        edge = i / buckets
+        below = [e for e in scored if e["score"] <= edge and not e.get("checks")]
+        if below and sum(llm_found_issue(e) for e in below) / len(below) <= max_miss_rate:
+            suggested_clear = edge
+    for i in range(buckets - 1, -1, -1):
+        edge = i / buckets
+        above = [e for e in scored if e["score"] >= edge and e.get("checks")]
+        if above and sum(not llm_found_issue(e) for e in above) / len(above) <= max_miss_rate:
+            suggested_unclear = edge
+
+    return {
+        "questions": len(scored),
+        "thresholds": {"clear_max": clear_max, "unclear_min": unclear_min},
+        "local_decision_rate": round(local / len(scored), 3) if scored else 0.0,
+        "agreement": round((agree_clear + agree_unclear) / local, 3) if local else None,
+        "clear": {
+            "count": len(decided["clear"]),
+            "llm_agreed": round(agree_clear / len(decided["clear"]), 3) if decided["clear"] else None,
+        },
+        "unclear": {
+            "count": len(decided["unclear"]),
+            "llm_agreed": round(agree_unclear / len(decided["unclear"]), 3) if decided["unclear"] else None,
+        },
+        "check_precision": {
+            check: {"fired": fired, "llm_agreed": round(hits / fired, 3)}
+            for check, (fired, hits) in sorted(checks.items())
+        },
+        "buckets": rows,
+        "suggested_clear_max": suggested_clear,
+        "suggested_unclear_min": suggested_unclear,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Agreement report: clarity heuristic vs the LLM clarity reviewer")
+    parser.add_argument("log", help="JSONL log written via CLARITY_LOG_PATH")
+    parser.add_argument("--clear-max", type=float, default=CLARITY_CLEAR_MAX_SCORE)
+    parser.add_argument("--unclear-min", type=float, default=CLARITY_UNCLEAR_MIN_SCORE)
+    parser.add_argument("--buckets", type=int, default=10)
+    parser.add_argument("--max-miss-rate", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    with open(args.log, encoding="utf-8") as fh:
+        entries = [json.loads(line) for line in fh if line.strip()]
+    report = agreement_report(entries, args.clear_max, args.unclear_min, args.buckets, args.max_miss_rate)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
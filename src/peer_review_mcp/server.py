@@ -1,22 +1,42 @@
 import truststore
 import os
+import time
 
 truststore.inject_into_ssl()
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
 from typing import Optional
 from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.lifecycle import InflightTracker
+from peer_review_mcp.admission import AdmissionController
+from peer_review_mcp.LLM.cassette import CassetteRequest, get_cassette
+from peer_review_mcp.LLM.scheduling import call_tag
+from peer_review_mcp.profiling import Profiler
+from peer_review_mcp import metrics
+import anyio
+from peer_review_mcp.config import MCP_TRANSPORT, MCP_HOST, MCP_PORT, MCP_WORKERS, SHUTDOWN_GRACE_S
 import logging
 
 # Initialize logger
 logger = logging.getLogger("PeerReviewServer")
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
 mcp = FastMCP(
     "Peer Review MCP",
     json_response=True,
+    host=MCP_HOST,
+    port=MCP_PORT,
+    # Requests from one client may land on any worker, so sessions cannot be process-local.
+    stateless_http=MCP_WORKERS > 1,
 )
 
+# One orchestrator per process: each worker keeps its own warm clients and caches.
 _orchestrator = CentralOrchestrator()
+_inflight = InflightTracker()
+_admission = AdmissionController()
+_profiler = Profiler()
 
 
 @mcp.tool(
@@ -39,6 +59,14 @@ _orchestrator = CentralOrchestrator()
         "- question (required): The user's original question, quoted verbatim\n"
         "- context_summary (optional): Brief summary of prior context only. Do NOT repeat or paraphrase the question. "
         "Do NOT send full chat history. Include only background that affects the answer.\n"
+        "- time_budget_s (optional): Seconds you can wait for the answer. Under load the server "
+        "answers with reduced review, or declines, rather than exceed it; work still running "
+        "when the budget is spent is cancelled\n"
+        "- tenant (optional): Name of the user or workload the request is made for; LLM capacity "
+        "is shared fairly between tenants\n"
+        "- priority (optional): \"interactive\" (default) when a user is waiting for the answer, "
+        "\"batch\" for bulk or background work, which yields to interactive requests\n"
+        "- profile (optional): Set true to profile this request server-side (for diagnosing slow requests)\n"
         "\n"
         "Returns:\n"
         "- answer: Peer-reviewed answer (str), or None if system cannot verify\n"
@@ -47,21 +75,135 @@ _orchestrator = CentralOrchestrator()
         "IMPORTANT: If answer is None, respond directly to the user without using this tool again."
     ),
 )
-async def answer_with_peer_review(question: str, context_summary: Optional[str] = None) -> dict:
+async def answer_with_peer_review(
+    question: str,
+    context_summary: Optional[str] = None,
+    time_budget_s: Optional[float] = None,
+    tenant: Optional[str] = None,
+    priority: Optional[str] = None,
+    profile: bool = False,
+) -> dict:
     logger.info("Received question: %s", question)
     if context_summary:
         logger.info("Context summary provided: %s", context_summary)
+
+    # LLM calls made for this request, in any task it starts, are scheduled under this tag.
+    with call_tag(tenant, priority):
+        started = time.monotonic()
+        async with _profiler.request(question, forced=profile) as request_profile:
+            response = await _answer(question, context_summary, time_budget_s)
+    if request_profile is not None and request_profile.path and isinstance(response.get("meta"), dict):
+        response["meta"]["profile"] = request_profile.path
+
+    cassette = get_cassette()
+    if cassette is not None and cassette.recording:
+        meta = response.get("meta") or {}
+        cassette.record_request(CassetteRequest(
+            question=question,
+            latency_s=time.monotonic() - started,
+            answered=response.get("answer") is not None,
+            polished=bool(meta.get("polishing_applied")),
+            context_summary=context_summary,
+            time_budget_s=time_budget_s,
+            tenant=tenant,
+            priority=priority,
+        ))
+    return response
+
+
+async def _answer(question: str, context_summary: Optional[str], time_budget_s: Optional[float]) -> dict:
+    decision = _admission.admit(time_budget_s)
+    if decision.action == "reject":
+        logger.warning("Rejecting request (%s, estimated wait %.1fs)", decision.reason, decision.estimated_wait_s)
+        return {
+            "answer": None,
+            "meta": {
+                "error": "overloaded",
+                "reason": decision.reason,
+                "retry_after_s": decision.estimated_wait_s,
+            },
+        }
+
+    options = {}
+    if decision.mode == "degraded":
+        options["degraded"] = True
+    queued_at = time.monotonic()
     try:
-        response = await _orchestrator.process(question=question, context_summary=context_summary)
+        # Cancellation (client cancel or disconnect) propagates through the pipeline
+        # into the pending LLM calls; the admission slot is released on the way out.
+        async with _inflight.track(), _admission.slot(decision.mode):
+            if time_budget_s and time_budget_s > 0:
+                # Whatever the queue did not use of the budget is the pipeline's deadline.
+                options["deadline_s"] = max(time_budget_s - (time.monotonic() - queued_at), 0.001)
+            response = await _orchestrator.process(
+                question=question,
+                context_summary=context_summary,
+                **options,
+            )
+        if _admission.enabled and isinstance(response.get("meta"), dict):
+            response["meta"]["admission"] = {
+                "mode": decision.mode,
+                "estimated_wait_s": decision.estimated_wait_s,
+            }
         logger.info("Orchestrator response: %s", response)
         return response
+    except anyio.get_cancelled_exc_class():
+        metrics.increment("admission.cancelled")
+        logger.info("Request cancelled by the client: %s", question[:100])
+        raise
     except Exception as e:
         logger.exception("Error during peer review process: %s", e)
         raise
 
 
+def create_app():
+    """
+    ASGI app for the configured HTTP transport (uvicorn factory, one call per worker).
+
+    The app's lifespan is wrapped so that shutdown first drains in-flight tool
+    calls for up to SHUTDOWN_GRACE_S, then cancels background cache refreshes,
+    before the MCP session manager stops.
+    """
+    app = mcp.sse_app() if MCP_TRANSPORT == "sse" else mcp.streamable_http_app()
+    inner_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(a):
+        async with inner_lifespan(a) as state:
+            try:
+                yield state
+            finally:
+                await _inflight.drain(SHUTDOWN_GRACE_S)
+                await _orchestrator.aclose()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
 def run() -> None:
-    mcp.run(transport="stdio")
+    if MCP_TRANSPORT not in TRANSPORTS:
+        raise ValueError(f"Unknown MCP_TRANSPORT {MCP_TRANSPORT!r}; expected one of {', '.join(TRANSPORTS)}")
+    if MCP_TRANSPORT == "stdio":
+        mcp.run(transport="stdio")
+        return
+
+    import uvicorn
+
+    workers = max(1, MCP_WORKERS)
+    if workers > 1 and MCP_TRANSPORT == "sse":
+        # An SSE stream and the POSTs for its session must reach the same process.
+        logger.warning("SSE transport does not support multiple workers; starting 1 worker")
+        workers = 1
+    logger.info("Serving %s on %s:%d with %d worker(s)", MCP_TRANSPORT, MCP_HOST, MCP_PORT, workers)
+    uvicorn.run(
+        "peer_review_mcp.server:create_app",
+        factory=True,
+        host=MCP_HOST,
+        port=MCP_PORT,
+        workers=workers,
+        timeout_graceful_shutdown=int(SHUTDOWN_GRACE_S),
+        log_level=os.getenv("LOG_LEVEL", "INFO").lower(),
+    )
 
 
 if __name__ == "__main__":
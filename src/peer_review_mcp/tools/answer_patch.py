@@ -0,0 +1,160 @@
+import difflib
+import re
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+EditOp = Literal["replace", "insert_before", "insert_after", "delete"]
+EDIT_OPS = ("replace", "insert_before", "insert_after", "delete")
+
+# Typographic variants models substitute when copying an anchor.
+_EQUIVALENT = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"', "–": "-", "—": "-"})
+_FUZZY_MIN_CHARS = 24  # shorter anchors match too many places approximately
+_FUZZY_MIN_RATIO = 0.9
+
+
+class PatchError(ValueError):
+    """An edit list that cannot be applied safely; the caller falls back to a full rewrite."""
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerEdit:
+    """One anchored edit: ``anchor`` is a passage copied from the answer."""
+    op: EditOp
+    anchor: str
+    text: str = ""
+
+    def describe(self) -> str:
+        """The edit as a polishing comment, for the rewrite fallback."""
+        if self.op == "delete":
+            return f'Remove "{self.anchor}"'
+        if self.op == "replace":
+            return f'Replace "{self.anchor}" with "{self.text}"'
+        where = "before" if self.op == "insert_before" else "after"
+        return f'Insert "{self.text}" {where} "{self.anchor}"'
+
+
+def parse_edits(items) -> list[AnswerEdit]:
+    """Build edits from the model's ``edits`` list; malformed entries raise PatchError."""
+    if not isinstance(items, list):
+        raise PatchError(f"expected a list of edits, got {type(items).__name__}")
+    edits = []
+    for item in items:
+        if not isinstance(item, dict) or item.get("op") not in EDIT_OPS:
+            raise PatchError(f"malformed edit: {item!r}"[:200])
+        anchor, text = str(item.get("anchor") or ""), str(item.get("text") or "")
+        if not anchor.strip():
+            raise PatchError("edit without an anchor")
+        edits.append(AnswerEdit(item["op"], anchor, "" if item["op"] == "delete" else text))
+    return edits
+
+
+def _normalized(text: str) -> tuple[str, list[int]]:
+    """Whitespace-collapsed, typographically normalized text and, per character, its source index."""
+    chars: list[str] = []
+    index: list[int] = []
+    for i, ch in enumerate(text.translate(_EQUIVALENT)):
+        if ch.isspace():
+            if chars and chars[-1] == " ":
+                continue
+            ch = " "
+        chars.append(ch)
+        index.append(i)
+    return "".join(chars), index
+
+
+def _unique(haystack: str, needle: str) -> Optional[int]:
+    first = haystack.find(needle)
+    if first < 0:
+        return None
+    if haystack.find(needle, first + 1) >= 0:
+        raise PatchError(f"ambiguous anchor: {needle[:80]!r}")
+    return first
+
+
+def find_anchor(answer: str, anchor: str) -> tuple[int, int]:
+    """
+    Locate ``anchor`` in ``answer`` and return its ``(start, end)`` span.
+
+    Tries an exact match, then one insensitive to whitespace runs and typographic
+    quotes/dashes, then (for anchors of at least 24 characters) the most similar
+    word-aligned window with a similarity ratio of at least 0.9. An anchor found
+    more than once, or not at all, raises PatchError.
+    """
+    start = _unique(answer, anchor)
+    if start is not None:
+        return start, start + len(anchor)
+
+    norm_answer, index = _normalized(answer)
+    norm_anchor = _normalized(anchor.strip())[0]
+    start = _unique(norm_answer, norm_anchor)
+    if start is not None:
+        return index[start], index[start + len(norm_anchor) - 1] + 1
+
+    if len(norm_anchor) >= _FUZZY_MIN_CHARS:
+        span = _fuzzy(norm_answer, norm_anchor)
+        if span is not None:
+            return index[span[0]], index[span[1] - 1] + 1
+    raise PatchError(f"anchor not found: {anchor[:80]!r}")
+
+
+def _fuzzy(text: str, anchor: str) -> Optional[tuple[int, int]]:
+    starts = [0] + [m.end() for m in re.finditer(r" ", text)]
+    best, best_ratio, runner_up = None, 0.0, 0.0
+    matcher = difflib.SequenceMatcher(autojunk=False)
+    matcher.set_seq2(anchor)
+    for start in starts:
+        for length in range(len(anchor) - 2, len(anchor) + 3):
+            window = text[start:start + length].rstrip()
+            if not window:
+                continue
+            matcher.set_seq1(window)
+            if matcher.real_quick_ratio() < _FUZZY_MIN_RATIO or matcher.quick_ratio() < _FUZZY_MIN_RATIO:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                if best is None or start != best[0]:
+                    runner_up = best_ratio
+                best, best_ratio = (start, start + len(window)), ratio
+            elif best is not None and start != best[0]:
+                runner_up = max(runner_up, ratio)
+    if best is None or best_ratio < _FUZZY_MIN_RATIO:
+        return None
+    if runner_up >= _FUZZY_MIN_RATIO and best_ratio - runner_up < 0.05:
+        raise PatchError(f"ambiguous anchor: {anchor[:80]!r}")
+    return best
+
+
+def apply_edits(answer: str, edits: list[AnswerEdit]) -> str:
+    """
+    Apply ``edits`` to ``answer`` and return the patched text.
+
+    Every anchor is located in the original answer first, so edits do not see each
+    other's output and their order does not matter; overlapping replacements raise
+    PatchError. Deleting a passage also drops one of the spaces around it.
+    """
+    if not edits:
+        raise PatchError("no edits")
+    located = []
+    for edit in edits:
+        start, end = find_anchor(answer, edit.anchor)
+        if edit.op == "insert_before":
+            located.append((start, start, edit.text))
+        elif edit.op == "insert_after":
+            located.append((end, end, edit.text))
+        else:
+            located.append((start, end, edit.text))
+    located.sort(key=lambda span: (span[0], span[1]))
+    for (_, prev_end, _), (start, end, _) in zip(located, located[1:]):
+        if start < prev_end:
+            raise PatchError("overlapping edits")
+
+    patched = answer
+    for start, end, text in reversed(located):
+        if not text and start < end:
+            before, after = patched[start - 1:start] if start else "", patched[end:end + 1]
+            if before == " " and not after.isalnum():
+                start -= 1
+            elif before in ("", "\n") and after == " ":
+                end += 1
+        patched = patched[:start] + text + patched[end:]
+    return patched
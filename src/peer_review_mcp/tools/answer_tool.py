@@ -10,6 +10,7 @@ async def answer_tool(
     question: str,
     context_summary: Optional[str] = None,
     review_points: Union[List[ReviewPoint], List[str]] = None,
+    tier: int = 0,
 ) -> dict:
     """
     Internal tool: takes question + context_summary + review points and returns synthesized answer.
@@ -18,6 +19,7 @@ async def answer_tool(
         question: The user's question
         context_summary: Optional short summary of relevant context (not full conversation)
         review_points: List of ReviewPoint objects or strings with issues/insights
+        tier: Synthesis model tier (0 = default/cheapest)
 
     Returns:
         Dictionary with 'answer' key containing the synthesized response
@@ -33,10 +35,13 @@ async def answer_tool(
         else:
             review_point_texts.append(str(point))
 
+    # Tier 0 keeps the engine's default call; higher tiers are passed explicitly.
+    routing = {"tier": tier} if tier else {}
     return await _engine.answer(
         question=question,
         context_summary=context_summary,
         review_points=review_point_texts,
+        **routing,
     )
 
 
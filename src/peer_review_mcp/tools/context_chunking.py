@@ -0,0 +1,190 @@
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from peer_review_mcp.cache.embedding import content_words
+from peer_review_mcp.config import (
+    CONTEXT_CHUNK_CHARS,
+    CONTEXT_CHUNK_OVERLAP_CHARS,
+    CONTEXT_MAX_CHUNKS,
+    CONTEXT_DIGEST_CHARS,
+)
+from peer_review_mcp.models.review_point import ReviewPoint
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=\S)|\n")
+_SPECIFIC_RE = re.compile(r"\d|`|\b\w+\(\)|\b\w+\.\w+\b|\b[A-Z][a-z]*[A-Z0-9]\w*")
+_SEVERITY_RANK = {"high": 3, "medium": 2, "low": 1}
+_GAP = " […] "
+
+
+def _segments(text: str) -> list[str]:
+    """Sentences (and lines), in order; paragraph starts are kept as separate segments."""
+    segments = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        segments.extend(s.strip() for s in _SENTENCE_RE.split(paragraph) if s.strip())
+    return segments
+
+
+def _tail(text: str, chars: int) -> str:
+    """The last ``chars`` characters of ``text``, starting at a word boundary."""
+    if chars <= 0:
+        return ""
+    tail = text[-chars:]
+    space = tail.find(" ")
+    return tail[space + 1:] if 0 <= space < len(tail) - 1 and len(text) > chars else tail
+
+
+class ContextChunker:  # Splits oversized context summaries and compresses them for synthesis
+    """
+    Map-reduce support for large ``context_summary`` inputs.
+
+    ``split`` packs sentences into chunks of about ``chunk_chars`` (a longer
+    sentence is cut), each starting with the last ``overlap_chars`` of the previous
+    one so that a point spanning a boundary is seen whole; the chunk size grows
+    when more than ``max_chunks`` chunks would be needed. ``digest`` is an
+    extractive summary of at most ``digest_chars``: the sentences sharing the most
+    content words with the question, plus specifics (numbers, code, identifiers)
+    and paragraph openings, kept in their original order. Digests are memoized, as
+    synthesis and polishing ask for the same one. ``chunk_chars`` of 0 disables both.
+    """
+
+    def __init__(
+        self,
+        chunk_chars: int = CONTEXT_CHUNK_CHARS,
+        overlap_chars: int = CONTEXT_CHUNK_OVERLAP_CHARS,
+        max_chunks: int = CONTEXT_MAX_CHUNKS,
+        digest_chars: int = CONTEXT_DIGEST_CHARS,
+        max_digests: int = 64,
+    ):
+        self.chunk_chars = max(0, chunk_chars)
+        self.overlap_chars = max(0, min(overlap_chars, self.chunk_chars // 2))
+        self.max_chunks = max(1, max_chunks)
+        self.digest_chars = digest_chars
+        self.max_digests = max_digests
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[tuple[str, str], str]" = OrderedDict()
+
+    def oversized(self, context_summary: Optional[str]) -> bool:
+        return bool(self.chunk_chars and context_summary and len(context_summary) > self.chunk_chars)
+
+    def split(self, text: str) -> list[str]:
+        """Overlapping chunks covering ``text`` (the text itself when it fits in one)."""
+        if not self.oversized(text):
+            return [text]
+        size = max(self.chunk_chars, math.ceil(len(text) / self.max_chunks))
+        while True:
+            chunks = self._pack(text, size)
+            if len(chunks) <= self.max_chunks:
+                return chunks
+            size = math.ceil(size * 1.25)  # overlap and sentence packing can push the count over
+
+    def _pack(self, text: str, size: int) -> list[str]:
+        chunks: list[str] = []
+        current = ""
+        for segment in _segments(text):
+            while len(segment) > size:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(segment[:size])
+                segment = segment[size:]
+            if current and len(current) + 1 + len(segment) > size:
+                chunks.append(current)
+                current = ""
+            current = f"{current} {segment}" if current else segment
+        if current:
+            chunks.append(current)
+        if self.overlap_chars:
+            chunks = [chunks[0]] + [
+                f"{_tail(previous, self.overlap_chars)} {chunk}" for previous, chunk in zip(chunks, chunks[1:])
+            ]
+        return chunks
+
+    def digest(self, question: str, context_summary: Optional[str]) -> Optional[str]:
+        """The context to answer from: ``context_summary`` as is, or its digest when oversized."""
+        if not self.oversized(context_summary):
+            return context_summary
+        key = (question, hashlib.sha256(context_summary.encode("utf-8")).hexdigest())
+        with self._lock:
+            if key in self._digests:
+                self._digests.move_to_end(key)
+                return self._digests[key]
+        digest = self._extract(question, context_summary)
+        with self._lock:
+            self._digests[key] = digest
+            while len(self._digests) > self.max_digests:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _extract(self, question: str, text: str) -> str:
+        if len(text) <= self.digest_chars:
+            return text
+        segments = []
+        for paragraph in _PARAGRAPH_RE.split(text):
+            parts = [s.strip() for s in _SENTENCE_RE.split(paragraph) if s.strip()]
+            segments.extend((s, i == 0) for i, s in enumerate(parts))
+        wanted = content_words(question)
+
+        def _score(index: int) -> float:
+            sentence, opens_paragraph = segments[index]
+            words = content_words(sentence)
+            overlap = len(words & wanted) / (len(wanted) or 1)
+            return (
+                2.0 * overlap
+                + (0.3 if _SPECIFIC_RE.search(sentence) else 0.0)
+                + (0.2 if opens_paragraph else 0.0)
+                + (0.2 if index == len(segments) - 1 else 0.0)  # the latest turn of the conversation
+            )
+
+        ranked = sorted(range(len(segments)), key=lambda i: (-_score(i), i))
+        chosen: list[int] = []
+        used = 0
+        for index in ranked:
+            sentence = segments[index][0]
+            if used + len(sentence) + len(_GAP) > self.digest_chars:
+                continue
+            chosen.append(index)
+            used += len(sentence) + len(_GAP)
+        if not chosen:
+            return text[: self.digest_chars]
+
+        parts = []
+        previous = -1
+        for index in sorted(chosen):
+            if parts and index != previous + 1:
+                parts.append(_GAP.strip())
+            parts.append(segments[index][0])
+            previous = index
+        return " ".join(parts)
+
+
+def merge_review_points(points: list[ReviewPoint], threshold: float = 0.6) -> list[ReviewPoint]:
+    """
+    Dedup points found in several chunks.
+
+    Points with the same source whose content words overlap by at least
+    ``threshold`` (Jaccard) are one finding; the most severe, then most confident,
+    copy is kept, at the position of the first.
+    """
+    kept: list[tuple[ReviewPoint, frozenset[str]]] = []
+    for point in points:
+        words = content_words(point.text)
+        for i, (other, other_words) in enumerate(kept):
+            if other.source != point.source:
+                continue
+            union = words | other_words
+            if union and len(words & other_words) / len(union) >= threshold or point.text == other.text:
+                if _rank(point) > _rank(other):
+                    kept[i] = (point, words)
+                break
+        else:
+            kept.append((point, words))
+    return [point for point, _ in kept]
+
+
+def _rank(point: ReviewPoint) -> tuple[int, float]:
+    return _SEVERITY_RANK.get(point.severity, 0), point.confidence or 0.0
@@ -1,8 +1,18 @@
+import json
 import logging
-from peer_review_mcp.LLM.gemini_client import GeminiClient
+from typing import Optional
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM.routing import get_router
+from peer_review_mcp.LLM.structured import generate_structured
 from peer_review_mcp.models.polish_comment import PolishComment
+from peer_review_mcp.models.structured_output import PolishPatchSchema, SelfCritiqueSchema
+from peer_review_mcp.LLM.usage import capture_usage
 from peer_review_mcp.reviewers.RiskReviewer import RiskReviewer
 from peer_review_mcp.reviewers.base import BaseReviewer
+from peer_review_mcp.prompts.self_critique import SELF_CRITIQUE_REWRITE_PROMPT
+from peer_review_mcp.prompts.polish_patch import POLISH_PATCH_PROMPT
+from peer_review_mcp.tools.answer_patch import AnswerEdit, PatchError, apply_edits, parse_edits
+from peer_review_mcp.llm_parsing import try_parse_json, record_parse_outcome
 from ..models.review_result import ReviewResult
 
 logger = logging.getLogger(__name__)
@@ -16,7 +26,8 @@ class PolishingEngine:  # Runs polishing reviewers and aggregates polish suggest
     """
 
     def __init__(self):
-        client = GeminiClient()
+        client = get_router().client("polish")
+        self.client = client
         self.reviewers: list[BaseReviewer] = [
             RiskReviewer(client),
         ]
@@ -62,3 +73,133 @@ class PolishingEngine:  # Runs polishing reviewers and aggregates polish suggest
                 logger.error("Reviewer %s failed: %s", reviewer.__class__.__name__, str(e))
 
         return comments
+
+    async def critique_and_rewrite(
+        self, *, question: str, answer: str, context_summary: str = None, client=None
+    ) -> tuple[list[PolishComment], Optional[str]]:
+        """
+        Single-call Phase B: critique the answer and rewrite it in one structured response.
+
+        Args:
+            question: Original user question
+            answer: Generated answer to polish
+            context_summary: Optional summary of relevant context
+            client: Optional client override (e.g. an escalated polish tier)
+
+        Returns:
+            A tuple of (comments, revised_answer). ``revised_answer`` is None when the
+            critique found no material issues or the response could not be parsed,
+            in which case the caller keeps the original answer.
+        """
+        prompt = SELF_CRITIQUE_REWRITE_PROMPT.format(
+            question=question,
+            answer=answer,
+            context=context_summary if context_summary else "(No previous context)",
+        )
+        raw = await generate_structured(client or self.client, prompt, SelfCritiqueSchema)
+
+        data = try_parse_json(raw)
+        if not isinstance(data, dict):
+            logger.warning("Failed to parse self-critique JSON, keeping original answer")
+            record_parse_outcome("self_critique", ok=False)
+            return [], None
+        record_parse_outcome("self_critique", ok=True)
+
+        raw_comments = data.get("comments") or []
+        comments = [
+            PolishComment(text=str(c).strip())
+            for c in (raw_comments if isinstance(raw_comments, list) else [raw_comments])
+            if str(c).strip()
+        ]
+        revised = str(data.get("revised_answer") or "").strip()
+        if not data.get("material_issues", bool(comments)) or not revised:
+            return comments, None
+        return comments, revised
+
+    async def critique_and_patch(
+        self, *, question: str, answer: str, context_summary: str = None, client=None
+    ) -> tuple[list[PolishComment], Optional[str], Optional[list[AnswerEdit]]]:
+        """
+        Patch-mode Phase B: critique the answer and fix it with anchored edits applied locally.
+
+        The model returns only the edits, so its output scales with the size of the
+        changes rather than of the answer. Output tokens of the call and an estimate
+        of those a full rewrite would have taken are added to the
+        ``polish.patch.output_tokens``, ``polish.patch.rewrite_tokens`` and
+        ``polish.patch.output_tokens_saved`` counters.
+
+        Args:
+            question: Original user question
+            answer: Generated answer to polish
+            context_summary: Optional summary of relevant context
+            client: Optional client override (e.g. an escalated polish tier)
+
+        Returns:
+            A tuple of (comments, patched_answer, unapplied_edits). ``patched_answer``
+            is None when there is nothing to change or the patch could not be applied;
+            in the latter case ``unapplied_edits`` holds the edits (empty when the
+            response was unparseable or had no usable edits) so the caller can fall
+            back to a rewrite.
+        """
+        prompt = POLISH_PATCH_PROMPT.format(
+            question=question,
+            answer=answer,
+            context=context_summary if context_summary else "(No previous context)",
+        )
+        with capture_usage() as usage:
+            raw = await generate_structured(client or self.client, prompt, PolishPatchSchema)
+
+        data = try_parse_json(raw)
+        if not isinstance(data, dict):
+            logger.warning("Failed to parse polish patch JSON, falling back to a rewrite")
+            record_parse_outcome("polish_patch", ok=False)
+            metrics.increment("polish.patch.failed")
+            return [], None, []
+        record_parse_outcome("polish_patch", ok=True)
+
+        raw_comments = data.get("comments") or []
+        comments = [
+            PolishComment(text=str(c).strip())
+            for c in (raw_comments if isinstance(raw_comments, list) else [raw_comments])
+            if str(c).strip()
+        ]
+        if not data.get("material_issues", bool(comments)):
+            return comments, None, None
+        if not data.get("edits"):
+            # Issues without edits: the caller rewrites from the comments instead.
+            logger.warning("Polish patch reported material issues but no edits, falling back to a rewrite")
+            metrics.increment("polish.patch.failed")
+            return comments, None, []
+
+        try:
+            edits = parse_edits(data["edits"])
+        except PatchError as e:
+            logger.warning("Unusable polish edits (%s), falling back to a rewrite", e)
+            metrics.increment("polish.patch.failed")
+            return comments, None, []
+        try:
+            patched = apply_edits(answer, edits)
+        except PatchError as e:
+            logger.warning("Polish patch did not apply (%s), falling back to a rewrite", e)
+            metrics.increment("polish.patch.failed")
+            return comments, None, edits
+
+        output_tokens = usage.get("output_tokens") or _estimate_tokens(raw)
+        # What the single-call critique-and-rewrite response would have been.
+        rewrite_tokens = _estimate_tokens(json.dumps({
+            "comments": [c.text for c in comments], "material_issues": True, "revised_answer": patched,
+        }))
+        metrics.increment("polish.patch.applied")
+        metrics.increment("polish.patch.edits", len(edits))
+        metrics.increment("polish.patch.output_tokens", output_tokens)
+        metrics.increment("polish.patch.rewrite_tokens", rewrite_tokens)
+        metrics.increment("polish.patch.output_tokens_saved", max(0, rewrite_tokens - output_tokens))
+        logger.info(
+            "Applied %d polish edits (%d output tokens, ~%d for a rewrite)", len(edits), output_tokens, rewrite_tokens
+        )
+        return comments, patched, None
+
+
+def _estimate_tokens(text: str) -> int:
+    # About four characters per token for English text and JSON.
+    return max(1, round(len(text) / 4))
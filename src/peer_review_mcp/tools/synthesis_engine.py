@@ -1,7 +1,9 @@
 from typing import Optional
 from ..prompts.answer_synthesis import ANSWER_SYNTHESIS_PROMPT
-from peer_review_mcp.LLM.chatgpt_client import ChatGPTClient
-from peer_review_mcp.llm_parsing import try_parse_json, strip_markdown
+from peer_review_mcp.LLM.routing import get_router
+from peer_review_mcp.LLM.structured import generate_structured
+from peer_review_mcp.models.structured_output import SynthesisSchema
+from peer_review_mcp.llm_parsing import try_parse_json, strip_markdown, record_parse_outcome
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,14 +12,17 @@ logger = logging.getLogger(__name__)
 class SynthesisEngine:  # Builds synthesis prompts, calls LLM to generate final answers, parses result
     # This engine is responsible for synthesizing answers using the provided clients.
     def __init__(self):
-        # Initialize the ChatGPT client for generating responses.
-        self.client = ChatGPTClient()
+        # Tier 0 of the synthesis ladder (ChatGPT by default) serves most requests;
+        # higher tiers are only used when the orchestrator escalates.
+        self.router = get_router()
+        self.client = self.router.client("synthesis")
 
     async def answer(
         self,
         question: str,
         context_summary: Optional[str] = None,
         review_points: list[str] = None,
+        tier: int = 0,
     ) -> dict:
         """
         Generate an answer based on the provided question, context, and review points.
@@ -26,13 +31,17 @@ class SynthesisEngine:  # Builds synthesis prompts, calls LLM to generate final
             question (str): The main question to be answered.
             context_summary (Optional[str]): A summary of the conversation context, if available.
             review_points (list[str]): Specific points to avoid in the answer.
+            tier (int): Index into the synthesis model ladder; 0 uses the default client.
 
         Returns:
-            dict: A dictionary containing the generated answer, confidence score, and polish status.
+            dict: A dictionary containing the generated answer, confidence score, polish status,
+                and the tier/model that served the request.
 
         Note:
             The synthesizer attempts to parse an LLM response as JSON (keys: "answer", "confidence", "needs_polish").
             If parsing fails (rare), the raw text is returned with conservative defaults to allow processing to continue.
+            Clients that support structured output are asked for a SynthesisSchema-shaped reply, which
+            removes most parse fallbacks (and the Phase B rounds they force).
         """
         # Ensure review_points is initialized as an empty list if not provided
         if review_points is None:
@@ -51,21 +60,28 @@ class SynthesisEngine:  # Builds synthesis prompts, calls LLM to generate final
         Review points to avoid: {formatted_points}
         """
 
-        # Send the prompt to the LLM and retrieve the raw response
-        raw = await self.client.generate_async(prompt)  # Timeout handling is managed by ChatGPTClient
+        # Send the prompt to the LLM and retrieve the raw response.
+        # Structured output (when supported) constrains the reply to SynthesisSchema.
+        client = self.client if tier == 0 else self.router.client("synthesis", tier)
+        served_by = {"tier": tier, "model": self.router.tier("synthesis", tier).name}
+        raw = await generate_structured(client, prompt, SynthesisSchema)  # Timeout handling is managed by the client
 
         data = try_parse_json(raw)
         if isinstance(data, dict) and "answer" in data:
+            record_parse_outcome("synthesis", ok=True)
             return {
                 "answer": strip_markdown(str(data["answer"])),
                 "confidence": float(data.get("confidence", 0.8)),
                 "needs_polish": bool(data.get("needs_polish", False)),
+                **served_by,
             }
         else:
             # Log an error and return a fallback response if parsing fails
             logger.exception("Failed to parse synthesis JSON, falling back to raw answer")
+            record_parse_outcome("synthesis", ok=False)
             return {
                 "answer": strip_markdown(raw.strip()),
                 "confidence": 0.5,  # Default confidence for fallback
                 "needs_polish": True,  # Assume polishing is needed
+                **served_by,
             }
@@ -4,7 +4,9 @@ from peer_review_mcp.tools.validation_engine import ValidationEngine
 _engine = ValidationEngine()
 
 
-async def validate_tool(question: str, context_summary: Optional[str] = None) -> dict:
+async def validate_tool(
+    question: str, context_summary: Optional[str] = None, max_reviewers: Optional[int] = None
+) -> dict:
     """
     MCP tool entrypoint.
     Validates question considering context.
@@ -12,8 +14,21 @@ async def validate_tool(question: str, context_summary: Optional[str] = None) ->
     Args:
         question: The user's question
         context_summary: Optional summary of relevant context
+        max_reviewers: Run only the first N reviewers (degraded mode)
 
     Returns:
         Dictionary with 'items' containing list of ReviewPoint objects
     """
-    return await _engine.validate(question, context_summary)
+    return await _engine.validate(question, context_summary, max_reviewers)
+
+
+def validate_stream(
+    question: str, context_summary: Optional[str] = None, max_reviewers: Optional[int] = None
+):
+    """
+    Streaming variant of validate_tool.
+
+    Returns an async context manager yielding a receive stream of ReviewBatch,
+    one per reviewer as it finishes (see ValidationEngine.stream).
+    """
+    return _engine.stream(question, context_summary, max_reviewers)
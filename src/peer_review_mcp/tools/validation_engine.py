@@ -1,96 +1,340 @@
 import logging
-from peer_review_mcp.LLM.gemini_client import GeminiClient
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Optional
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from peer_review_mcp.LLM.routing import get_router
+from peer_review_mcp.LLM.structured import generate_structured
 from peer_review_mcp.reviewers.RiskReviewer import RiskReviewer
 from peer_review_mcp.reviewers.ClarityReviewer import ClarityReviewer
+from peer_review_mcp.reviewers.FusedReviewer import FusedReviewer
 from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.models.structured_output import IncrementalReviewSchema
+from peer_review_mcp.prompts.incremental_validation import INCREMENTAL_VALIDATION_PROMPT
+from peer_review_mcp.tools.context_chunking import ContextChunker, merge_review_points
+from peer_review_mcp.tools.validation_store import PriorValidation, ValidationSessionStore
+from peer_review_mcp.llm_parsing import try_parse_json, record_parse_outcome
+from peer_review_mcp import metrics
+from peer_review_mcp.config import VALIDATION_MODE, VALIDATION_REUSE
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ReviewBatch:
+    """Review points from one reviewer, delivered as soon as that reviewer finishes."""
+    index: int  # reviewer position, for callers that want reviewer order back
+    source: str
+    points: list[ReviewPoint]
+    reused: int = 0  # points carried over from an earlier question (session reuse)
+
+
 class ValidationEngine:  # Aggregates multiple reviewers to validate a question and return structured ReviewPoint objects
     """
     Central validation engine.
     Aggregates multiple reviewers to identify potential issues with the question.
     Returns structured ReviewPoint objects with risk classification.
+
+    Modes:
+        split: risk and clarity reviewers run as two separate LLM calls.
+        fused: a single FusedReviewer call returns both sets of findings.
+
+    Reviewers run concurrently in a task group: a failing reviewer becomes a
+    synthetic "system" point, while cancellation of the request cancels every
+    outstanding reviewer call. ``stream`` hands out each reviewer's points as it
+    finishes, so callers can start on the first results; ``validate`` waits for all.
+
+    With session reuse enabled, a follow-up question sharing the context summary of
+    an earlier, similar question reuses that question's review points and runs one
+    incremental "what's new" call instead of the full reviewer set.
+
+    An oversized context summary (see ContextChunker) is map-reduced: each reviewer
+    that reads the context reviews every chunk concurrently, and the chunk findings
+    are merged and deduplicated into that reviewer's points.
     """
 
-    def __init__(self):
-        client = GeminiClient()
+    def __init__(self, mode: Optional[str] = None, reuse: Optional[bool] = None):
+        client = get_router().client("validation")
+        self.client = client
+        self.mode = mode or VALIDATION_MODE
+        use_reuse = VALIDATION_REUSE if reuse is None else reuse
+        self.session_store = ValidationSessionStore() if use_reuse else None
+        self.chunker = ContextChunker()
 
-        self.reviewers = [
-            RiskReviewer(client),
-            ClarityReviewer(client),
-        ]
-        logger.info("ValidationEngine initialized with %d reviewers", len(self.reviewers))
+        if self.mode == "fused":
+            self.reviewers = [FusedReviewer(client)]
+        else:
+            if self.mode != "split":
+                logger.warning("Unknown validation mode %r, using split", self.mode)
+                self.mode = "split"
+            self.reviewers = [
+                RiskReviewer(client),
+                ClarityReviewer(client),
+            ]
+        logger.info(
+            "ValidationEngine initialized in %s mode with %d reviewers",
+            self.mode,
+            len(self.reviewers),
+        )
 
-    async def validate(self, question: str, context_summary: str = None) -> dict:
+    async def validate(
+        self, question: str, context_summary: str = None, max_reviewers: Optional[int] = None
+    ) -> dict:
         """
         Validate a question by running multiple reviewers and return structured review points.
 
         Args:
             question: The question to validate
             context_summary: Optional context about previous discussion
+            max_reviewers: Run only the first N reviewers (degraded mode under load)
 
         See doc comments in this method for expected item shapes and fallback behavior.
         """
-        review_points: list[ReviewPoint] = []
+        async with self.stream(question, context_summary, max_reviewers) as batches:
+            collected = [batch async for batch in batches]
+
+        # Reviewer order is kept regardless of completion order
+        collected.sort(key=lambda batch: batch.index)
+        review_points = [point for batch in collected for point in batch.points]
+        result = {
+            "items": review_points,  # List of structured review points
+            "count": len(review_points),  # Total count of review points
+        }
+        reused = sum(batch.reused for batch in collected)
+        if reused:
+            result["reused"] = reused
+
+        # Log the total number of review points found
+        logger.info("Validation complete: %d review points found", len(review_points))
+        return result
+
+    @asynccontextmanager
+    async def stream(
+        self, question: str, context_summary: Optional[str] = None, max_reviewers: Optional[int] = None
+    ) -> AsyncIterator[MemoryObjectReceiveStream[ReviewBatch]]:
+        """
+        Run validation and yield a stream of ReviewBatch, one per reviewer as it finishes.
+
+        The stream ends once every reviewer has reported. Leaving the context early
+        cancels reviewers that are still running. A session-reuse hit arrives as a
+        single batch. Session reuse is skipped when ``max_reviewers`` is set: degraded
+        mode must not spend an extra incremental LLM call.
+        """
+        # Partial results from a reduced reviewer set are not kept for reuse either.
+        reuse = self.session_store is not None and context_summary and max_reviewers is None
+        if reuse:
+            prior = self.session_store.find(question, context_summary)
+            if prior is not None:
+                result = await self._validate_incremental(question, context_summary, prior)
+                if result is not None:
+                    self.session_store.add(question, context_summary, result["items"])
+                    send, receive = anyio.create_memory_object_stream[ReviewBatch](1)
+                    with send:
+                        send.send_nowait(ReviewBatch(0, "incremental", result["items"], result["reused"]))
+                    with receive:
+                        yield receive
+                    return
+
+        reviewers = self.reviewers[:max_reviewers]
+        send, receive = anyio.create_memory_object_stream[ReviewBatch](len(reviewers))
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._run_reviewers, send, reviewers, question, context_summary, reuse)
+            try:
+                with receive:
+                    yield receive
+            finally:
+                tg.cancel_scope.cancel()  # no-op when every reviewer has already reported
+
+    async def _run_reviewers(
+        self,
+        send: MemoryObjectSendStream[ReviewBatch],
+        reviewers: list,
+        question: str,
+        context_summary: Optional[str],
+        keep: bool,
+    ) -> None:
+        """Run the reviewers concurrently, sending each one's points as soon as it finishes."""
+        results: list[list[ReviewPoint]] = [[] for _ in reviewers]
+
+        async def _run_and_send(index: int, reviewer) -> None:
+            await self._run_reviewer(reviewer, question, context_summary, results, index)
+            source = getattr(reviewer, "source", None) or type(reviewer).__name__
+            try:
+                send.send_nowait(ReviewBatch(index, source, results[index]))
+            except anyio.BrokenResourceError:
+                pass  # consumer stopped listening
+
+        with send:
+            async with anyio.create_task_group() as tg:
+                for index, reviewer in enumerate(reviewers):
+                    tg.start_soon(_run_and_send, index, reviewer)
+
+        # A failed reviewer's findings are missing, not empty: keep only complete results for reuse.
+        if keep and not any(p.source == "system" for points in results for p in points):
+            self.session_store.add(question, context_summary, [p for points in results for p in points])
+
+    async def _run_reviewer(
+        self,
+        reviewer,
+        question: str,
+        context_summary: Optional[str],
+        results: list[list[ReviewPoint]],
+        index: int,
+    ) -> None:
+        """Run one reviewer into ``results[index]``; failures (not cancellation) become a system point."""
+        try:
+            if getattr(reviewer, "uses_context", False) and self.chunker.oversized(context_summary):
+                results[index] = await self._review_chunks(reviewer, question, context_summary)
+                return
+
+            # Each reviewer processes the question and context to generate review points
+            result = await reviewer.review(
+                question=question,
+                answer=None,
+                context_summary=context_summary,
+                mode="validate",
+            )
+            logger.debug(
+                "Reviewer %s returned %d items",
+                type(reviewer).__name__,
+                len(getattr(result, "items", []) or []),
+            )
+
+            # Process each item returned by the reviewer.
+            # Items are tagged with their source; fused items carry their own tag.
+            reviewer_source = getattr(reviewer, "source", None)
+            results[index] = [self._to_review_point(item, reviewer_source) for item in result.items]
+
+        except Exception:
+            # Log the exception and add a fallback ReviewPoint
+            logger.exception(
+                "Reviewer %s failed during validation",
+                type(reviewer).__name__,
+            )
+
+            results[index] = [
+                ReviewPoint(
+                    text=f"Reviewer {type(reviewer).__name__} failed to execute during validation",
+                    risk_type="api_tooling",
+                    severity="high",
+                    confidence=1.0,
+                    source="system",  # synthetic point, not a finding about the question
+                )
+            ]
+
+    async def _review_chunks(self, reviewer, question: str, context_summary: str) -> list[ReviewPoint]:
+        """
+        Map-reduce one reviewer over the chunks of an oversized context.
+
+        Chunks are reviewed concurrently; a failed chunk is skipped (and counted), and
+        only when every chunk fails does the reviewer fail as a whole.
+        """
+        chunks = self.chunker.split(context_summary)
+        found: list[Optional[list]] = [None] * len(chunks)
 
-        for reviewer in self.reviewers:
+        async def _review(i: int, chunk: str) -> None:
             try:
-                # Each reviewer processes the question and context to generate review points
                 result = await reviewer.review(
                     question=question,
                     answer=None,
-                    context_summary=context_summary,
+                    context_summary=f"(Part {i + 1} of {len(chunks)} of a longer context)\n{chunk}",
                     mode="validate",
                 )
-                logger.debug(
-                    "Reviewer %s returned %d items",
-                    type(reviewer).__name__,
-                    len(getattr(result, "items", []) or []),
-                )
+            except Exception:
+                logger.exception("Reviewer %s failed on context chunk %d", type(reviewer).__name__, i + 1)
+                return
+            found[i] = result.items
 
-                # Process each item returned by the reviewer
-                for item in result.items:
-                    if isinstance(item, dict):
-                        # Create a ReviewPoint from a dictionary item
-                        review_point = ReviewPoint(
-                            text=item.get("text", str(item)),
-                            risk_type=item.get("risk_type"),
-                            severity=item.get("severity"),
-                            confidence=item.get("confidence", 0.8),
-                        )
-                    else:
-                        # Handle string items by creating a generic ReviewPoint
-                        review_point = ReviewPoint(
-                            text=item.strip() if isinstance(item, str) else str(item),
-                            risk_type=None,
-                            severity=None,
-                            confidence=0.8,
-                        )
-
-                    review_points.append(review_point)
-
-            except Exception as e:
-                # Log the exception and add a fallback ReviewPoint
-                logger.exception(
-                    "Reviewer %s failed during validation",
-                    type(reviewer).__name__,
-                )
+        async with anyio.create_task_group() as tg:
+            for i, chunk in enumerate(chunks):
+                tg.start_soon(_review, i, chunk)
 
-                review_points.append(
-                    ReviewPoint(
-                        text=f"Reviewer {type(reviewer).__name__} failed to execute during validation",
-                        risk_type="api_tooling",
-                        severity="high",
-                        confidence=1.0,
-                    )
-                )
+        reviewed = [items for items in found if items is not None]
+        metrics.increment("validation.context_chunks", len(chunks))
+        if len(reviewed) < len(chunks):
+            metrics.increment("validation.context_chunk_failures", len(chunks) - len(reviewed))
+        if not reviewed:
+            raise RuntimeError(f"all {len(chunks)} context chunks failed")
 
-        # Log the total number of review points found
-        logger.info("Validation complete: %d review points found", len(review_points))
+        source = getattr(reviewer, "source", None)
+        points = [self._to_review_point(item, source) for items in reviewed for item in items]
+        merged = merge_review_points(points)
+        metrics.increment("validation.context_chunk_duplicates", len(points) - len(merged))
+        logger.info(
+            "Reviewer %s: %d context chunks, %d points (%d duplicates merged)",
+            type(reviewer).__name__,
+            len(chunks),
+            len(merged),
+            len(points) - len(merged),
+        )
+        return merged
+
+    async def _validate_incremental(
+        self, question: str, context_summary: Optional[str], prior: PriorValidation
+    ) -> Optional[dict]:
+        """
+        Reuse the review points of a similar earlier question and ask only for what changed.
+
+        Returns None when the incremental call fails, so the caller runs full validation.
+        """
+        known = "\n".join(f"{i}. {p.text}" for i, p in enumerate(prior.points, start=1)) or "(none)"
+        prompt = INCREMENTAL_VALIDATION_PROMPT.format(
+            context=self.chunker.digest(question, context_summary),
+            previous_question=prior.question,
+            known_points=known,
+            question=question,
+        )
+        try:
+            raw = await generate_structured(self.client, prompt, IncrementalReviewSchema)
+        except Exception:
+            logger.exception("Incremental validation failed, running full validation")
+            return None
+
+        data = try_parse_json(raw)
+        if not isinstance(data, dict) or not isinstance(data.get("items", []), list):
+            logger.warning("Failed to parse incremental validation JSON, running full validation")
+            record_parse_outcome("incremental_validation", ok=False)
+            return None
+        record_parse_outcome("incremental_validation", ok=True)
+
+        obsolete = {n for n in data.get("obsolete") or [] if isinstance(n, int)}
+        reused = [p for i, p in enumerate(prior.points, start=1) if i not in obsolete]
+        # Items name the review that would have found them; anything else gets a neutral source.
+        new_points = [self._to_review_point(item, "incremental") for item in data.get("items") or []]
+        new_points = [p if p.source in ("risk", "clarity") else replace(p, source="incremental") for p in new_points]
+        review_points = reused + new_points
 
+        metrics.increment("validation.reuse.hits")
+        metrics.increment("validation.reuse.points_reused", len(reused))
+        logger.info(
+            "Incremental validation: reused %d points (similarity %.3f), %d new",
+            len(reused),
+            prior.similarity,
+            len(new_points),
+        )
         return {
-            "items": review_points,  # List of structured review points
-            "count": len(review_points),  # Total count of review points
+            "items": review_points,
+            "count": len(review_points),
+            "reused": len(reused),
         }
+
+    @staticmethod
+    def _to_review_point(item, default_source: Optional[str]) -> ReviewPoint:
+        if isinstance(item, dict):
+            # Create a ReviewPoint from a dictionary item
+            return ReviewPoint(
+                text=item.get("text", str(item)),
+                risk_type=item.get("risk_type"),
+                severity=item.get("severity"),
+                confidence=item.get("confidence", 0.8),
+                source=item.get("source") or default_source,
+            )
+        # Handle string items by creating a generic ReviewPoint
+        return ReviewPoint(
+            text=item.strip() if isinstance(item, str) else str(item),
+            risk_type=None,
+            severity=None,
+            confidence=0.8,
+            source=default_source,
+        )
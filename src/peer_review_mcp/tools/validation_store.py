@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from peer_review_mcp.cache.embedding import HashingEmbedder, text_hash
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.config import (
+    VALIDATION_REUSE_THRESHOLD,
+    VALIDATION_REUSE_TTL_S,
+    VALIDATION_REUSE_MAX_SESSIONS,
+)
+
+
+@dataclass
+class ValidatedQuestion:
+    question: str
+    vector: np.ndarray
+    points: list[ReviewPoint]
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class PriorValidation:
+    question: str
+    points: list[ReviewPoint]
+    similarity: float
+
+
+class ValidationSessionStore:  # Session-scoped ReviewPoints keyed by context hash and question similarity
+    """
+    Remembers validation results per conversation "session".
+
+    A session is identified by the hash of the normalized context summary, which
+    agents repeat verbatim across follow-up calls. Within a session the most
+    similar earlier question (cosine of local embeddings) above ``threshold`` is
+    returned so its review points can be reused.
+    """
+
+    MAX_QUESTIONS_PER_SESSION = 16
+
+    def __init__(
+        self,
+        threshold: float = VALIDATION_REUSE_THRESHOLD,
+        ttl_s: float = VALIDATION_REUSE_TTL_S,
+        max_sessions: int = VALIDATION_REUSE_MAX_SESSIONS,
+        embedder: Optional[HashingEmbedder] = None,
+    ):
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self.max_sessions = max_sessions
+        self.embedder = embedder or HashingEmbedder()
+        self._sessions: "OrderedDict[str, list[ValidatedQuestion]]" = OrderedDict()
+
+    def find(self, question: str, context_summary: Optional[str]) -> Optional[PriorValidation]:
+        key = text_hash(context_summary)
+        entries = self._sessions.get(key)
+        if not entries:
+            return None
+        now = time.time()
+        entries[:] = [e for e in entries if now - e.created_at <= self.ttl_s]
+        if not entries:
+            del self._sessions[key]
+            return None
+
+        vector = self.embedder.embed(question)
+        best = max(entries, key=lambda e: float(vector @ e.vector))
+        similarity = float(vector @ best.vector)
+        if similarity < self.threshold:
+            return None
+        self._sessions.move_to_end(key)
+        return PriorValidation(question=best.question, points=list(best.points), similarity=round(similarity, 4))
+
+    def add(self, question: str, context_summary: Optional[str], points: list[ReviewPoint]) -> None:
+        key = text_hash(context_summary)
+        entries = self._sessions.setdefault(key, [])
+        entries.append(ValidatedQuestion(question=question, vector=self.embedder.embed(question), points=points))
+        del entries[: -self.MAX_QUESTIONS_PER_SESSION]
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
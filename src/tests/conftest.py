@@ -3,6 +3,12 @@ import asyncio
 from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
 
 
+@pytest.fixture
+def anyio_backend():
+    # The server runs on asyncio; don't parametrize anyio tests over other installed backends.
+    return "asyncio"
+
+
 @pytest.fixture
 def orchestrator():
     return CentralOrchestrator()
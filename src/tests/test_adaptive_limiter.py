@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM.adaptive_limiter import AdaptiveLimiter, is_overload, reset_adaptive_limiters
+from peer_review_mcp.LLM.limiter import limiter_stats, llm_concurrency
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+def test_aimd_rules():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter("p", initial=4, min_limit=1, max_limit=8, clock=clock)
+
+    limiter.inflight = 4  # saturated: successes probe upwards
+    for _ in range(4):
+        limiter.record("ok", 0.1)
+    assert 4.9 < limiter.limit < 5.1
+    assert metrics.get("limiter.p.limit") == limiter.limit
+
+    limiter.inflight = 1  # not the bottleneck: no growth
+    limiter.record("ok", 0.1)
+    assert limiter.limit < 5.1
+
+    clock.now = 1.0
+    limiter.record("overload")
+    limiter.record("overload")  # same round trip: cut once
+    assert 2.4 < limiter.limit < 2.6
+    clock.now = 2.0
+    limiter.record("error")  # plain errors say nothing about load
+    assert 2.4 < limiter.limit < 2.6
+
+    for _ in range(5):
+        limiter.record("ok", 1.0)  # latency jumps 10x over the baseline
+    assert limiter.limit < 2.4
+    assert is_overload(RateLimited()) and is_overload(TimeoutError()) and not is_overload(ValueError())
+
+
+@pytest.mark.anyio
+async def test_limit_tracks_backend_capacity(monkeypatch):
+    monkeypatch.setattr("peer_review_mcp.LLM.adaptive_limiter.ADAPTIVE_CONCURRENCY", True)
+    reset_adaptive_limiters()
+    backend = {"capacity": 16, "inflight": 0}
+    samples = {}
+
+    async def _call():
+        async with llm_concurrency("fake"):
+            if backend["inflight"] >= backend["capacity"]:
+                raise RateLimited()
+            backend["inflight"] += 1
+            try:
+                await asyncio.sleep(0.005)
+            finally:
+                backend["inflight"] -= 1
+
+    async def _worker(stop):
+        while not stop.is_set():
+            try:
+                await _call()
+            except RateLimited:
+                await asyncio.sleep(0.005)
+
+    async def _phase(name, capacity, duration=0.4):
+        backend["capacity"] = capacity
+        await asyncio.sleep(duration / 2)  # settle
+        values = []
+        for _ in range(20):
+            values.append(limiter_stats()["providers"]["fake"]["limit"])
+            await asyncio.sleep(duration / 40)
+        samples[name] = sum(values) / len(values)
+
+    stop = asyncio.Event()
+    workers = [asyncio.ensure_future(_worker(stop)) for _ in range(40)]
+    try:
+        await _phase("high", 16)
+        await _phase("low", 3)
+        await _phase("recovered", 16)
+    finally:
+        stop.set()
+        await asyncio.gather(*workers)
+        reset_adaptive_limiters()
+
+    assert 6 <= samples["high"] <= 24
+    assert samples["low"] <= 4.5
+    assert samples["recovered"] > samples["low"] + 2
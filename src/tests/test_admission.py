@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+from peer_review_mcp import metrics, server
+from peer_review_mcp.admission import AdmissionController
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+def test_admission_rejects_when_queue_full_or_over_budget():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, initial_latency_s=10)
+    controller.active = 1
+    assert controller.admit(budget_s=None).action == "admit"
+    assert controller.admit(budget_s=5).action == "reject"  # even degraded (5s) exceeds 10s wait + run
+
+    controller._waiters.append(object())
+    decision = controller.admit()
+    assert (decision.action, decision.reason) == ("reject", "queue_full")
+    assert decision.estimated_wait_s == 20
+
+
+def test_admission_degrades_when_full_run_does_not_fit_budget():
+    controller = AdmissionController(max_concurrent=2, max_queue=4, initial_latency_s=10)
+    assert controller.admit(budget_s=12).mode == "full"
+    controller.active = 2
+    decision = controller.admit(budget_s=16)  # wait 5s + full 10s fits, so does 5s + 5s
+    assert decision.mode == "full"
+    decision = controller.admit(budget_s=12)
+    assert (decision.action, decision.mode) == ("admit", "degraded")
+
+
+@pytest.mark.anyio
+async def test_admission_slots_limit_concurrency_and_learn_latency():
+    controller = AdmissionController(max_concurrent=1, max_queue=4, initial_latency_s=10, alpha=0.5)
+    running, max_running = 0, 0
+
+    async def _request():
+        nonlocal running, max_running
+        async with controller.slot():
+            running += 1
+            max_running = max(max_running, running)
+            await anyio.sleep(0.02)
+            running -= 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(_request)
+
+    assert max_running == 1
+    assert controller.active == 0 and controller.waiting == 0
+    assert controller.latency_s["full"] < 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_releases_its_place():
+    controller = AdmissionController(max_concurrent=1, max_queue=4)
+
+    async with anyio.create_task_group() as tg:
+        async with controller.slot():
+            tg.start_soon(_enter, controller)
+            await anyio.sleep(0.01)
+            assert controller.waiting == 1
+            tg.cancel_scope.cancel()
+    assert controller.active == 0 and controller.waiting == 0
+
+
+async def _enter(controller):
+    async with controller.slot():
+        pass
+
+
+@pytest.mark.anyio
+async def test_server_rejects_and_cancels(monkeypatch):
+    metrics.reset()
+    release = anyio.Event()
+
+    async def _process(*, question, context_summary=None, degraded=False):
+        await release.wait()
+        return {"answer": "ok", "meta": {}}
+
+    monkeypatch.setattr(server, "_orchestrator", SimpleNamespace(process=_process))
+    monkeypatch.setattr(server, "_admission", AdmissionController(max_concurrent=1, max_queue=0))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(server.answer_with_peer_review, "first")
+        await anyio.sleep(0.01)
+        rejected = await server.answer_with_peer_review("second")
+        tg.cancel_scope.cancel()  # client goes away while the first call is in flight
+
+    assert rejected["answer"] is None
+    assert rejected["meta"]["error"] == "overloaded"
+    assert metrics.get("admission.cancelled") == 1
+    assert server._admission.active == 0
+
+
+@pytest.mark.anyio
+async def test_orchestrator_degraded_mode_uses_one_reviewer_and_skips_polish(monkeypatch):
+    seen = {}
+
+    async def _validate(question, context_summary=None, max_reviewers=None):
+        seen["max_reviewers"] = max_reviewers
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        return {"answer": "draft", "confidence": 0.5, "needs_polish": True}
+
+    async def _phase_b(*args, **kwargs):
+        raise AssertionError("Phase B must not run in degraded mode")
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(answer_cache=True)
+    monkeypatch.setattr(co, "_run_phase_b", _phase_b)
+
+    result = await co.process(question="Design a cache", degraded=True)
+
+    assert seen["max_reviewers"] == 1
+    assert result["answer"] == "draft"
+    assert result["meta"]["degraded"] is True
+    assert result["meta"]["polishing_applied"] is False
+    assert co.answer_cache.lookup("Design a cache") is None
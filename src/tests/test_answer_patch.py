@@ -0,0 +1,141 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM.usage import report_usage
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.tools.answer_patch import AnswerEdit, PatchError, apply_edits, find_anchor, parse_edits
+
+ANSWER = (
+    "Python lists are dynamic arrays. Appending is amortized O(1) because capacity grows geometrically. "
+    "Inserting at the front is O(1).\n\nUse a “deque” for   queues."
+)
+
+
+def test_apply_edits_in_any_order():
+    edits = parse_edits([
+        {"op": "insert_after", "anchor": "for   queues.", "text": " It supports O(1) pops from both ends."},
+        {"op": "replace", "anchor": "Inserting at the front is O(1).", "text": "Inserting at the front is O(n)."},
+        {"op": "delete", "anchor": "because capacity grows geometrically", "text": "ignored"},
+    ])
+    patched = apply_edits(ANSWER, edits)
+
+    assert patched == (
+        "Python lists are dynamic arrays. Appending is amortized O(1). Inserting at the front is O(n).\n\n"
+        "Use a “deque” for   queues. It supports O(1) pops from both ends."
+    )
+
+
+def test_anchor_matching_tolerates_copy_noise():
+    # Collapsed whitespace and straight quotes.
+    start, end = find_anchor(ANSWER, 'Use a "deque" for queues.')
+    assert ANSWER[start:end] == "Use a “deque” for   queues."
+    # A long anchor with a small typo.
+    start, end = find_anchor(ANSWER, "Appending is amortised O(1) because capacity grows geometrically.")
+    assert ANSWER[start:end] == "Appending is amortized O(1) because capacity grows geometrically."
+
+    with pytest.raises(PatchError, match="ambiguous"):
+        find_anchor(ANSWER, "O(1)")
+    with pytest.raises(PatchError, match="not found"):
+        find_anchor(ANSWER, "Tuples are immutable.")
+    with pytest.raises(PatchError, match="overlapping"):
+        apply_edits(ANSWER, [
+            AnswerEdit("replace", "dynamic arrays. Appending", "x"),
+            AnswerEdit("delete", "Appending is amortized"),
+        ])
+    with pytest.raises(PatchError):
+        parse_edits([{"op": "rewrite", "anchor": "x", "text": "y"}])
+
+
+def _orchestrator(monkeypatch, response):
+    co = CentralOrchestrator(polish_mode="patch", pipelining=False)
+    rewrites = []
+
+    async def _validate(question, context_summary=None):
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        return {"answer": ANSWER, "confidence": 0.6, "needs_polish": True}
+
+    async def _patch(prompt):
+        report_usage("fake", 400, 40)
+        return json.dumps(response)
+
+    async def _rewrite(prompt):
+        rewrites.append(prompt)
+        return "rewritten"
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    monkeypatch.setattr(co.polishing_engine, "client", SimpleNamespace(generate_async=_patch))
+    monkeypatch.setattr(co, "polish_llm", SimpleNamespace(generate_async=_rewrite))
+    return co, rewrites
+
+
+@pytest.mark.anyio
+async def test_patch_mode_applies_edits_without_a_rewrite(monkeypatch):
+    metrics.reset()
+    co, rewrites = _orchestrator(monkeypatch, {
+        "comments": ["Front insertion is O(n)"],
+        "material_issues": True,
+        "edits": [{"op": "replace", "anchor": "front is O(1)", "text": "front is O(n)"}],
+    })
+
+    result = await co.process(question="How fast are list operations?")
+
+    assert result["meta"]["polishing_applied"] is True
+    assert "Inserting at the front is O(n)." in result["answer"] and rewrites == []
+    assert metrics.get("polish.patch.applied") == 1
+    assert metrics.get("polish.patch.output_tokens") == 40
+    assert metrics.get("polish.patch.output_tokens_saved") == metrics.get("polish.patch.rewrite_tokens") - 40 > 0
+
+
+@pytest.mark.anyio
+async def test_patch_mode_falls_back_to_rewrite(monkeypatch):
+    metrics.reset()
+    co, rewrites = _orchestrator(monkeypatch, {
+        "comments": [],
+        "material_issues": True,
+        "edits": [{"op": "replace", "anchor": "Tuples are immutable.", "text": "Tuples are hashable."}],
+    })
+
+    result = await co.process(question="How fast are list operations?")
+
+    assert result["answer"] == "rewritten"
+    assert 'Replace "Tuples are immutable." with "Tuples are hashable."' in rewrites[0]
+    assert metrics.get("polish.patch.failed") == metrics.get("polish.patch.fallbacks") == 1
+
+
+@pytest.mark.anyio
+async def test_patch_mode_rewrites_issues_reported_without_edits(monkeypatch):
+    metrics.reset()
+    co, rewrites = _orchestrator(monkeypatch, {
+        "comments": ["Front insertion is O(n), not O(1)"],
+        "material_issues": True,
+        "edits": [],
+    })
+
+    result = await co.process(question="How fast are list operations?")
+
+    assert result["answer"] == "rewritten"
+    assert "Front insertion is O(n), not O(1)" in rewrites[0]
+    assert metrics.get("polish.patch.failed") == metrics.get("polish.patch.fallbacks") == 1
+
+
+@pytest.mark.anyio
+async def test_unparseable_patch_falls_back_to_single_call_rewrite(monkeypatch):
+    metrics.reset()
+    co, rewrites = _orchestrator(monkeypatch, "not a patch")
+    critiques = []
+
+    async def _critique(*, question, answer, context_summary=None, client=None):
+        critiques.append(answer)
+        return [], "revised"
+
+    monkeypatch.setattr(co.polishing_engine, "critique_and_rewrite", _critique)
+    result = await co.process(question="How fast are list operations?")
+
+    assert result["answer"] == "revised" and critiques == [ANSWER] and rewrites == []
+    assert metrics.get("polish.patch.failed") == metrics.get("polish.patch.fallbacks") == 1
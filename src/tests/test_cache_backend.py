@@ -0,0 +1,192 @@
+import asyncio
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from peer_review_mcp.cache.answer_cache import AnswerCache
+from peer_review_mcp.cache.backend import MemoryCacheBackend
+from peer_review_mcp.cache.semantic_cache import SemanticCache
+from peer_review_mcp.cache.sqlite_backend import SQLiteCacheBackend
+from peer_review_mcp.LLM.chatgpt_client import ChatGPTClient
+from peer_review_mcp.LLM.response_cache import ResponseCache, configure_response_cache
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+def test_sqlite_backend_roundtrip_and_ttl(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+    backend.set("ns", "k", {"answer": "a", "meta": {"n": 1}})
+    backend.set("ns", "short", "x", ttl_s=0.01)
+    time.sleep(0.02)
+
+    assert backend.get("ns", "k") == {"answer": "a", "meta": {"n": 1}}
+    assert backend.get("other", "k") is None
+    assert backend.get("ns", "short") is None
+    assert [key for key, _, _ in backend.items("ns")] == ["k"]
+
+    backend.delete("ns", "k")
+    assert backend.get("ns", "k") is None
+
+
+def test_sqlite_backend_shared_between_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    reader = SQLiteCacheBackend(path)
+    writer = (
+        "import sys; from peer_review_mcp.cache.sqlite_backend import SQLiteCacheBackend; "
+        "SQLiteCacheBackend(sys.argv[1]).set('answers', 'q', {'answer': 'from another process'})"
+    )
+    subprocess.run([sys.executable, "-c", writer, path], check=True, timeout=60)
+
+    assert reader.get("answers", "q") == {"answer": "from another process"}
+    assert reader._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_backend_compaction_keeps_recently_used(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), max_bytes=2000, compact_every=1000)
+    for i in range(20):
+        backend.set("ns", f"k{i}", "v" * 200)
+    backend._conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = 'k0'", (time.time() + 1,))
+
+    removed = backend.compact()
+
+    assert removed > 0
+    assert backend.size_bytes() <= 2000 * backend.compact_ratio
+    assert backend.get("ns", "k0") is not None
+    assert backend.get("ns", "k1") is None
+
+
+def test_sqlite_backend_compacts_in_a_background_thread(tmp_path, monkeypatch):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), compact_every=3)
+    threads = []
+    monkeypatch.setattr(backend, "compact", lambda: threads.append(threading.current_thread().name))
+
+    for i in range(3):
+        backend.set("ns", f"k{i}", "v")
+    backend.close()  # waits for the compaction pass
+
+    assert threads == ["cache-compaction"]
+
+
+@pytest.mark.anyio
+async def test_sqlite_backend_waits_for_locks_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "cache.db")
+    backend = SQLiteCacheBackend(path)
+    blocker = sqlite3.connect(path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")  # another process holding the write lock
+    ticks = 0
+
+    async def _tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(_tick())
+    write = asyncio.ensure_future(backend.aset("ns", "k", "v"))
+    await asyncio.sleep(0.2)
+    assert not write.done() and ticks >= 10  # the loop kept running while the write waited
+
+    blocker.execute("COMMIT")
+    await write
+    ticker.cancel()
+    assert await backend.aget("ns", "k") == "v"
+    blocker.close()
+    backend.close()
+
+
+def test_memory_backend_lru_returns_copies():
+    backend = MemoryCacheBackend(max_entries=2)
+    value = {"meta": {}}
+    backend.set("ns", "a", value)
+    value["meta"]["cache"] = "mutated"
+    backend.get("ns", "a")["meta"]["x"] = 1
+    backend.set("ns", "b", 1)
+    backend.set("ns", "c", 2)
+
+    assert backend.get("ns", "b") == 1
+    assert backend.get("ns", "a") is None
+    backend2 = MemoryCacheBackend()
+    backend2.set("ns", "a", value)
+    value["meta"]["later"] = True
+    assert backend2.get("ns", "a") == {"meta": {"cache": "mutated"}}
+
+
+@pytest.mark.anyio
+async def test_llm_response_cache_skips_repeated_provider_call():
+    calls = []
+
+    class ChatStub:
+        class chat:
+            class completions:
+                @staticmethod
+                async def create(*, model, messages, max_tokens):
+                    calls.append(messages[0]["content"])
+
+                    class Message:
+                        content = "ok"
+
+                    class Choice:
+                        message = Message()
+
+                    class Response:
+                        choices = [Choice()]
+
+                    return Response()
+
+    client = object.__new__(ChatGPTClient)
+    client.model = "m"
+    client.timeout = 1
+    client._async_client = ChatStub()
+
+    configure_response_cache(ResponseCache(MemoryCacheBackend()))
+    try:
+        assert await client.generate_async("p") == "ok"
+        assert await client.generate_async("p") == "ok"
+        assert await client.generate_async("other") == "ok"
+    finally:
+        configure_response_cache(None)
+
+    assert calls == ["p", "other"]
+
+
+@pytest.mark.anyio
+async def test_answer_cache_shared_across_orchestrators(monkeypatch, tmp_path):
+    calls = []
+
+    async def _validate(question, context_summary=None):
+        calls.append("validate")
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append("answer")
+        return {"answer": "42", "confidence": 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    path = str(tmp_path / "cache.db")
+    first, second = CentralOrchestrator(answer_cache=True), CentralOrchestrator(answer_cache=True)
+    first.answer_cache = AnswerCache(SQLiteCacheBackend(path))
+    second.answer_cache = AnswerCache(SQLiteCacheBackend(path))
+
+    miss = await first.process(question="What is the answer?", context_summary="ctx")
+    hit = await second.process(question="what is the  answer", context_summary="ctx")
+
+    assert calls == ["validate", "answer"]
+    assert miss["meta"]["cache"] == {"hit": False}
+    assert hit["answer"] == "42"
+    assert hit["meta"]["cache"]["layer"] == "exact"
+
+
+def test_semantic_cache_syncs_entries_from_backend(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = SemanticCache(threshold=0.8, backend=SQLiteCacheBackend(path))
+    reader = SemanticCache(threshold=0.8, backend=SQLiteCacheBackend(path), sync_interval_s=0.0)
+
+    writer.store("How do I reverse a list in Python?", None, {"answer": "a", "meta": {}})
+    hit = reader.lookup("How can I reverse a list in Python?")
+
+    assert hit is not None and hit.value["answer"] == "a"
+    assert len(SemanticCache(backend=SQLiteCacheBackend(path))) == 1
@@ -0,0 +1,105 @@
+import asyncio
+import gzip
+
+import pytest
+from pydantic import BaseModel
+
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM.adaptive_limiter import is_overload
+from peer_review_mcp.LLM.call import call_llm
+from peer_review_mcp.LLM.cassette import (
+    Cassette,
+    CassetteMissError,
+    CassetteRequest,
+    ReplayedError,
+    configure_cassette,
+    load_cassette,
+)
+from peer_review_mcp.LLM.circuit_breaker import reset_breakers
+from peer_review_mcp.LLM.usage import report_usage
+
+
+class Verdict(BaseModel):
+    ok: bool
+
+
+class Unrecorded(BaseModel):
+    note: str
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+def _send(text, calls, delay=0.05):
+    async def _call():
+        calls.append(text)
+        await asyncio.sleep(delay)
+        report_usage("fake", 12, 3)
+        return text
+
+    return _call
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("name", ["cassette.jsonl", "cassette.jsonl.gz"])
+async def test_record_then_replay(tmp_path, name):
+    reset_breakers()
+    path = str(tmp_path / name)
+    calls = []
+    try:
+        configure_cassette(Cassette(path, "record"))
+        assert await call_llm(provider="fake", model="m", prompt="p1", send=_send("first", calls)) == "first"
+        assert await call_llm(provider="fake", model="m", prompt="p1", send=_send("again", calls)) == "again"
+        await call_llm(provider="fake", model="m", prompt="p2", send=_send('{"ok": true}', calls), schema=Verdict)
+
+        async def _fail():
+            raise RateLimited()
+
+        with pytest.raises(RateLimited):
+            await call_llm(provider="fake", model="m", prompt="p3", send=_fail)
+        configure_cassette(None)  # flushes and closes the file
+
+        recorded, _ = load_cassette(path)
+        assert [c.text for c in recorded] == ["first", "again", '{"ok": true}', None]
+        assert recorded[0].input_tokens == 12 and recorded[0].output_tokens == 3
+        assert recorded[0].latency_s >= 0.04
+        assert "p1" not in (gzip.open(path, "rt").read() if name.endswith(".gz") else open(path).read())
+
+        metrics.reset()
+        configure_cassette(Cassette(path, "replay", latency_scale=0.2))
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        assert await call_llm(provider="fake", model="m", prompt="p1", send=_send("live", calls)) == "first"
+        assert loop.time() - t0 < 0.04  # recorded latency, scaled down
+        assert await call_llm(provider="fake", model="m", prompt="p1", send=_send("live", calls)) == "again"
+        assert await call_llm(provider="fake", model="m", prompt="p1", send=_send("live", calls)) == "first"
+        with pytest.raises(ReplayedError) as err:
+            await call_llm(provider="fake", model="m", prompt="p3", send=_send("live", calls))
+        assert is_overload(err.value)
+        # A prompt that was never recorded gets the next recording with the same schema.
+        changed = await call_llm(provider="fake", model="m", prompt="p2 v2", send=_send("live", calls), schema=Verdict)
+        assert changed == '{"ok": true}'
+        with pytest.raises(CassetteMissError):
+            await call_llm(provider="fake", model="other", prompt="new", send=_send("live", calls), schema=Unrecorded)
+
+        assert "live" not in calls
+        assert metrics.get("cassette.loose_matches") == 1
+        assert metrics.get("llm.fake.input_tokens") == 4 * 12  # recorded usage is replayed too
+    finally:
+        configure_cassette(None)
+        reset_breakers()
+
+
+def test_requests_round_trip_and_torn_lines_are_skipped(tmp_path):
+    path = str(tmp_path / "c.jsonl")
+    cassette = Cassette(path, "record")
+    cassette.record_request(CassetteRequest(question="q", latency_s=1.5, answered=True, polished=False, tenant="t"))
+    cassette.close()
+    with open(path, "a") as fh:
+        fh.write('{"kind": "call", "key": "abc", "prov')
+
+    calls, requests = load_cassette(path)
+
+    assert calls == []
+    assert requests == [CassetteRequest(question="q", latency_s=1.5, answered=True, polished=False, tenant="t")]
@@ -0,0 +1,174 @@
+import pytest
+
+from peer_review_mcp.LLM.call import call_llm
+from peer_review_mcp.LLM.circuit_breaker import CircuitBreaker, CircuitOpenError
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock):
+    return CircuitBreaker("p", failure_rate=0.5, window=4, min_calls=4, slow_call_s=1.0, open_s=10, clock=clock)
+
+
+def test_breaker_opens_on_errors_and_slow_calls_then_probes():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    breaker.record(True, 0.1)
+    breaker.record(True, 0.1)
+    breaker.record(False)
+    assert breaker.state == "closed"
+    breaker.record(True, 5.0)  # slow call counts as bad: 2/4
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    probe = breaker.allow()
+    assert probe and probe.probe
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(False, permit=probe)
+    assert breaker.state == "open"
+
+    clock.now = 20
+    probe = breaker.allow()
+    breaker.record(True, 0.1, probe)
+    assert breaker.state == "closed"
+    assert not breaker.strained
+
+
+def test_breaker_ignores_stale_results_while_half_open():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    stale = breaker.allow()  # in flight when the circuit opens
+    for _ in range(4):
+        breaker.record(False)
+    clock.now = 10
+    probe = breaker.allow()
+
+    breaker.record(True, 0.1, stale)
+    assert breaker.state == "half_open"  # a pre-open success is not a probe
+    assert not breaker.allow()
+    breaker.record(False, permit=probe)
+    assert breaker.state == "open"
+
+    clock.now = 20
+    old_probe, probe = probe, breaker.allow()
+    breaker.record(True, 0.1, old_probe)  # a probe from the previous half-open period
+    assert breaker.state == "half_open"
+    breaker.record(True, 0.1, probe)
+    assert breaker.state == "closed"
+
+
+def test_breaker_strained_before_opening():
+    breaker = _breaker(FakeClock())
+    for ok in (True, True, True, False):
+        breaker.record(ok, 0.1)
+    assert breaker.state == "closed"
+    assert breaker.strained
+
+
+@pytest.mark.anyio
+async def test_call_llm_fails_fast_when_circuit_open(monkeypatch):
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    monkeypatch.setattr("peer_review_mcp.LLM.call.get_breaker", lambda provider: breaker)
+    sent = []
+
+    async def _failing():
+        sent.append(1)
+        raise RuntimeError("provider down")
+
+    for _ in range(4):
+        with pytest.raises(RuntimeError):
+            await call_llm(provider="p", model="m", prompt="x", send=_failing)
+    with pytest.raises(CircuitOpenError):
+        await call_llm(provider="p", model="m", prompt="x", send=_failing)
+    assert len(sent) == 4
+
+    async def _ok():
+        return "ok"
+
+    clock.now = 10
+    assert await call_llm(provider="p", model="m", prompt="x", send=_ok) == "ok"
+    assert breaker.state == "closed"
+
+
+def _stub_pipeline(monkeypatch, calls, items=(), confidence=0.95):
+    async def _validate(question, context_summary=None, max_reviewers=None):
+        calls.append(("validate", max_reviewers))
+        return {"items": list(items)}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append(("answer", len(review_points)))
+        return {"answer": "draft", "confidence": confidence, "needs_polish": False}
+
+    async def _phase_b(question, answer, context_summary, decision_log, tier=0):
+        calls.append(("polish", None))
+        return "polished"
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator()
+    monkeypatch.setattr(co, "_run_phase_b", _phase_b)
+    return co
+
+
+def _open(breaker):
+    for _ in range(4):
+        breaker.record(False)
+    return breaker
+
+
+@pytest.mark.anyio
+async def test_degradation_ladder_follows_breaker_state(monkeypatch):
+    clock = FakeClock()
+    breakers = {"gemini": _breaker(clock), "openai": _breaker(clock)}
+    monkeypatch.setattr(
+        "peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: breakers.get(provider)
+    )
+    calls = []
+    co = _stub_pipeline(monkeypatch, calls, confidence=0.5)
+
+    healthy = await co.process(question="q")
+    assert healthy["meta"]["degradation_level"] == 0
+    assert ("polish", None) in calls
+
+    # Default ladders use gemini for validation and polish: opening it drops both.
+    _open(breakers["gemini"])
+    calls.clear()
+    result = await co.process(question="q")
+    assert [c[0] for c in calls] == ["answer"]
+    assert result["answer"] == "draft"
+    assert result["meta"]["degradation_level"] == 3
+    assert result["meta"]["degradation"] == ["drop_clarity", "drop_validation", "skip_polish"]
+
+    # Half-open gemini only sheds the clarity reviewer.
+    clock.now = 10
+    calls.clear()
+    result = await co.process(question="q")
+    assert calls[0] == ("validate", 1)
+    assert result["meta"]["degradation"] == ["drop_clarity"]
+
+
+@pytest.mark.anyio
+async def test_reviewer_failure_points_do_not_trigger_polish(monkeypatch):
+    monkeypatch.setattr(
+        "peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: None
+    )
+    failures = [ReviewPoint(text="Reviewer failed", severity="high", confidence=1.0, source="system")] * 8
+    calls = []
+    co = _stub_pipeline(monkeypatch, calls, items=failures)
+
+    result = await co.process(question="q")
+
+    assert ("answer", 0) in calls
+    assert ("polish", None) not in calls
+    assert result["meta"]["review_points_count"] == 0
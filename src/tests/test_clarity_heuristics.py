@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.outcome_log import OutcomeLog
+from peer_review_mcp.reviewers import clarity_heuristics
+from peer_review_mcp.reviewers.ClarityReviewer import ClarityReviewer
+from peer_review_mcp.reviewers.clarity_heuristics import ClarityHeuristic, agreement_report
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_json_async(self, prompt, schema):
+        self.calls += 1
+        return json.dumps({"items": [
+            {"text": "which database?", "risk_type": "assumptions", "severity": "high", "confidence": 0.8}
+        ]})
+
+
+def test_heuristic_decisions():
+    heuristic = ClarityHeuristic(clear_max=0.2, unclear_min=0.8)
+
+    clear = heuristic.assess("What is the time complexity of Python's list.sort() on 10 million integers?")
+    assert clear.decision == "clear" and clear.points == []
+
+    unclear = heuristic.assess("How do I fix it?")
+    assert unclear.decision == "unclear"
+    assert unclear.checks == ["dangling_reference", "too_short"]
+    assert unclear.points[0]["severity"] == "high" and set(unclear.points[0]) == {
+        "text", "risk_type", "severity", "confidence"
+    }
+
+    # The same reference is fine once the caller supplied context.
+    assert "dangling_reference" not in heuristic.assess("How do I fix it?", context_summary="pip fails").checks
+    assert heuristic.assess("What's the best database?").decision == "uncertain"
+
+    # Only pronouns standing for something unnamed count, not dummy subjects or relative clauses.
+    assert "dangling_reference" not in heuristic.assess("Is it safe to use eval in Python?").checks
+    assert "dangling_reference" not in heuristic.assess(
+        "Write a function that returns the words that appear most often in a text"
+    ).checks
+    assert "dangling_reference" in heuristic.assess("Why does it crash on startup?").checks
+
+
+@pytest.mark.anyio
+async def test_fast_path_skips_llm_only_when_confident():
+    metrics.reset()
+    client = CountingClient()
+    reviewer = ClarityReviewer(client, fast_path=True)
+
+    clear = await reviewer.review(question="How does TCP congestion control work?", mode="validate")
+    unclear = await reviewer.review(question="fix this", mode="validate")
+    assert clear.items == [] and unclear.items and client.calls == 0
+
+    escalated = await reviewer.review(question="What's the best database?", mode="validate")
+    assert client.calls == 1 and escalated.items[0]["text"] == "which database?"
+
+    assert metrics.get("clarity.heuristic.checks") == 3
+    assert metrics.get("clarity.heuristic.hits") == 2
+    assert metrics.get("clarity.heuristic.clear") == metrics.get("clarity.heuristic.unclear") == 1
+
+    await ClarityReviewer(client, fast_path=False).review(question="fix this", mode="validate")
+    assert client.calls == 2
+
+
+@pytest.mark.anyio
+async def test_shadow_log_feeds_agreement_report(tmp_path, capsys):
+    path = str(tmp_path / "clarity.jsonl")
+    reviewer = ClarityReviewer(CountingClient(), fast_path=False)
+    reviewer.outcome_log = OutcomeLog(path)
+
+    await reviewer.review(question="fix this", mode="validate")
+    await reviewer.review(question="How does TCP congestion control work?", mode="validate")
+
+    with open(path) as fh:
+        entries = [json.loads(line) for line in fh]
+    assert "fix" not in json.dumps(entries)  # no question text in the log
+    assert entries[0]["llm_points"] == [{"severity": "high", "risk_type": "assumptions", "confidence": 0.8}]
+
+    report = agreement_report(entries, clear_max=0.2, unclear_min=0.8)
+    assert report["local_decision_rate"] == 1.0
+    assert report["unclear"] == {"count": 1, "llm_agreed": 1.0}
+    assert report["clear"] == {"count": 1, "llm_agreed": 0.0}  # the fake LLM flags everything
+    assert report["check_precision"]["too_short"] == {"fired": 1, "llm_agreed": 1.0}
+
+    assert clarity_heuristics.main([path, "--unclear-min", "0.9"]) == 0
+    cli = json.loads(capsys.readouterr().out)
+    assert cli["unclear"]["count"] == 0 and cli["thresholds"]["unclear_min"] == 0.9
+
+
+@pytest.mark.anyio
+async def test_fast_path_audits_a_sample_of_confident_verdicts(tmp_path):
+    metrics.reset()
+    path = str(tmp_path / "clarity.jsonl")
+    client = CountingClient()
+    audited = ClarityReviewer(client, fast_path=True, audit_rate=0.1, rng=lambda: 0.05)
+    audited.outcome_log = OutcomeLog(path)
+
+    result = await audited.review(question="fix this", mode="validate")
+    assert client.calls == 1 and result.items[0]["text"] == "which database?"
+    assert metrics.get("clarity.heuristic.audited") == 1 and metrics.get("clarity.heuristic.hits") == 0
+
+    skipped = ClarityReviewer(client, fast_path=True, audit_rate=0.1, rng=lambda: 0.5)
+    skipped.outcome_log = OutcomeLog(path)
+    await skipped.review(question="fix this", mode="validate")
+    assert client.calls == 1
+
+    with open(path) as fh:
+        entries = [json.loads(line) for line in fh]
+    assert [e["decision"] for e in entries] == ["unclear"]
@@ -0,0 +1,37 @@
+import dataclasses
+import json
+
+import pytest
+
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.orchestrator.decision_trace import DecisionTrace
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+
+def test_review_point_is_frozen_slotted_and_shares_labels():
+    parsed = json.loads('[{"text": "a", "severity": "high", "risk_type": "security"}, {"text": "b", "severity": "high"}]')
+    a, b = (ValidationEngine._to_review_point(item, "risk") for item in parsed)
+
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.severity = "low"
+    assert a.severity is b.severity is ReviewPoint(text="x", severity="high").severity
+    assert a.source is b.source
+    assert ReviewPoint(text="x", severity="bogus").severity == "bogus"  # unknown labels pass through
+
+
+def test_decision_trace_formats_only_when_read():
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted eagerly")
+
+    trace = DecisionTrace()
+    trace.append("plain")
+    trace.append("value: %s", Exploding())
+    assert len(trace) == 2
+
+    trace = DecisionTrace()
+    trace.append("model_confidence: %s", 0.9)
+    trace.append("phase_b_decision: %s (%s)", False, "high_confidence")
+    assert list(trace) == ["model_confidence: 0.9", "phase_b_decision: False (high_confidence)"]
+    assert str(trace) == "model_confidence: 0.9 | phase_b_decision: False (high_confidence)"
@@ -0,0 +1,111 @@
+import json
+import threading
+
+import pytest
+
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.complexity_classifier import ComplexityClassifier, calibration_report
+from peer_review_mcp.outcome_log import OutcomeLog
+
+
+def test_classifier_routes_trivial_and_complex_questions():
+    classifier = ComplexityClassifier(max_fast_score=0.25)
+    assert classifier.assess("What is the capital of France?").route == "fast_path"
+    assert classifier.assess("Who wrote Hamlet?").route == "fast_path"
+
+    complex_q = classifier.assess("Design a reliable Q&A system and analyze failure modes.")
+    assert complex_q.route == "peer_review" and complex_q.reason == "complex"
+    assert classifier.assess("What is 2+2? Please verify your answer.").reason == "verification_requested"
+    assert classifier.assess("Is it safe to store passwords in base64?").reason == "high_stakes_topic"
+
+
+def _patch_pipeline(monkeypatch, calls, fast_confidence):
+    async def _validate(question, context_summary=None):
+        calls.append("validate")
+        return {"items": [ReviewPoint(text="r", severity="high")]}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append("answer")
+        confidence = fast_confidence if not review_points else 0.95
+        return {"answer": "ok", "confidence": confidence, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+
+
+@pytest.mark.anyio
+async def test_fast_path_single_call(monkeypatch):
+    calls = []
+    _patch_pipeline(monkeypatch, calls, fast_confidence=0.95)
+    co = CentralOrchestrator(complexity_routing=True)
+
+    result = await co.process(question="What is the capital of France?")
+    assert calls == ["answer"]
+    assert result["meta"]["route"] == "fast_path"
+    assert result["meta"]["used_peer_review"] is False
+    assert result["meta"]["complexity_score"] is not None
+
+
+@pytest.mark.anyio
+async def test_fast_path_falls_back_and_logs_outcome(monkeypatch, tmp_path):
+    calls = []
+    _patch_pipeline(monkeypatch, calls, fast_confidence=0.5)
+    co = CentralOrchestrator(complexity_routing=True)
+    co.outcome_log = OutcomeLog(str(tmp_path / "outcomes.jsonl"))
+
+    result = await co.process(question="What is the capital of France?")
+    assert calls == ["answer", "validate", "answer"]
+    assert result["meta"]["route"] == "peer_review"
+
+    entries = [json.loads(line) for line in (tmp_path / "outcomes.jsonl").read_text().splitlines()]
+    assert entries[0]["route"] == "fast_path" and entries[0]["fell_back"] is True
+    report = calibration_report(entries)
+    assert report["fast_path_fallback_rate"] == 1.0
+
+
+@pytest.mark.anyio
+async def test_log_only_mode_judges_requests_on_their_outcome(monkeypatch, tmp_path):
+    calls = []
+    _patch_pipeline(monkeypatch, calls, fast_confidence=0.95)
+    monkeypatch.setattr(
+        "peer_review_mcp.orchestrator.central_orchestrator.COMPLEXITY_LOG_PATH", str(tmp_path / "outcomes.jsonl")
+    )
+    co = CentralOrchestrator(complexity_routing=False)
+    assert isinstance(co.outcome_log, OutcomeLog) and co.complexity_classifier is not None
+
+    for _ in range(3):
+        await co.process(question="What is the capital of France?")
+    assert calls == ["validate", "answer"] * 3  # log only: nothing is served on the fast path
+
+    entries = [json.loads(line) for line in (tmp_path / "outcomes.jsonl").read_text().splitlines()]
+    assert {e["route"] for e in entries} == {"fast_path"} and {e["served_route"] for e in entries} == {"peer_review"}
+    report = calibration_report(entries)
+    assert report["fast_path_share"] == 0.0 and report["fast_path_fallback_rate"] is None
+    # Every request had a high-severity review point, so none could have skipped review.
+    assert report["suggested_max_fast_score"] == 0.0
+
+
+@pytest.mark.anyio
+async def test_outcome_log_appends_off_the_event_loop(monkeypatch, tmp_path):
+    log = OutcomeLog(str(tmp_path / "outcomes.jsonl"))
+    writers = []
+    write = log.write
+    monkeypatch.setattr(log, "write", lambda entry: writers.append(threading.current_thread()) or write(entry))
+
+    await log.awrite({"score": 0.1})
+
+    assert writers and writers[0] is not threading.current_thread()
+    assert json.loads((tmp_path / "outcomes.jsonl").read_text())["score"] == 0.1
+
+
+def test_calibration_report_suggests_threshold():
+    entries = (
+        [{"route": "fast_path", "reason": "low_complexity", "score": 0.1, "fell_back": False}] * 9
+        + [{"route": "peer_review", "reason": "complex", "score": 0.7, "polishing_applied": True}] * 5
+        + [{"route": "peer_review", "reason": "verification_requested", "score": 0.2}]
+    )
+    report = calibration_report(entries)
+    assert report["scored_requests"] == 14
+    assert report["buckets"][1]["needed_review_rate"] == 0.0
+    assert report["suggested_max_fast_score"] == 0.7
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.models.review_result import ReviewResult
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.tools.context_chunking import ContextChunker, merge_review_points
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+FILLER = "We talked about the weather and lunch plans for a while."
+CONTEXT = "\n\n".join(
+    [f"Turn {i}: {FILLER} {FILLER}" for i in range(30)]
+    + ["The service uses PostgreSQL 15 with pgbouncer in transaction pooling mode."]
+    + [f"Later {i}: {FILLER}" for i in range(10)]
+)
+
+
+def test_split_respects_chunk_budget_and_overlaps():
+    chunker = ContextChunker(chunk_chars=800, overlap_chars=100, max_chunks=8)
+    chunks = chunker.split(CONTEXT)
+
+    assert 1 < len(chunks) <= 8
+    assert all(len(chunk) <= 800 + 1 + 100 for chunk in chunks)
+    assert any("PostgreSQL 15" in chunk for chunk in chunks)
+    assert chunks[1].startswith(chunks[0][-100:].split(" ", 1)[1][:20])  # carries the previous tail
+    assert ContextChunker(chunk_chars=800).split("short") == ["short"]
+    assert len(ContextChunker(chunk_chars=100, max_chunks=3).split(CONTEXT)) <= 3
+
+
+def test_digest_keeps_relevant_sentences_within_budget():
+    chunker = ContextChunker(chunk_chars=800, digest_chars=300)
+    digest = chunker.digest("Why does pgbouncer break prepared statements on PostgreSQL?", CONTEXT)
+
+    assert len(digest) <= 300
+    assert "pgbouncer in transaction pooling mode" in digest
+    assert chunker.digest("Why does pgbouncer break prepared statements on PostgreSQL?", CONTEXT) is digest
+    assert chunker.digest("q", "small context") == "small context"
+    assert ContextChunker(chunk_chars=0).digest("q", CONTEXT) is CONTEXT
+
+
+def test_merge_keeps_the_strongest_duplicate():
+    points = [
+        ReviewPoint("Connection pool size is not stated", "assumptions", "low", 0.6, "risk"),
+        ReviewPoint("Question mentions no database version", "assumptions", "medium", 0.7, "risk"),
+        ReviewPoint("The connection pool size is not stated", "assumptions", "high", 0.8, "risk"),
+        ReviewPoint("Connection pool size is not stated", "assumptions", "low", 0.6, "clarity"),
+    ]
+    merged = merge_review_points(points)
+
+    assert [(p.text, p.severity, p.source) for p in merged] == [
+        ("The connection pool size is not stated", "high", "risk"),
+        ("Question mentions no database version", "medium", "risk"),
+        ("Connection pool size is not stated", "low", "clarity"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_oversized_context_is_validated_in_parallel_chunks():
+    metrics.reset()
+    seen = {"risk": [], "clarity": []}
+    inflight = peak = returned = 0
+
+    class Reviewer:
+        def __init__(self, source, uses_context):
+            self.source = source
+            self.uses_context = uses_context
+
+        async def review(self, *, question, answer, context_summary, mode):
+            nonlocal inflight, peak, returned
+            seen[self.source].append(context_summary)
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.01)
+            inflight -= 1
+            if "Part 2 of" in context_summary:
+                raise RuntimeError("provider error")
+            items = [{"text": "Pool size is not stated", "risk_type": "assumptions", "severity": "medium"}]
+            if self.uses_context and "PostgreSQL 15" in context_summary:
+                items.append({"text": "pgbouncer transaction mode breaks prepared statements", "severity": "high"})
+            if self.uses_context:
+                returned += len(items)
+            return ReviewResult(mode=mode, items=items)
+
+    engine = ValidationEngine(mode="split")
+    engine.chunker = ContextChunker(chunk_chars=800, max_chunks=8)
+    engine.reviewers = [Reviewer("risk", True), Reviewer("clarity", False)]
+    result = await engine.validate("Why do prepared statements fail?", CONTEXT)
+
+    chunks = engine.chunker.split(CONTEXT)
+    assert len(seen["risk"]) == len(chunks) and peak > 2
+    assert seen["clarity"] == [CONTEXT]  # question-only reviewers run once, unchunked
+    assert [(p.text, p.source) for p in result["items"]] == [
+        ("Pool size is not stated", "risk"),
+        ("pgbouncer transaction mode breaks prepared statements", "risk"),
+        ("Pool size is not stated", "clarity"),
+    ]
+    assert metrics.get("validation.context_chunk_failures") == 1
+    assert metrics.get("validation.context_chunk_duplicates") == returned - 2
+
+
+@pytest.mark.anyio
+async def test_synthesis_and_polish_get_the_digest(monkeypatch):
+    contexts = {}
+
+    async def _validate(question, context_summary=None):
+        contexts["validate"] = context_summary
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        contexts["answer"] = context_summary
+        return {"answer": "a", "confidence": 0.5, "needs_polish": True}
+
+    async def _critique(*, question, answer, context_summary=None, client=None):
+        contexts["polish"] = context_summary
+        return [], None
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(polish_mode="single_call", pipelining=False)
+    co.context_chunker = ContextChunker(chunk_chars=800, digest_chars=500)
+    monkeypatch.setattr(co.polishing_engine, "critique_and_rewrite", _critique)
+
+    result = await co.process(question="Why does pgbouncer break prepared statements?", context_summary=CONTEXT)
+
+    assert result["answer"] == "a"
+    assert contexts["validate"] == CONTEXT
+    assert len(contexts["answer"]) <= 500 and "pgbouncer" in contexts["answer"]
+    assert contexts["polish"] == contexts["answer"]
@@ -169,3 +169,38 @@ async def test_async_clients_generate_success():
     assert await chat_client.generate_async("p") == "ok"
     assert await claude_client.generate_async("p") == "ok"
     assert await gemini_client.generate_async("p") == "ok"
+
+
+@pytest.mark.anyio
+async def test_orchestrator_single_call_polish(monkeypatch):
+    co = CentralOrchestrator(polish_mode="single_call")
+    prompts = []
+
+    async def _validate(question, context_summary=None):
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        return {"answer": "draft", "confidence": 0.6, "needs_polish": False}
+
+    async def _generate_async(prompt):
+        prompts.append(prompt)
+        return '{"comments": ["fix x"], "material_issues": true, "revised_answer": "rewritten"}'
+
+    async def _review_for_polish(**kwargs):
+        raise AssertionError("two-call review must not run in single_call mode")
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    monkeypatch.setattr(co.polishing_engine, "review_for_polish", _review_for_polish)
+    monkeypatch.setattr(co.polishing_engine, "client", SimpleNamespace(generate_async=_generate_async))
+
+    result = await co.process(question="q")
+    assert result["answer"] == "rewritten"
+    assert len(prompts) == 1
+
+    async def _no_issues(prompt):
+        return '{"comments": [], "material_issues": false, "revised_answer": ""}'
+
+    monkeypatch.setattr(co.polishing_engine, "client", SimpleNamespace(generate_async=_no_issues))
+    result = await co.process(question="q")
+    assert result["answer"] == "draft"
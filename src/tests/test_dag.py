@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.dag import Dag, Node
+
+
+@pytest.mark.anyio
+async def test_independent_nodes_run_in_parallel_and_are_traced():
+    async def _slow(seed):
+        await asyncio.sleep(0.1)
+        return seed + 1
+
+    dag = Dag([
+        Node("a", _slow, inputs=("seed",)),
+        Node("b", _slow, inputs=("seed",)),
+        Node("join", lambda a, b: a + b, inputs=("a", "b")),
+    ])
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    run = await dag.run(seed=1)
+
+    assert loop.time() - t0 < 0.18
+    assert run.values["join"] == 4
+    assert [r["status"] for r in run.trace.to_dict()] == ["ok", "ok", "ok"]
+    assert run.trace.runs[-1].name == "join"
+    mermaid = run.trace.to_mermaid()
+    assert "a --> join" in mermaid and "b --> join" in mermaid
+
+
+@pytest.mark.anyio
+async def test_skip_failure_and_timeout_fall_back_to_defaults():
+    def _boom():
+        raise RuntimeError("boom")
+
+    async def _hang():
+        await asyncio.sleep(10)
+
+    dag = Dag([
+        Node("flag", lambda seed: seed > 5, inputs=("seed",)),
+        Node("skipped", lambda: "ran", inputs=("flag",), when=lambda v: v["flag"], default="skipped"),
+        Node("failed", _boom, default="fallback"),
+        Node("slow", _hang, timeout_s=0.02, default="late"),
+        Node("out", lambda skipped, failed, slow: (skipped, failed, slow), inputs=("skipped", "failed", "slow")),
+    ])
+    run = await dag.run(seed=1)
+
+    assert run.values["out"] == ("skipped", "fallback", "late")
+    assert {r.name: r.status for r in run.trace.runs} == {
+        "flag": "ok", "skipped": "skipped", "failed": "failed", "slow": "timeout", "out": "ok"
+    }
+    assert run.trace.to_dict()[[r.name for r in run.trace.runs].index("failed")]["error"] == "RuntimeError: boom"
+
+
+@pytest.mark.anyio
+async def test_cached_nodes_and_graph_validation():
+    calls = []
+
+    def _square(x):
+        calls.append(x)
+        return x * x
+
+    dag = Dag([Node("sq", _square, inputs=("x",), cache_key=lambda v: v["x"])])
+    assert (await dag.run(x=3)).values["sq"] == 9
+    run = await dag.run(x=3)
+    assert run.values["sq"] == 9 and run.trace.status("sq") == "cached"
+    assert calls == [3]
+
+    with pytest.raises(ValueError, match="Cycle"):
+        Dag([Node("a", lambda b: b, inputs=("b",)), Node("b", lambda a: a, inputs=("a",))])
+    with pytest.raises(ValueError, match="Missing seed"):
+        await dag.run()
+
+
+@pytest.mark.anyio
+async def test_polish_timeout_keeps_draft_answer(monkeypatch):
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.POLISH_TIMEOUT_S", 0.02)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.PIPELINE_TRACE", True)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: None)
+
+    async def _validate(question, context_summary=None):
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        return {"answer": "draft", "confidence": 0.5, "needs_polish": True}
+
+    async def _phase_b(question, answer, context_summary, decision_log, tier=0):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(coalescing=False)
+    monkeypatch.setattr(co, "_run_phase_b", _phase_b)
+
+    result = await co.process(question="q")
+
+    assert result["answer"] == "draft"
+    assert result["meta"]["polishing_applied"] is False
+    assert [(n["node"], n["status"]) for n in result["meta"]["trace"]] == [
+        ("review_points", "ok"), ("synthesis", "ok"), ("decision", "ok"), ("polished_answer", "timeout")
+    ]
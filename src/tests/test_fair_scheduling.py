@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM import limiter
+from peer_review_mcp.LLM.limiter import configure_llm_concurrency, limiter_stats, llm_concurrency
+from peer_review_mcp.LLM.scheduling import CallTag, FairLimiter, call_tag, current_tag, parse_weights
+
+
+async def _grant_order(fair: FairLimiter, tags: list[CallTag]) -> list[str]:
+    """Queue one call per tag behind a held slot, then let them through one at a time."""
+    order = []
+    await fair.acquire(CallTag("holder"))
+
+    async def _call(tag):
+        await fair.acquire(tag)
+        order.append(tag.tenant)
+        await asyncio.sleep(0)
+        fair.release(tag)
+
+    tasks = []
+    for tag in tags:
+        tasks.append(asyncio.ensure_future(_call(tag)))
+        await asyncio.sleep(0)  # enqueue in this order
+    fair.release(CallTag("holder"))
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.anyio
+async def test_interactive_calls_jump_queued_batch_calls():
+    fair = FairLimiter("t", limit=1)
+    tags = [CallTag("loop", "batch")] * 5 + [CallTag("user", "interactive")]
+
+    order = await _grant_order(fair, tags)
+
+    assert order[0] == "user"
+    assert fair.inflight == fair.waiting == 0
+
+
+@pytest.mark.anyio
+async def test_backlogged_tenants_share_slots_by_weight():
+    fair = FairLimiter("t", limit=1, weights={"heavy": 3})
+    # "light" queues all of its calls before "heavy" queues any.
+    tags = [CallTag("light")] * 8 + [CallTag("heavy")] * 8
+
+    order = await _grant_order(fair, tags)
+
+    assert order[:8].count("heavy") == 6
+    assert order[:8].count("light") == 2
+
+
+@pytest.mark.anyio
+async def test_tenant_cap_lets_other_tenants_through():
+    fair = FairLimiter("t", limit=4, tenant_cap=1)
+    await fair.acquire(CallTag("a"))
+    blocked = asyncio.ensure_future(fair.acquire(CallTag("a")))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(fair.acquire(CallTag("b")), 1)  # a's queued call does not hold b up
+    assert not blocked.done()
+    assert fair.snapshot()["tenants"]["a"] == {"inflight": 1, "waiting": 1, "queue_s_mean": 0.0}
+
+    fair.release(CallTag("a"))
+    await asyncio.wait_for(blocked, 1)
+    assert fair.inflight_by_tenant == {"a": 1, "b": 1}
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_leaves_the_queue():
+    fair = FairLimiter("t", limit=1)
+    await fair.acquire(CallTag("a"))
+    waiter = asyncio.ensure_future(fair.acquire(CallTag("b")))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert fair.waiting == 0
+    fair.release(CallTag("a"))
+    assert fair.inflight == 0 and fair.inflight_by_tenant == {}
+
+
+@pytest.mark.anyio
+async def test_tag_propagates_to_llm_calls_with_queue_time_metrics():
+    metrics.reset()
+    configure_llm_concurrency(1)
+    seen = []
+
+    async def _call():
+        async with llm_concurrency():
+            seen.append(current_tag())
+            await asyncio.sleep(0.02)
+
+    try:
+        with call_tag("nightly", "Batch"):
+            batch = [asyncio.ensure_future(_call()) for _ in range(3)]  # tasks copy the context
+        await asyncio.sleep(0.001)
+        with call_tag("alice"):
+            await _call()
+        await asyncio.gather(*batch)
+
+        assert seen[0] == CallTag("nightly", "batch")
+        assert seen[1] == CallTag("alice", "interactive")  # served before the queued batch calls
+        assert metrics.get("limiter.global.calls.batch") == 3
+        assert metrics.get("limiter.global.queue_s.interactive") > 0.01
+        assert limiter_stats()["tenants"]["nightly"]["queue_s_mean"] > 0.01
+        assert current_tag() == CallTag()
+        assert limiter._global_limiter.inflight == 0
+    finally:
+        configure_llm_concurrency(0)
+
+
+def test_tag_and_weight_parsing():
+    with pytest.raises(ValueError):
+        with call_tag("x", "urgent"):
+            pass
+    assert parse_weights("ui=4, batch = 0.5,bad,neg=-1,zero=0,nan=x") == {"ui": 4.0, "batch": 0.5}
@@ -0,0 +1,75 @@
+import pytest
+
+from peer_review_mcp.LLM.routing import ModelRouter, ModelTier, parse_ladder
+from peer_review_mcp.LLM.chatgpt_client import ChatGPTClient
+from peer_review_mcp.models.review_point import ReviewPoint
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+def _two_tier_router():
+    return ModelRouter({
+        "validation": [ModelTier("gemini", "g-small")],
+        "synthesis": [ModelTier("openai", "small"), ModelTier("openai", "large")],
+        "polish": [ModelTier("gemini", "g-small")],
+    })
+
+
+def test_parse_ladder_and_clamping():
+    ladder = parse_ladder("openai:gpt-4o-mini, bogus:x, claude:claude-3-5-sonnet-20241022,openai:")
+    assert [t.name for t in ladder] == ["openai:gpt-4o-mini", "claude:claude-3-5-sonnet-20241022"]
+
+    router = _two_tier_router()
+    assert router.max_tier("synthesis") == 1
+    assert router.tier("synthesis", 5).model == "large"
+    client = router.client("synthesis", 1)
+    assert isinstance(client, ChatGPTClient) and client.model == "large"
+    assert router.client("synthesis", 1) is client
+
+
+@pytest.mark.anyio
+async def test_escalates_on_low_confidence(monkeypatch):
+    co = CentralOrchestrator()
+    co.router = _two_tier_router()
+    tiers = []
+
+    async def _validate(question, context_summary=None):
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None, tier=0):
+        tiers.append(tier)
+        return {"answer": f"tier{tier}", "confidence": 0.5 if tier == 0 else 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+
+    result = await co.process(question="q")
+    assert tiers == [0, 1]
+    assert result["answer"] == "tier1"
+    assert result["meta"]["synthesis_tier"] == 1
+    assert result["meta"]["escalation_reason"] == "low_model_confidence"
+    assert result["meta"]["polishing_applied"] is False
+
+
+@pytest.mark.anyio
+async def test_high_severity_starts_on_stronger_tier(monkeypatch):
+    co = CentralOrchestrator()
+    co.router = _two_tier_router()
+    tiers = []
+
+    async def _validate(question, context_summary=None):
+        return {"items": [
+            ReviewPoint(text="a", severity="high"),
+            ReviewPoint(text="b", severity="high"),
+            ReviewPoint(text="reviewer failed", severity="high", source="system"),
+        ]}
+
+    async def _answer(*, question, context_summary=None, review_points=None, tier=0):
+        tiers.append(tier)
+        return {"answer": "ok", "confidence": 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+
+    result = await co.process(question="q")
+    assert tiers == [1]
+    assert result["meta"]["escalation_reason"] == "high_severity_points=2"
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp.models.review_result import ReviewResult
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.quorum import QuorumPolicy
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+
+class DelayedReviewer:
+    def __init__(self, source, delay, severity):
+        self.source = source
+        self.delay = delay
+        self.severity = severity
+        self.finished = False
+
+    async def review(self, *, question, answer, context_summary, mode):
+        await asyncio.sleep(self.delay)
+        self.finished = True
+        return ReviewResult(mode=mode, items=[{"text": f"{self.source} point", "severity": self.severity}])
+
+
+class FailingReviewer:
+    source = "risk"
+    finished = True
+
+    async def review(self, *, question, answer, context_summary, mode):
+        raise RuntimeError("provider down")
+
+
+def _engine(*reviewers):
+    engine = ValidationEngine(mode="split", reuse=False)
+    engine.reviewers = list(reviewers)
+    return engine
+
+
+@pytest.mark.anyio
+async def test_stream_yields_batches_as_reviewers_finish():
+    engine = _engine(DelayedReviewer("risk", 0.1, "high"), DelayedReviewer("clarity", 0.01, "low"))
+
+    async with engine.stream("q") as batches:
+        order = [(batch.index, batch.source) async for batch in batches]
+
+    assert order == [(1, "clarity"), (0, "risk")]
+    result = await engine.validate("q")
+    assert [p.source for p in result["items"]] == ["risk", "clarity"]  # validate keeps reviewer order
+
+
+def _pipelined(monkeypatch, engine, calls, quorum):
+    monkeypatch.setattr(
+        "peer_review_mcp.orchestrator.central_orchestrator.validate_stream",
+        lambda question, context_summary=None, **kwargs: engine.stream(question, context_summary, **kwargs),
+    )
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append(("answer", [p.source for p in review_points], [r.finished for r in engine.reviewers]))
+        return {"answer": "draft", "confidence": 0.95, "needs_polish": False}
+
+    async def _phase_b(question, answer, context_summary, decision_log, tier=0):
+        calls.append(("polish",))
+        return "polished"
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(pipelining=True, coalescing=False)
+    co.quorum = quorum
+    monkeypatch.setattr(co, "_run_phase_b", _phase_b)
+    return co
+
+
+@pytest.mark.anyio
+async def test_synthesis_starts_at_quorum_and_late_high_severity_triggers_polish(monkeypatch):
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: None)
+    engine = _engine(DelayedReviewer("risk", 0.01, "low"), DelayedReviewer("clarity", 0.1, "high"))
+    calls = []
+    co = _pipelined(monkeypatch, engine, calls, QuorumPolicy(min_reviewers=1, high_severity_points=0))
+
+    result = await co.process(question="q")
+
+    assert calls[0] == ("answer", ["risk"], [True, False])  # clarity still running
+    assert calls[1] == ("polish",)
+    assert result["answer"] == "polished"
+    assert result["meta"]["quorum"] == {"reason": "reviewers", "late_points": 1}
+    assert result["meta"]["review_points_count"] == 2
+
+
+@pytest.mark.anyio
+async def test_cutoff_starts_synthesis_without_review_points(monkeypatch):
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: None)
+    engine = _engine(DelayedReviewer("risk", 0.2, "low"), DelayedReviewer("clarity", 0.2, "low"))
+    calls = []
+    co = _pipelined(monkeypatch, engine, calls, QuorumPolicy(min_reviewers=0, high_severity_points=0, cutoff_s=0.02))
+
+    result = await co.process(question="q")
+
+    assert calls[0] == ("answer", [], [False, False])
+    assert ("polish",) not in calls
+    assert result["meta"]["quorum"] == {"reason": "cutoff", "late_points": 2}
+
+
+@pytest.mark.anyio
+async def test_failed_reviewer_does_not_count_toward_quorum(monkeypatch):
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.get_breaker", lambda provider: None)
+    engine = _engine(FailingReviewer(), DelayedReviewer("clarity", 0.05, "low"))
+    calls = []
+    co = _pipelined(monkeypatch, engine, calls, QuorumPolicy(min_reviewers=1, high_severity_points=0))
+
+    result = await co.process(question="q")
+
+    assert calls[0] == ("answer", ["clarity"], [True, True])  # waited for a reviewer with findings
+    assert result["meta"]["quorum"] == {"reason": "reviewers", "late_points": 0}
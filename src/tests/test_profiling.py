@@ -0,0 +1,91 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from peer_review_mcp import profiling
+from peer_review_mcp.LLM.call import call_llm
+from peer_review_mcp.LLM.circuit_breaker import reset_breakers
+from peer_review_mcp.LLM.limiter import configure_llm_concurrency, llm_concurrency
+from peer_review_mcp.profiling import Profiler, current_profile, summarize
+
+
+async def _provider():
+    await asyncio.sleep(0.03)
+    return '{"items": []}'
+
+
+@pytest.mark.anyio
+async def test_profile_splits_queue_provider_cpu_and_stalls(tmp_path):
+    reset_breakers()
+    configure_llm_concurrency(1)
+    profiler = Profiler(sample_rate=0.0, directory=str(tmp_path), stall_ms=40)
+
+    async def _hold_slot():
+        async with llm_concurrency():
+            await asyncio.sleep(0.05)
+
+    try:
+        holder = asyncio.ensure_future(_hold_slot())
+        await asyncio.sleep(0)
+        async with profiler.request("why is this slow?", forced=True) as profile:
+            assert current_profile() is profile
+            await call_llm(provider="fake", model="m", prompt="p", send=_provider)
+            for _ in range(2000):
+                json.loads('{"items": [{"text": "x", "severity": "high"}]}')
+            time.sleep(0.1)  # blocks the loop
+            await asyncio.sleep(0.01)
+        await holder
+    finally:
+        configure_llm_concurrency(0)
+
+    assert current_profile() is None
+    with open(profile.path) as fh:
+        data = json.load(fh)
+    assert data["llm"]["calls"] == 1
+    assert data["llm"]["queue_s"] > 0.03
+    assert data["llm"]["provider_s"] > 0.02
+    assert data["wall_s"] > data["loop_cpu_s"] > 0.0
+    assert data["cpu_by_category"]["parsing"] > 0
+    assert any(s["duration_ms"] > 80 for s in data["stalls"])
+    assert any("test_profiling.py" in frame for s in data["stalls"] for frame in s["stack"])
+    assert os.path.exists(os.path.join(tmp_path, data["cprofile"]))
+
+
+@pytest.mark.anyio
+async def test_sampling_and_rotation(tmp_path):
+    unsampled = Profiler(sample_rate=0.5, directory=str(tmp_path), rng=lambda: 0.9)
+    async with unsampled.request("q") as profile:
+        assert profile is None
+
+    profiler = Profiler(sample_rate=0.5, directory=str(tmp_path), max_files=2, rng=lambda: 0.1)
+    for i in range(3):
+        async with profiler.request(f"question {i}"):
+            await asyncio.sleep(0.002)
+
+    summaries = sorted(f for f in os.listdir(tmp_path) if f.endswith(".json"))
+    assert len(summaries) == 2 and "question-0" not in "".join(summaries)
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".prof")]) == 2
+
+    report = summarize(profiling.load_profiles(str(tmp_path)))
+    assert report["requests"] == 2
+    assert report["slowest_requests"][0]["label"].startswith("question")
+
+
+def test_summarizer_cli(tmp_path, capsys):
+    profile = {
+        "label": "q", "wall_s": 2.0, "loop_cpu_s": 0.2, "stalls": [{"duration_ms": 120, "stack": ["a.py:1(f)"]}],
+        "llm": {"calls": 4, "queue_s": 0.5, "provider_s": 1.2},
+        "cpu_by_category": {"parsing": 0.05, "other": 0.15},
+        "top_functions": [{"function": "a.py:1(f)", "self_s": 0.1, "cumulative_s": 0.1, "calls": 3}],
+    }
+    (tmp_path / "20260101T000000000000-q.json").write_text(json.dumps(profile))
+
+    assert profiling.main([str(tmp_path)]) == 0
+    report = json.loads(capsys.readouterr().out)
+
+    assert report["wall_share"] == {"llm_queue": 0.25, "llm_provider": 0.6, "loop_cpu": 0.1}
+    assert report["cpu_by_category"]["parsing"]["share"] == 0.25
+    assert report["longest_stalls"] == [{"label": "q", "duration_ms": 120, "at": "a.py:1(f)"}]
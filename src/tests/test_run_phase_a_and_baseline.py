@@ -1,5 +1,6 @@
 import pytest
 from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.decision_trace import DecisionTrace
 from peer_review_mcp.tools import validate_tool as validate_module
 from peer_review_mcp.tools import answer_tool as answer_module
 
@@ -26,7 +27,7 @@ async def test_run_phase_a_validate_tool_exception(monkeypatch):
         _answer_stub,
     )
 
-    decision_log = []
+    decision_log = DecisionTrace()
     # When validate_tool fails, review_points should be empty
     review_points, synthesis = await co._run_phase_a("some question", None, decision_log)
     assert review_points == []
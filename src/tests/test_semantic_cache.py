@@ -0,0 +1,83 @@
+import pytest
+
+from peer_review_mcp.cache.semantic_cache import RandomProjectionLSH, SemanticCache
+from peer_review_mcp.cache.embedding import HashingEmbedder, content_words
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+def test_lsh_finds_near_duplicates_and_forgets_removed():
+    embedder = HashingEmbedder()
+    index = RandomProjectionLSH(embedder.dim)
+    index.add(1, embedder.embed("How do I reverse a list in Python?"))
+    index.add(2, embedder.embed("Completely unrelated sentence about gardening tools"))
+
+    assert 1 in index.candidates(embedder.embed("How can I reverse a list in Python?"))
+    index.remove(1)
+    assert 1 not in index.candidates(embedder.embed("How do I reverse a list in Python?"))
+    assert len(index) == 1
+
+
+def test_content_words_ignore_contraction_fragments():
+    assert content_words("What's the best DB? It's slow and doesn't scale") == {"best", "db", "slow", "not", "scale"}
+
+
+def test_semantic_cache_matches_paraphrase_with_same_context():
+    cache = SemanticCache(threshold=0.8, max_entries=4, ttl_s=60)
+    cache.store("How do I reverse a list in Python?", "ctx", {"answer": "a", "meta": {}})
+
+    hit = cache.lookup("how can I reverse a list in python", "ctx")
+    assert hit is not None and hit.value["answer"] == "a"
+    assert 0.8 <= hit.similarity <= 1.0
+
+    assert cache.lookup("How can I reverse a list in Python?", "other context") is None
+    assert cache.lookup("How do I reverse a string in Python?", "ctx") is None
+
+    for paraphrase in (
+        "What is the way to reverse a list in Python?",
+        "How do I reverse lists in Python?",
+        "What's the simplest way to reverse a list in Python?",
+        "In Python, how can I reverse a list?",
+    ):
+        assert cache.lookup(paraphrase, "ctx") is not None, paraphrase
+    for different in (
+        "How do I reverse a linked list in Python?",
+        "How do I reverse a list in Python 2?",
+        "Why doesn't reversing a list in Python work?",
+    ):
+        assert cache.lookup(different, "ctx") is None, different
+
+    cache.store("How do I convert an int to a str?", "ctx", {"answer": "str(n)", "meta": {}})
+    assert cache.lookup("What's the way to convert int to str?", "ctx").value["answer"] == "str(n)"
+    assert cache.lookup("How do I convert a str to an int?", "ctx") is None
+
+    cache.store("q2", None, {"answer": "b", "meta": {}})
+    cache.store("q3", None, {"answer": "c", "meta": {}})
+    cache.store("q4", None, {"answer": "d", "meta": {}})
+    assert len(cache) == 4
+
+
+@pytest.mark.anyio
+async def test_orchestrator_serves_paraphrase_from_cache(monkeypatch):
+    calls = []
+
+    async def _validate(question, context_summary=None):
+        calls.append("validate")
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append("answer")
+        return {"answer": "reverse it", "confidence": 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(semantic_cache=True)
+
+    first = await co.process(question="How do I reverse a list in Python?")
+    second = await co.process(question="How can I reverse a list in Python?")
+
+    assert calls == ["validate", "answer"]
+    assert first["meta"]["cache"]["hit"] is False
+    assert second["answer"] == "reverse it"
+    assert second["meta"]["cache"]["hit"] is True
+    assert second["meta"]["cache"]["similarity"] >= 0.8
+    assert second["meta"]["cache"]["hit_rate"] > 0
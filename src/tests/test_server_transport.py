@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+from peer_review_mcp import server
+from peer_review_mcp.lifecycle import InflightTracker, ServerShuttingDown
+
+
+@pytest.mark.anyio
+async def test_inflight_tracker_drains_and_rejects_new_requests():
+    tracker = InflightTracker()
+    finished = []
+
+    async def _request():
+        async with tracker.track():
+            await anyio.sleep(0.1)
+            finished.append(True)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_request)
+        await anyio.sleep(0.01)
+        assert tracker.count == 1
+        assert await tracker.drain(timeout_s=5) is True
+
+    assert finished == [True]
+    with pytest.raises(ServerShuttingDown):
+        async with tracker.track():
+            pass
+
+
+@pytest.mark.anyio
+async def test_inflight_tracker_drain_times_out():
+    tracker = InflightTracker()
+    async with tracker.track():
+        assert await tracker.drain(timeout_s=0.05) is False
+
+
+@pytest.mark.anyio
+async def test_app_shutdown_waits_for_inflight_tool_call(monkeypatch):
+    finished = []
+
+    async def _process(*, question, context_summary=None):
+        await anyio.sleep(0.1)
+        finished.append(question)
+        return {"answer": "ok", "meta": {}}
+
+    async def _aclose():
+        finished.append("closed")
+
+    monkeypatch.setattr(server, "MCP_TRANSPORT", "sse")
+    monkeypatch.setattr(server, "_orchestrator", SimpleNamespace(process=_process, aclose=_aclose))
+    monkeypatch.setattr(server, "_inflight", InflightTracker())
+    app = server.create_app()
+
+    async with anyio.create_task_group() as tg:
+        async with app.router.lifespan_context(app):
+            tg.start_soon(server.answer_with_peer_review, "q")
+            await anyio.sleep(0.01)
+        # Lifespan exit returned only after the call completed, then closed the orchestrator.
+        assert finished == ["q", "closed"]
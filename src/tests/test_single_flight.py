@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.LLM.scheduling import CallTag, call_tag, current_tag
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+async def test_orchestrator_coalesces_identical_inflight_questions(monkeypatch):
+    metrics.reset()
+    calls = []
+
+    async def _validate(question, context_summary=None):
+        calls.append("validate")
+        await asyncio.sleep(0.05)
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        return {"answer": "shared", "confidence": 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    co = CentralOrchestrator(coalescing=True)
+
+    results = await asyncio.gather(
+        co.process(question="What is a mutex?", context_summary="ctx"),
+        co.process(question="what is a  mutex", context_summary="ctx"),
+        co.process(question="What is a semaphore?", context_summary="ctx"),
+    )
+
+    assert calls == ["validate", "validate"]
+    assert [r["answer"] for r in results] == ["shared"] * 3
+    assert [r["meta"].get("coalesced", False) for r in results] == [False, True, False]
+    assert results[0]["meta"] is not results[1]["meta"]
+    assert metrics.get("coalesce.shared") == 1
+    assert len(co.single_flight) == 0
+
+
+@pytest.mark.anyio
+async def test_work_continues_while_a_waiter_remains():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def _work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", _work))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("k", _work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ("done", True)
+    assert first.cancelled()
+
+
+@pytest.mark.anyio
+async def test_work_cancelled_when_last_waiter_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def _work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiters = [asyncio.ensure_future(flight.do("k", _work)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert len(flight) == 0
+    assert all(w.cancelled() for w in waiters)
+
+
+@pytest.mark.anyio
+async def test_shared_work_does_not_inherit_the_first_callers_tag():
+    flight = SingleFlight()
+    tags = []
+
+    async def _work():
+        tags.append(current_tag())
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def _caller(priority):
+        with call_tag("nightly", priority):
+            return await flight.do("k", _work)
+
+    results = await asyncio.gather(_caller("batch"), _caller("interactive"))
+
+    assert results == [("done", False), ("done", True)]
+    assert tags == [CallTag()]  # default tenant, interactive priority
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.cache.answer_cache import AnswerCache
+from peer_review_mcp.cache.backend import MemoryCacheBackend
+from peer_review_mcp.LLM.scheduling import current_tag
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.orchestrator.revalidator import Revalidator
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_answer_cache_stale_window_and_popular_refresh():
+    metrics.reset()
+    clock = Clock()
+    cache = AnswerCache(MemoryCacheBackend(), ttl_s=100, stale_s=50, popular_hits=3, refresh_ahead=0.8, clock=clock)
+    cache.store("q", None, {"answer": "a", "meta": {}})
+
+    clock.now += 85
+    first, second, third = (cache.lookup_entry("q") for _ in range(3))
+    assert not first.refresh and not second.refresh  # not popular yet
+    assert third.refresh and not third.stale  # popular and past 80% of the TTL
+
+    clock.now += 30
+    stale = cache.lookup_entry("q")
+    assert stale.stale and stale.refresh and stale.value["answer"] == "a" and stale.age_s == 115
+    clock.now += 40
+    assert cache.lookup("q") is None  # past the stale window
+
+    assert metrics.get("cache.answer.stale_hits") == 1
+    assert cache.stale_rate() == 0.25
+
+    # Without a stale window, expiry is at the TTL, as before.
+    plain = AnswerCache(MemoryCacheBackend(), ttl_s=100, clock=clock)
+    plain.store("q", None, {"answer": "a", "meta": {}})
+    clock.now += 100
+    assert plain.lookup("q") is None and not plain.revalidates
+
+
+@pytest.mark.anyio
+async def test_stale_answer_served_while_refreshed_in_background(monkeypatch):
+    metrics.reset()
+    answers = iter(["old", "new"])
+    calls = []
+    release = asyncio.Event()
+
+    async def _validate(question, context_summary=None):
+        return {"items": []}
+
+    async def _answer(*, question, context_summary=None, review_points=None):
+        calls.append(current_tag())
+        if len(calls) > 1:
+            await release.wait()
+        return {"answer": next(answers), "confidence": 0.95, "needs_polish": False}
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.answer_tool", _answer)
+    clock = Clock()
+    co = CentralOrchestrator(answer_cache=True)
+    co.answer_cache = AnswerCache(MemoryCacheBackend(), ttl_s=60, stale_s=600, clock=clock)
+
+    assert (await co.process(question="What is the answer?"))["answer"] == "old"
+    clock.now += 120
+
+    stale = await co.process(question="What is the answer?")
+    again = await co.process(question="What is the answer?")
+    assert stale["answer"] == again["answer"] == "old"
+    assert stale["meta"]["cache"] == {
+        "hit": True, "layer": "exact", "similarity": 1.0, "stale": True, "age_s": 120.0, "refreshing": True,
+    }
+    assert "refreshing" not in again["meta"]["cache"]  # already being refreshed
+    assert len(co.revalidator) == 1
+
+    release.set()
+    await co.revalidator.join()
+
+    assert len(calls) == 2 and calls[1].priority == "batch"
+    fresh = await co.process(question="What is the answer?")
+    assert fresh["answer"] == "new" and "stale" not in fresh["meta"]["cache"]
+    assert metrics.get("cache.refresh.completed") == 1
+    assert metrics.get("cache.refresh.deduplicated") == 1
+
+
+@pytest.mark.anyio
+async def test_revalidator_bounds_concurrency_and_cancels_on_close():
+    metrics.reset()
+    revalidator = Revalidator(max_concurrency=2, max_pending=3)
+    running = []
+    peak = 0
+
+    async def _refresh():
+        nonlocal peak
+        running.append(1)
+        peak = max(peak, len(running))
+        try:
+            await asyncio.sleep(10)
+        finally:
+            running.pop()
+
+    assert [revalidator.schedule(i, _refresh) for i in range(4)] == [True, True, True, False]
+    await asyncio.sleep(0.01)
+    assert peak == 2 and metrics.get("cache.refresh.dropped") == 1
+
+    await revalidator.aclose()
+    assert len(revalidator) == 0 and running == []
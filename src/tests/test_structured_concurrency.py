@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from peer_review_mcp.LLM import limiter
+from peer_review_mcp.LLM.call import call_llm
+from peer_review_mcp.LLM.circuit_breaker import get_breaker, reset_breakers
+from peer_review_mcp.LLM.limiter import configure_llm_concurrency
+from peer_review_mcp.orchestrator.central_orchestrator import CentralOrchestrator
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+
+class SlowClient:
+    """Reviewer client whose provider calls go through call_llm and take `delay` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.started = 0
+        self.cancelled = 0
+
+    async def _send(self) -> str:
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return '{"items": []}'
+
+    async def generate_async(self, prompt: str) -> str:
+        return await call_llm(provider="slow", model="m", prompt=prompt, send=self._send)
+
+    async def generate_json_async(self, prompt: str, schema) -> str:
+        return await call_llm(provider="slow", model="m", prompt=prompt, send=self._send, schema=schema)
+
+
+def _engine(client) -> ValidationEngine:
+    engine = ValidationEngine(mode="split", reuse=False)
+    for reviewer in engine.reviewers:
+        reviewer.client = client
+    return engine
+
+
+@pytest.mark.anyio
+async def test_reviewers_run_concurrently_in_order():
+    client = SlowClient(delay=0.1)
+    engine = _engine(client)
+
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    result = await engine.validate("q")
+
+    assert client.started == 2
+    assert loop.time() - t0 < 0.19  # both reviewers overlapped
+    assert result["count"] == 0
+
+
+@pytest.mark.anyio
+async def test_cancellation_storm_leaves_no_tasks_or_limiter_slots(monkeypatch):
+    reset_breakers()
+    configure_llm_concurrency(3)
+    client = SlowClient(delay=10)
+    engine = _engine(client)
+
+    async def _validate(question, context_summary=None, **kwargs):
+        return await engine.validate(question, context_summary, **kwargs)
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    co = CentralOrchestrator()
+    baseline = asyncio.all_tasks()
+    try:
+        requests = [asyncio.ensure_future(co.process(question=f"question {i % 10}")) for i in range(40)]
+        await asyncio.sleep(0.05)
+        for request in requests:
+            request.cancel()
+        await asyncio.gather(*requests, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert all(r.cancelled() for r in requests)
+        assert asyncio.all_tasks() == baseline
+        assert len(co.single_flight) == 0
+        assert limiter._global_limiter.inflight == limiter._global_limiter.waiting == 0
+        assert client.cancelled == client.started == 3
+        assert get_breaker("slow").snapshot()["calls"] == 0  # cancellations are not provider failures
+    finally:
+        configure_llm_concurrency(0)
+
+
+@pytest.mark.anyio
+async def test_deadline_cancels_outstanding_provider_calls(monkeypatch):
+    client = SlowClient(delay=10)
+    engine = _engine(client)
+
+    async def _validate(question, context_summary=None, **kwargs):
+        return await engine.validate(question, context_summary, **kwargs)
+
+    monkeypatch.setattr("peer_review_mcp.orchestrator.central_orchestrator.validate_tool", _validate)
+    co = CentralOrchestrator()
+
+    result = await co.process(question="q", deadline_s=0.05)
+
+    assert result["answer"] is None
+    assert result["meta"]["error"] == "deadline_exceeded"
+    assert client.cancelled == client.started == 2
+    assert len(co.single_flight) == 0
@@ -0,0 +1,139 @@
+import json
+import pytest
+
+from peer_review_mcp import metrics
+from peer_review_mcp.llm_parsing import parse_fallback_rate
+from peer_review_mcp.models.structured_output import ReviewPointList, SynthesisSchema, json_schema
+from peer_review_mcp.reviewers.RiskReviewer import RiskReviewer
+from peer_review_mcp.reviewers.ClarityReviewer import ClarityReviewer
+from peer_review_mcp.tools.synthesis_engine import SynthesisEngine
+from peer_review_mcp.LLM.chatgpt_client import ChatGPTClient
+from peer_review_mcp.LLM.claude_client import ClaudeClient
+from peer_review_mcp.LLM.gemini_client import GeminiClient
+
+
+def test_json_schema_inlines_refs():
+    schema = json_schema(ReviewPointList)
+    assert "$defs" not in schema
+    assert "$ref" not in json.dumps(schema)
+    item = schema["properties"]["items"]["items"]
+    assert item["additionalProperties"] is False
+    assert set(item["required"]) == {"text", "risk_type", "severity", "confidence"}
+    assert item["properties"]["severity"]["enum"] == ["low", "medium", "high"]
+
+
+@pytest.mark.anyio
+async def test_reviewers_use_structured_output_when_available():
+    class StructuredClient:
+        def __init__(self):
+            self.schemas = []
+
+        async def generate_json_async(self, prompt, schema):
+            self.schemas.append(schema)
+            return json.dumps({"items": [
+                {"text": "ambiguous", "risk_type": "assumptions", "severity": "low", "confidence": 0.6}
+            ]})
+
+        async def generate_async(self, prompt):
+            raise AssertionError("plain generation should not be used")
+
+    metrics.reset()
+    client = StructuredClient()
+    risk = await RiskReviewer(client).review(question="q", mode="validate")
+    clarity = await ClarityReviewer(client).review(question="q", mode="validate")
+
+    assert client.schemas == [ReviewPointList, ReviewPointList]
+    assert risk.items[0]["text"] == "ambiguous"
+    assert clarity.items[0]["risk_type"] == "assumptions"
+    assert parse_fallback_rate("risk_reviewer") == 0.0
+    assert parse_fallback_rate("clarity_reviewer") == 0.0
+
+
+@pytest.mark.anyio
+async def test_parse_fallbacks_are_counted():
+    class PlainClient:
+        async def generate_async(self, prompt):
+            return "not json at all"
+
+    metrics.reset()
+    await RiskReviewer(PlainClient()).review(question="q", mode="validate")
+    engine = SynthesisEngine()
+    engine.client = PlainClient()
+    out = await engine.answer(question="q")
+
+    assert out["needs_polish"] is True
+    assert parse_fallback_rate("risk_reviewer") == 1.0
+    assert parse_fallback_rate("synthesis") == 1.0
+
+
+@pytest.mark.anyio
+async def test_clients_send_provider_native_schemas():
+    captured = {}
+
+    class ChatStub:
+        class chat:
+            class completions:
+                @staticmethod
+                async def create(**kwargs):
+                    captured["openai"] = kwargs
+
+                    class Message:
+                        content = '{"answer": "a", "confidence": 0.9, "needs_polish": false}'
+
+                    class Choice:
+                        message = Message()
+
+                    class Response:
+                        choices = [Choice()]
+
+                    return Response()
+
+    class ClaudeStub:
+        class messages:
+            @staticmethod
+            async def create(**kwargs):
+                captured["claude"] = kwargs
+
+                class ToolUse:
+                    type = "tool_use"
+                    input = {"answer": "a", "confidence": 0.9, "needs_polish": False}
+
+                class Message:
+                    content = [ToolUse()]
+
+                return Message()
+
+    class GeminiStub:
+        class aio:
+            class models:
+                @staticmethod
+                async def generate_content(**kwargs):
+                    captured["gemini"] = kwargs
+
+                    class Response:
+                        text = '{"answer": "a", "confidence": 0.9, "needs_polish": false}'
+
+                    return Response()
+
+    chat_client = object.__new__(ChatGPTClient)
+    chat_client.model = "m"
+    chat_client.timeout = 1
+    chat_client._async_client = ChatStub()
+
+    claude_client = object.__new__(ClaudeClient)
+    claude_client.model = "m"
+    claude_client.timeout = 1
+    claude_client._async_client = ClaudeStub()
+
+    gemini_client = object.__new__(GeminiClient)
+    gemini_client.model = "m"
+    gemini_client.timeout = 1
+    gemini_client._client = GeminiStub()
+
+    for client in (chat_client, claude_client, gemini_client):
+        text = await client.generate_json_async("p", SynthesisSchema)
+        assert json.loads(text)["answer"] == "a"
+
+    assert captured["openai"]["response_format"]["json_schema"]["strict"] is True
+    assert captured["claude"]["tool_choice"] == {"type": "tool", "name": "SynthesisSchema"}
+    assert captured["gemini"]["config"].response_schema is SynthesisSchema
@@ -0,0 +1,52 @@
+import json
+import pytest
+
+from peer_review_mcp.models.review_result import ReviewResult
+from peer_review_mcp.reviewers.FusedReviewer import FusedReviewer
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+
+
+def test_validation_engine_mode_selects_reviewers():
+    assert [type(r).__name__ for r in ValidationEngine(mode="split").reviewers] == [
+        "RiskReviewer",
+        "ClarityReviewer",
+    ]
+    assert [type(r).__name__ for r in ValidationEngine(mode="fused").reviewers] == ["FusedReviewer"]
+    assert ValidationEngine(mode="bogus").mode == "split"
+
+
+@pytest.mark.anyio
+async def test_fused_mode_single_call_tags_sources():
+    class StubClient:
+        calls = 0
+
+        async def generate_async(self, prompt):
+            StubClient.calls += 1
+            assert "Review 2 - clarity" in prompt
+            return json.dumps([
+                {"text": "r", "risk_type": "assumptions", "severity": "high", "confidence": 0.9, "source": "risk"},
+                {"text": "c", "risk_type": "edge_cases", "severity": "low", "confidence": 0.6, "source": "clarity"},
+                {"text": "untagged", "risk_type": "other", "severity": "low", "confidence": 0.5},
+            ])
+
+    engine = ValidationEngine(mode="fused")
+    engine.reviewers = [FusedReviewer(StubClient())]
+    result = await engine.validate("q", "ctx")
+
+    assert StubClient.calls == 1
+    assert [p.source for p in result["items"]] == ["risk", "clarity", "risk"]
+
+
+@pytest.mark.anyio
+async def test_split_mode_tags_points_with_reviewer_source():
+    class Reviewer:
+        def __init__(self, source):
+            self.source = source
+
+        async def review(self, *, question, answer, context_summary, mode):
+            return ReviewResult(mode=mode, items=[{"text": self.source}])
+
+    engine = ValidationEngine(mode="split")
+    engine.reviewers = [Reviewer("risk"), Reviewer("clarity")]
+    result = await engine.validate("q")
+    assert [(p.text, p.source) for p in result["items"]] == [("risk", "risk"), ("clarity", "clarity")]
@@ -0,0 +1,110 @@
+import json
+import pytest
+
+from peer_review_mcp.models.review_result import ReviewResult
+from peer_review_mcp.tools.validation_engine import ValidationEngine
+from peer_review_mcp.tools.validation_store import ValidationSessionStore
+
+
+class CountingReviewer:
+    def __init__(self, source, calls):
+        self.source = source
+        self.calls = calls
+
+    async def review(self, *, question, answer, context_summary, mode):
+        self.calls.append(self.source)
+        return ReviewResult(mode=mode, items=[{"text": f"{self.source} point", "severity": "medium"}])
+
+
+class FailingReviewer:
+    async def review(self, *, question, answer, context_summary, mode):
+        raise RuntimeError("provider down")
+
+
+class IncrementalClient:
+    def __init__(self, source="clarity"):
+        self.source = source
+        self.prompts = []
+
+    async def generate_async(self, prompt):
+        self.prompts.append(prompt)
+        return json.dumps({
+            "items": [{"text": "new point", "risk_type": "edge_cases", "severity": "low",
+                       "confidence": 0.6, "source": self.source}],
+            "obsolete": [2],
+        })
+
+
+@pytest.mark.anyio
+async def test_follow_up_reuses_points_with_one_incremental_call():
+    calls = []
+    engine = ValidationEngine(mode="split", reuse=True)
+    engine.reviewers = [CountingReviewer("risk", calls), CountingReviewer("clarity", calls)]
+    engine.client = IncrementalClient()
+    ctx = "User is building an asyncio web crawler"
+
+    first = await engine.validate("How do I limit concurrent requests in my crawler?", ctx)
+    assert calls == ["risk", "clarity"] and first["count"] == 2
+
+    follow_up = await engine.validate("How do I limit concurrent requests per host in my crawler?", ctx)
+    assert calls == ["risk", "clarity"]
+    assert len(engine.client.prompts) == 1
+    assert "1. risk point" in engine.client.prompts[0]
+    assert [p.text for p in follow_up["items"]] == ["risk point", "new point"]
+    assert follow_up["reused"] == 1
+
+    await engine.validate("How do I limit concurrent requests in my crawler?", "different context")
+    assert calls == ["risk", "clarity", "risk", "clarity"]
+
+
+@pytest.mark.anyio
+async def test_degraded_mode_skips_session_reuse():
+    calls = []
+    engine = ValidationEngine(mode="split", reuse=True)
+    engine.reviewers = [CountingReviewer("risk", calls), CountingReviewer("clarity", calls)]
+    engine.client = IncrementalClient()
+    ctx = "User is building an asyncio web crawler"
+
+    await engine.validate("How do I limit concurrent requests in my crawler?", ctx)
+    degraded = await engine.validate("How do I limit concurrent requests per host in my crawler?", ctx, max_reviewers=1)
+
+    assert engine.client.prompts == []  # no incremental call under load
+    assert calls == ["risk", "clarity", "risk"] and "reused" not in degraded
+
+
+@pytest.mark.anyio
+async def test_untagged_incremental_points_get_a_neutral_source():
+    engine = ValidationEngine(mode="split", reuse=True)
+    engine.reviewers = [CountingReviewer("risk", []), CountingReviewer("clarity", [])]
+    engine.client = IncrementalClient(source=None)
+    ctx = "User is building an asyncio web crawler"
+
+    await engine.validate("How do I limit concurrent requests in my crawler?", ctx)
+    follow_up = await engine.validate("How do I limit concurrent requests per host in my crawler?", ctx)
+
+    assert follow_up["items"][-1].source == "incremental"
+
+
+@pytest.mark.anyio
+async def test_reviewer_failure_is_not_stored_for_reuse():
+    calls = []
+    engine = ValidationEngine(mode="split", reuse=True)
+    engine.reviewers = [CountingReviewer("risk", calls), FailingReviewer()]
+    engine.client = IncrementalClient()
+    ctx = "User is building an asyncio web crawler"
+
+    await engine.validate("How do I limit concurrent requests in my crawler?", ctx)
+    await engine.validate("How do I limit concurrent requests per host in my crawler?", ctx)
+
+    assert engine.client.prompts == []  # the partial first result was never stored
+    assert calls == ["risk", "risk"]
+
+
+def test_session_store_requires_similar_question():
+    store = ValidationSessionStore(threshold=0.6, ttl_s=60, max_sessions=1)
+    store.add("How do I parse JSON in Python?", "ctx", [])
+    assert store.find("How do I parse JSON files in Python?", "ctx") is not None
+    assert store.find("What is the best pizza topping?", "ctx") is None
+
+    store.add("q", "other ctx", [])
+    assert store.find("How do I parse JSON in Python?", "ctx") is None